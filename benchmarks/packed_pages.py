@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark of bit-packed binary pages (PackedBinaryPage).
+
+Measures, on synthetic thresholded pages, the memory of a uint8 page next
+to its packed form, and the time spent packing, unpacking the whole page
+and unpacking it band by band.
+
+Usage:
+    python benchmarks/packed_pages.py [--width 2480] [--height 3508] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ocr_pdf_reader.packed_page import PackedBinaryPage
+
+
+def make_page(height: int, width: int, seed: int = 0) -> np.ndarray:
+    """Builds a white page with dark text-like strokes, as after Otsu thresholding."""
+    rng = np.random.default_rng(seed)
+    page = np.full((height, width), 255, np.uint8)
+    line_height = max(4, height // 60)
+    for top in range(line_height, height - line_height, line_height * 2):
+        strokes = rng.random((line_height, width)) < 0.25
+        page[top:top + line_height][strokes] = 0
+    return page
+
+
+def best_time(function, repeat: int) -> float:
+    """Returns the fastest of `repeat` runs of a function, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark bit-packed binary pages')
+    parser.add_argument('--width', type=int, default=2480,
+                        help='Page width in pixels (default: A4 at 300 dpi)')
+    parser.add_argument('--height', type=int, default=3508,
+                        help='Page height in pixels (default: A4 at 300 dpi)')
+    parser.add_argument('--band', type=int, default=256,
+                        help='Rows per band (default: 256)')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Runs per measurement (default: 20)')
+    args = parser.parse_args()
+
+    page = make_page(args.height, args.width)
+    packed = PackedBinaryPage.pack(page)
+
+    def unpack_by_bands():
+        for start in range(0, args.height, args.band):
+            packed.rows(start, start + args.band)
+
+    pack_ms = best_time(lambda: PackedBinaryPage.pack(page), args.repeat)
+    unpack_ms = best_time(packed.unpack, args.repeat)
+    bands_ms = best_time(unpack_by_bands, args.repeat)
+    copy_ms = best_time(page.copy, args.repeat)
+
+    print(f"Page: {args.width}x{args.height} pixels")
+    print(f"{'':<24}{'bytes':>14}{'ms':>10}")
+    print(f"{'uint8 array':<24}{page.nbytes:>14,}{copy_ms:>10.2f}  (copy)")
+    print(f"{'packed':<24}{packed.nbytes:>14,}{pack_ms:>10.2f}  (pack)")
+    print(f"{'unpack whole page':<24}{'':>14}{unpack_ms:>10.2f}")
+    print(f"{f'unpack {args.band}-row bands':<24}{args.band * packed.shape[1]:>14,}"
+          f"{bands_ms:>10.2f}  (peak band bytes, all bands)")
+    print(f"Memory saved: {page.nbytes / packed.nbytes:.1f}x "
+          f"({(page.nbytes - packed.nbytes) / 1024 ** 2:.1f} MB per waiting page)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
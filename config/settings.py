@@ -12,6 +12,15 @@ OCR_CONFIG = {
     'default_language': 'eng',
     'custom_config': r'--oem 3 --psm 6',
     'supported_languages': ['eng', 'por', 'spa', 'fra', 'deu'],
+    'page_timeout': None,          # Seconds per image, None for no limit
+    'retry_on_timeout': True,      # Retry once with a simplified image
+    'retry_downscale_factor': 0.5,
+    'auto_languages': 'eng+por+spa',  # Candidates when the language is 'auto'
+    'detection_sample_pages': 2,   # Pages analyzed with OSD per document
+    'preprocessing': 'default',    # Chain name, or 'auto' to tune per document
+    'tuning_tolerance': 5.0,       # Confidence points 'auto' may trade for speed
+    'ocr_threads': None,           # OMP_THREAD_LIMIT per Tesseract process; None keeps
+                                   # Tesseract's default (1 with workers='auto')
 }
 
 # Image processing configurations
@@ -19,6 +28,22 @@ IMAGE_CONFIG = {
     'resolution_multiplier': 2.0,  # For page rendering
     'kernel_size': (1, 1),         # For morphology
     'threshold_method': 'OTSU',
+    'preprocessing_chain': 'default',  # See PREPROCESSING_CHAINS in image_processor
+    'page_cache': None,            # Directory of cached preprocessed pages
+    'page_cache_mb': 1024,         # Size before least recently used pages are evicted
+}
+
+# Concurrency configurations
+CONCURRENCY_CONFIG = {
+    'workers': 1,                  # 'auto' chooses from the CPUs and cgroup quota
+    'calibrate': False,            # Measure workers x OCR threads on sample pages
+    'concurrency_file': '~/.cache/ocr-pdf-reader/concurrency.json',  # Saved calibrations
+    'memory_budget_mb': None,      # None uses half of the physical memory
+    'pipeline': False,             # Overlap decode, preprocessing, OCR and text stages
+    'stage_threads': {},           # e.g. {'ocr': 4}; default: workers for preprocess/ocr
+    'queue_size': 4,               # Capacity of each queue between pipeline stages
+    'priority': None,              # 'interactive' or 'bulk' to run through the scheduler
+    'time_budget': None,           # Seconds per document before a partial result is returned
 }
 
 # Text processing configurations
@@ -26,6 +51,10 @@ TEXT_CONFIG = {
     'min_line_length': 3,
     'remove_duplicates': True,
     'validate_lines': True,
+    'dedup_index': None,           # Path of a corpus-wide dedup index (.npz)
+    'dedup_mode': 'first',         # 'first' or 'count'
+    'merge_similar': None,         # Similarity (0-1) for merging OCR variants, e.g. 0.7
+    'bloom_capacity': None,        # Distinct lines expected; None disables the Bloom filter
 }
 
 # Regex patterns for different formats
@@ -9,14 +9,24 @@ __version__ = "1.0.0"
 __author__ = "Arthur"
 __description__ = "Text extraction from PDFs with images using OCR"
 
-from .core import extract_text_from_pdf
-from .image_processor import extract_images_from_pdf, preprocess_image, extract_text_from_image
+from .core import extract_text_from_pdf, extract_results_from_pdf
+from .image_processor import (
+    extract_images_from_pdf,
+    preprocess_image,
+    extract_text_from_image,
+)
 from .text_processor import process_text_lines
+from .results import ExtractionResult, LineRecord
+from .report import RunReport
 
 __all__ = [
     "extract_text_from_pdf",
-    "extract_images_from_pdf", 
+    "extract_results_from_pdf",
+    "extract_images_from_pdf",
     "preprocess_image",
     "extract_text_from_image",
-    "process_text_lines"
-] 
\ No newline at end of file
+    "process_text_lines",
+    "ExtractionResult",
+    "LineRecord",
+    "RunReport",
+]
@@ -14,4 +14,4 @@ if __name__ == "__main__":
         interactive_mode()
     else:
         # CLI mode with arguments
-        sys.exit(main()) 
\ No newline at end of file
+        sys.exit(main())
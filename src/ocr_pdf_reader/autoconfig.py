@@ -0,0 +1,471 @@
+"""
+CPU-aware choice of OCR concurrency.
+
+This module contains functions for:
+- Counting the CPUs a run may use, from the affinity mask and the CPU quota of
+  the process's cgroup (cgroup v2 cpu.max, or v1 CFS quota and period)
+- Choosing a worker count and a per-worker Tesseract thread limit
+  (OMP_THREAD_LIMIT) that don't oversubscribe those CPUs
+- Calibrating the choice on sample pages and saving it for later runs
+"""
+
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .image_processor import (
+    PageImage,
+    list_image_sources,
+    load_image_source,
+    ocr_image,
+    open_pdf,
+    sample_image_sources,
+    DEFAULT_OCR_CONFIG,
+    RENDER_RESOLUTION_MULTIPLIER,
+)
+
+
+# Value of --workers that chooses the concurrency automatically
+AUTO_WORKERS = "auto"
+
+# Environment variable read by Tesseract's OpenMP runtime
+OCR_THREADS_VARIABLE = "OMP_THREAD_LIMIT"
+
+# Where calibrated configurations are saved, one per machine and CPU limit
+DEFAULT_CONCURRENCY_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "ocr-pdf-reader", "concurrency.json"
+)
+
+# Mount point of the cgroup filesystem
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+# Lists the cgroup of the current process, per hierarchy
+PROC_SELF_CGROUP = "/proc/self/cgroup"
+
+# Tesseract threads per worker tried by the calibration
+CALIBRATION_THREADS = (1, 2, 4)
+
+# Images each worker reads per calibration trial
+CALIBRATION_ROUNDS = 2
+
+
+@dataclass
+class OCRConcurrency:
+    """
+    Worker count and Tesseract threads per worker.
+
+    Attributes:
+        workers (int): Images processed at the same time
+        ocr_threads (int): OMP_THREAD_LIMIT of each Tesseract process
+        cpus (int): CPUs available when the configuration was chosen
+        source (str): 'heuristic', 'calibrated' or 'saved'
+        trials (Dict[str, float]): Images per second of each calibrated
+            "workers x threads" configuration
+    """
+
+    workers: int
+    ocr_threads: int
+    cpus: int
+    source: str = "heuristic"
+    trials: Dict[str, float] = field(default_factory=dict)
+
+
+def _own_cgroups(proc_cgroup: str = PROC_SELF_CGROUP) -> Dict[str, str]:
+    """
+    Reads the cgroup of the current process in each hierarchy.
+
+    Args:
+        proc_cgroup (str): Path of /proc/self/cgroup
+
+    Returns:
+        Dict[str, str]: Cgroup path (e.g. '/system.slice/ocr.service') by
+            controller list; '' is the cgroup v2 hierarchy. Empty if unknown
+    """
+    cgroups = {}
+    try:
+        with open(proc_cgroup, encoding="ascii") as f:
+            for line in f:
+                # "<hierarchy id>:<controllers>:<path>"
+                parts = line.rstrip("\n").split(":", 2)
+                if len(parts) == 3:
+                    cgroups[parts[1]] = parts[2]
+    except OSError:
+        pass
+    return cgroups
+
+
+def cgroup_cpu_limit(
+    cgroup_root: str = CGROUP_ROOT, proc_cgroup: str = PROC_SELF_CGROUP
+) -> Optional[float]:
+    """
+    Reads the CPU quota of the current process's cgroup.
+
+    The process's own cgroup is resolved from /proc/self/cgroup, since
+    systemd and Kubernetes set quotas on nested cgroups. Quotas of its
+    ancestors apply as well, so the smallest one up to the root is used;
+    cgroups not visible under the mount point, e.g. outside a container's
+    namespace, are skipped.
+
+    Args:
+        cgroup_root (str): Mount point of the cgroup filesystem
+        proc_cgroup (str): Path of /proc/self/cgroup
+
+    Returns:
+        Optional[float]: Quota in CPUs (e.g. 1.5), None if there is no quota
+    """
+    cgroups = _own_cgroups(proc_cgroup)
+
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    if os.path.exists(
+        os.path.join(cgroup_root, "cgroup.controllers")
+    ) or os.path.exists(os.path.join(cgroup_root, "cpu.max")):
+        return _smallest_quota(
+            _cgroup_directories(cgroup_root, cgroups.get("", "/")), _read_cpu_max
+        )
+
+    # cgroup v1: quota is -1 when unlimited
+    for controller in ("cpu", "cpu,cpuacct"):
+        mount = os.path.join(cgroup_root, controller)
+        if not os.path.isdir(mount):
+            continue
+        path = next(
+            (
+                path
+                for controllers, path in cgroups.items()
+                if "cpu" in controllers.split(",")
+            ),
+            "/",
+        )
+        return _smallest_quota(_cgroup_directories(mount, path), _read_cfs_quota)
+
+    return None
+
+
+def _cgroup_directories(mount: str, path: str) -> List[str]:
+    """Lists the directories of a cgroup and its ancestors up to the mount point."""
+    directories = []
+    parts = [part for part in path.split("/") if part]
+    for depth in range(len(parts), -1, -1):
+        directory = os.path.join(mount, *parts[:depth])
+        if os.path.isdir(directory):
+            directories.append(directory)
+    return directories
+
+
+def _smallest_quota(
+    directories: Sequence[str], read: Callable[[str], Optional[float]]
+) -> Optional[float]:
+    """Returns the smallest quota read from the directories, None if none has one."""
+    quotas = [quota for quota in map(read, directories) if quota is not None]
+    return min(quotas) if quotas else None
+
+
+def _read_cpu_max(directory: str) -> Optional[float]:
+    """Reads a cgroup v2 cpu.max file, None if it is missing or has no quota."""
+    try:
+        with open(os.path.join(directory, "cpu.max"), encoding="ascii") as f:
+            max_quota, max_period = f.read().split()[:2]
+        if max_quota == "max":
+            return None
+        quota, period = int(max_quota), int(max_period)
+    except (OSError, ValueError):
+        return None
+    return quota / period if quota > 0 and period > 0 else None
+
+
+def _read_cfs_quota(directory: str) -> Optional[float]:
+    """Reads the cgroup v1 CFS quota and period, None if missing or unlimited."""
+    try:
+        with open(os.path.join(directory, "cpu.cfs_quota_us"), encoding="ascii") as f:
+            quota = int(f.read())
+        with open(os.path.join(directory, "cpu.cfs_period_us"), encoding="ascii") as f:
+            period = int(f.read())
+    except (OSError, ValueError):
+        return None
+    return quota / period if quota > 0 and period > 0 else None
+
+
+def available_cpus(cgroup_root: str = CGROUP_ROOT) -> int:
+    """
+    Counts the CPUs this process may use.
+
+    Args:
+        cgroup_root (str): Mount point of the cgroup filesystem
+
+    Returns:
+        int: CPUs in the affinity mask, capped by the cgroup quota rounded up;
+            at least 1
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = cgroup_cpu_limit(cgroup_root)
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def choose_concurrency(cpus: int) -> OCRConcurrency:
+    """
+    Chooses a configuration without measuring.
+
+    One Tesseract thread per worker and one worker per CPU: pages are
+    independent, so page-level parallelism scales better than Tesseract's
+    OpenMP loops, which also oversubscribe the CPUs when several processes
+    each start a thread per core.
+
+    Args:
+        cpus (int): Available CPUs
+
+    Returns:
+        OCRConcurrency: Heuristic configuration
+    """
+    return OCRConcurrency(workers=max(1, cpus), ocr_threads=1, cpus=cpus)
+
+
+def candidate_configurations(
+    cpus: int, threads: Sequence[int] = CALIBRATION_THREADS
+) -> List[Tuple[int, int]]:
+    """
+    Lists the (workers, threads per worker) pairs that don't oversubscribe the CPUs.
+
+    Args:
+        cpus (int): Available CPUs
+        threads (Sequence[int]): Thread limits tried (default: 1, 2, 4)
+
+    Returns:
+        List[Tuple[int, int]]: Candidate pairs
+    """
+    return [
+        (max(1, cpus // limit), limit) for limit in threads if limit <= max(1, cpus)
+    ]
+
+
+@contextmanager
+def ocr_thread_limit(threads: Optional[int]) -> Iterator[None]:
+    """
+    Sets OMP_THREAD_LIMIT for the Tesseract processes started inside the block.
+
+    Args:
+        threads (Optional[int]): Thread limit, None to leave the environment unchanged
+    """
+    previous = os.environ.get(OCR_THREADS_VARIABLE)
+    if threads is not None:
+        os.environ[OCR_THREADS_VARIABLE] = str(threads)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(OCR_THREADS_VARIABLE, None)
+        else:
+            os.environ[OCR_THREADS_VARIABLE] = previous
+
+
+def apply_ocr_thread_limit(threads: int) -> None:
+    """
+    Sets OMP_THREAD_LIMIT for the rest of the run.
+
+    Tesseract runs as a child process, so the limit applies to every OCR
+    call started afterwards, including those of worker processes.
+
+    Args:
+        threads (int): Thread limit per Tesseract process
+
+    Raises:
+        ValueError: If threads is less than 1
+    """
+    if threads < 1:
+        raise ValueError(f"OCR threads must be at least 1: {threads}")
+    os.environ[OCR_THREADS_VARIABLE] = str(threads)
+
+
+def machine_key(cpus: int, cgroup_root: str = CGROUP_ROOT) -> str:
+    """
+    Identifies the machine and CPU limit a saved configuration applies to.
+
+    Args:
+        cpus (int): Available CPUs
+        cgroup_root (str): Mount point of the cgroup filesystem
+
+    Returns:
+        str: Key of the configuration file
+    """
+    return f"{platform.node()}:{cpus}:{cgroup_cpu_limit(cgroup_root)}"
+
+
+def load_concurrency(
+    path: str = DEFAULT_CONCURRENCY_FILE, key: Optional[str] = None
+) -> Optional[OCRConcurrency]:
+    """
+    Loads the configuration saved for this machine.
+
+    Args:
+        path (str): Configuration file
+        key (Optional[str]): Machine key (default: machine_key() of the current CPUs)
+
+    Returns:
+        Optional[OCRConcurrency]: Saved configuration, None if there is none
+    """
+    key = key or machine_key(available_cpus())
+    try:
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f).get(key)
+    except (OSError, ValueError):
+        return None
+    if not saved:
+        return None
+
+    concurrency = OCRConcurrency(**saved)
+    concurrency.source = "saved"
+    return concurrency
+
+
+def save_concurrency(
+    concurrency: OCRConcurrency,
+    path: str = DEFAULT_CONCURRENCY_FILE,
+    key: Optional[str] = None,
+) -> None:
+    """
+    Saves a configuration for this machine, keeping those of other machines.
+
+    Args:
+        concurrency (OCRConcurrency): Configuration to save
+        path (str): Configuration file
+        key (Optional[str]): Machine key (default: machine_key() of the current CPUs)
+    """
+    key = key or machine_key(available_cpus())
+    try:
+        with open(path, encoding="utf-8") as f:
+            configurations = json.load(f)
+    except (OSError, ValueError):
+        configurations = {}
+    configurations[key] = asdict(concurrency)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+        json.dump(configurations, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def calibrate(
+    pdf_path: str,
+    lang: str = "eng",
+    cpus: Optional[int] = None,
+    candidates: Optional[Sequence[Tuple[int, int]]] = None,
+    sample_pages: int = 2,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    fast_decode: bool = True,
+    ocr_config: str = DEFAULT_OCR_CONFIG,
+    preprocessing: Union[str, Sequence[str]] = "default",
+) -> OCRConcurrency:
+    """
+    Measures OCR throughput of candidate configurations on sample pages.
+
+    Each candidate reads the sample images, repeated so every worker gets
+    CALIBRATION_ROUNDS of them, with its worker count and thread limit;
+    the one with the most images per second wins.
+
+    Args:
+        pdf_path (str): PDF whose pages are sampled
+        lang (str): Language for OCR
+        cpus (Optional[int]): Available CPUs (default: available_cpus())
+        candidates (Optional[Sequence[Tuple[int, int]]]): (workers, threads) pairs
+            (default: candidate_configurations(cpus))
+        sample_pages (int): Number of pages sampled (default: 2)
+        render_scale (float): Scale used to render pages without embedded images
+        fast_decode (bool): Whether to use the fast decode path
+        ocr_config (str): Tesseract flags
+        preprocessing (Union[str, Sequence[str]]): Preprocessing chain name or steps
+
+    Returns:
+        OCRConcurrency: Fastest configuration, with the throughput of each trial;
+            the heuristic configuration if the PDF has no images
+
+    Raises:
+        FileNotFoundError: If the PDF file is not found
+    """
+    cpus = cpus or available_cpus()
+    candidates = candidates or candidate_configurations(cpus)
+
+    with open_pdf(pdf_path) as pdf_document:
+        sources = list_image_sources(pdf_document, render_scale)
+        images = [
+            load_image_source(pdf_document, source, render_scale, fast_decode)
+            for source in sample_image_sources(sources, sample_pages)
+        ]
+    images = [image for image in images if image is not None]
+    if not images:
+        return choose_concurrency(cpus)
+
+    def read(image: PageImage) -> None:
+        ocr_image(image, lang, config=ocr_config, preprocessing=preprocessing)
+
+    result = OCRConcurrency(workers=1, ocr_threads=1, cpus=cpus, source="calibrated")
+    best_rate = 0.0
+
+    for workers, threads in candidates:
+        tasks = [images[i % len(images)] for i in range(workers * CALIBRATION_ROUNDS)]
+        with (
+            ocr_thread_limit(threads),
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            start = time.perf_counter()
+            list(executor.map(read, tasks))
+            seconds = time.perf_counter() - start
+
+        rate = len(tasks) / seconds if seconds > 0 else math.inf
+        result.trials[f"{workers}x{threads}"] = round(rate, 3)
+        print(
+            f"Calibration: {workers} worker(s) x {threads} OCR thread(s): "
+            f"{rate:.2f} images/s"
+        )
+        if rate > best_rate:
+            best_rate = rate
+            result.workers, result.ocr_threads = workers, threads
+
+    return result
+
+
+def auto_configure(
+    calibration_pdf: Optional[str] = None,
+    path: str = DEFAULT_CONCURRENCY_FILE,
+    cgroup_root: str = CGROUP_ROOT,
+    **calibration_options: Any,
+) -> OCRConcurrency:
+    """
+    Chooses the OCR concurrency of a run.
+
+    With a calibration PDF, candidates are measured and the winner is saved;
+    otherwise the configuration saved for this machine is used, or the
+    heuristic one if none was saved.
+
+    Args:
+        calibration_pdf (Optional[str]): PDF to calibrate on (default: no calibration)
+        path (str): File where calibrated configurations are saved
+        cgroup_root (str): Mount point of the cgroup filesystem
+        **calibration_options: Options passed to calibrate() (lang, preprocessing, ...)
+
+    Returns:
+        OCRConcurrency: Configuration to use
+    """
+    cpus = available_cpus(cgroup_root)
+    key = machine_key(cpus, cgroup_root)
+
+    if calibration_pdf:
+        concurrency = calibrate(calibration_pdf, cpus=cpus, **calibration_options)
+        if concurrency.source == "calibrated":
+            save_concurrency(concurrency, path, key)
+        return concurrency
+
+    return load_concurrency(path, key) or choose_concurrency(cpus)
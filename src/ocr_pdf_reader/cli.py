@@ -4,12 +4,43 @@ Command line interface for the OCR PDF Reader.
 
 import argparse
 import sys
+import time
 from pathlib import Path
-from .core import extract_and_save
-from .image_processor import check_tesseract_installation
+from typing import List, Optional, Union
+from .core import extract_and_save, save_result, OUTPUT_FORMATS
+from .options import ExtractionOptions
+from .pipeline import DEFAULT_QUEUE_SIZE, parse_stage_threads
+from .dedup import DEDUP_MODES, DedupIndex
+from .fuzzy import DEFAULT_SIMILARITY_THRESHOLD
+from .search_index import DEFAULT_SEARCH_LIMIT, SearchIndex
+from .page_cache import DEFAULT_PAGE_CACHE_MB, PageCache
+from .detection import DEFAULT_AUTO_LANGUAGES
+from .report import RunReport
+from .scheduler import OCRScheduler, PRIORITIES, PRIORITY_BULK
+from .watcher import DirectoryWatcher, DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS
+from .evaluation import (
+    PRESETS,
+    evaluate_presets,
+    format_comparison_table,
+    load_corpus,
+    make_synthetic_corpus,
+)
+from .image_processor import check_tesseract_installation, PREPROCESSING_CHAINS
+from .tuning import AUTO_PREPROCESSING, DEFAULT_TUNING_TOLERANCE
+from .autoconfig import AUTO_WORKERS, apply_ocr_thread_limit, auto_configure
 
 
-def show_installation_help():
+def worker_count(value: str) -> Union[int, str]:
+    """Parses a --workers value: a positive number or 'auto'."""
+    if value == AUTO_WORKERS:
+        return value
+    count = int(value)
+    if count < 1:
+        raise ValueError(value)
+    return count
+
+
+def show_installation_help() -> None:
     """Shows Tesseract installation instructions."""
     print("WARNING: Tesseract OCR not found!")
     print("To install:")
@@ -18,8 +49,15 @@ def show_installation_help():
     print("  macOS: brew install tesseract")
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI function."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Subcommands are dispatched before parsing, so "ocr-pdf-reader file.pdf" works
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Extract text from PDFs with images using OCR",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -28,67 +66,417 @@ Usage examples:
   ocr-pdf-reader file.pdf                         # Extract text to extracted_text.txt
   ocr-pdf-reader file.pdf -o result.txt           # Specify output file
   ocr-pdf-reader file.pdf --lang eng              # Use English for OCR
+  ocr-pdf-reader file.pdf --lang auto             # Detect language and rotation
+  ocr-pdf-reader file.pdf --preprocessing auto    # Tune preprocessing per document
+  ocr-pdf-reader file.pdf -o lines.jsonl --format jsonl  # Keep page, box and confidence
   ocr-pdf-reader file.pdf --no-validate           # Don't validate extracted lines
-        """
+  ocr-pdf-reader file.pdf --page-timeout 60       # Limit OCR to 60s per image
+  ocr-pdf-reader file.pdf --report report.json    # Save the run report
+  ocr-pdf-reader file.pdf --manifest file.manifest.json  # Only OCR changed pages
+  ocr-pdf-reader file.pdf --dedup-index corpus.npz  # Skip lines seen in earlier runs
+  ocr-pdf-reader file.pdf --merge-similar 0.75    # Merge OCR variants of the same line
+  ocr-pdf-reader file.pdf --workers 4 --memory-budget 2048  # Parallel OCR within 2 GB
+  ocr-pdf-reader file.pdf --pipeline --stage-threads ocr=4  # Overlap decode and OCR
+  ocr-pdf-reader file.pdf --workers auto         # Concurrency from the CPU quota
+  ocr-pdf-reader file.pdf --calibrate            # Measure the fastest concurrency
+  ocr-pdf-reader file.pdf --index lines.db        # Add the lines to a search index
+  ocr-pdf-reader search lines.db "parafuso sext*"  # Find the PDF and page of a line
+  ocr-pdf-reader evaluate corpus/ --synthetic 3   # Compare pipeline presets
+  ocr-pdf-reader watch inbox/ -o results/         # Process PDFs dropped into inbox/
+        """,
+    )
+
+    parser.add_argument("pdf_path", help="Path to the PDF file")
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="extracted_text.txt",
+        help="Output file (default: extracted_text.txt)",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="txt",
+        help="Output format; jsonl and parquet keep page, box and confidence "
+        "(default: txt)",
+    )
+
+    parser.add_argument(
+        "--lang",
+        default="eng",
+        help='Language for OCR, or "auto" to detect language and rotation per document '
+        "(default: eng)",
     )
-    
+
+    parser.add_argument(
+        "--auto-languages",
+        default=DEFAULT_AUTO_LANGUAGES,
+        metavar="LANGS",
+        help=f"Candidate languages for --lang auto (default: {DEFAULT_AUTO_LANGUAGES})",
+    )
+
+    parser.add_argument(
+        "--preprocessing",
+        choices=list(PREPROCESSING_CHAINS) + [AUTO_PREPROCESSING],
+        default="default",
+        help='Preprocessing chain, or "auto" to pick one per document from sample '
+        "pages (default: default)",
+    )
+
     parser.add_argument(
-        'pdf_path',
-        help='Path to the PDF file'
+        "--tuning-tolerance",
+        type=float,
+        default=DEFAULT_TUNING_TOLERANCE,
+        metavar="POINTS",
+        help="Confidence points --preprocessing auto may trade for speed "
+        f"(default: {DEFAULT_TUNING_TOLERANCE})",
     )
-    
+
     parser.add_argument(
-        '-o', '--output',
-        default='extracted_text.txt',
-        help='Output file (default: extracted_text.txt)'
+        "--no-validate", action="store_true", help="Don't validate extracted lines"
     )
-    
+
     parser.add_argument(
-        '--lang',
-        default='eng',
-        help='Language for OCR (default: eng)'
+        "--page-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Time budget for the OCR of each image (default: no limit)",
     )
-    
+
     parser.add_argument(
-        '--no-validate',
-        action='store_true',
-        help='Don\'t validate extracted lines'
+        "--no-timeout-retry",
+        action="store_true",
+        help="Don't retry timed-out images with a simplified copy",
     )
-    
+
+    parser.add_argument(
+        "--workers",
+        type=worker_count,
+        default=None,
+        help='Number of images processed concurrently, or "auto" to choose it from the '
+        "CPUs and cgroup quota (default: 1)",
+    )
+
+    parser.add_argument(
+        "--ocr-threads",
+        type=int,
+        default=None,
+        metavar="N",
+        help="OpenMP threads per Tesseract process (OMP_THREAD_LIMIT); "
+        "default: 1 with --workers auto, otherwise Tesseract's own",
+    )
+
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Measure worker and OCR thread counts on sample pages of the PDF, save "
+        "the fastest for later --workers auto runs, and use it",
+    )
+
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Memory budget for concurrent images (default: half of the RAM)",
+    )
+
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Use worker processes fed through shared memory instead of threads",
+    )
+
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap decoding, preprocessing, OCR and text processing in threaded "
+        "stages",
+    )
+
+    parser.add_argument(
+        "--stage-threads",
+        default=None,
+        metavar="STAGE=N,...",
+        help="Threads per pipeline stage: preprocess, ocr, text; decode always has one "
+        "(default: --workers for preprocess and ocr, 1 for the others)",
+    )
+
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="Capacity of the queues between pipeline stages "
+        f"(default: {DEFAULT_QUEUE_SIZE})",
+    )
+
+    parser.add_argument(
+        "--priority",
+        choices=list(PRIORITIES),
+        default=None,
+        help="Run through the scheduler at this priority; interactive pages preempt "
+        "bulk pages at page boundaries",
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Return the pages finished within this time, marked partial "
+        "(runs through the scheduler)",
+    )
+
     parser.add_argument(
-        '--version',
-        action='version',
-        version='OCR PDF Reader 1.0.0'
+        "--no-fast-decode",
+        action="store_true",
+        help="Decode images through PIL instead of straight to grayscale",
     )
-    
-    args = parser.parse_args()
-    
+
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        metavar="FILE",
+        help="Per-page manifest; unchanged pages of a revised PDF are reused from it",
+    )
+
+    parser.add_argument(
+        "--page-cache",
+        default=None,
+        metavar="DIR",
+        help="Cache of preprocessed page images; re-runs with another --lang or "
+        "Tesseract configuration skip decoding and preprocessing",
+    )
+
+    parser.add_argument(
+        "--page-cache-size",
+        type=float,
+        default=DEFAULT_PAGE_CACHE_MB,
+        metavar="MB",
+        help=f"Size of the page cache before old entries are evicted "
+        f"(default: {DEFAULT_PAGE_CACHE_MB})",
+    )
+
+    parser.add_argument(
+        "--merge-similar",
+        type=float,
+        nargs="?",
+        const=DEFAULT_SIMILARITY_THRESHOLD,
+        default=None,
+        metavar="THRESHOLD",
+        help="Merge near-duplicate lines (OCR variants) at this similarity, 0-1 "
+        f"(default when given without a value: {DEFAULT_SIMILARITY_THRESHOLD})",
+    )
+
+    parser.add_argument(
+        "--dedup-index",
+        default=None,
+        metavar="FILE",
+        help="Persistent index of lines seen across documents and runs (.npz)",
+    )
+
+    parser.add_argument(
+        "--dedup-mode",
+        choices=DEDUP_MODES,
+        default="first",
+        help="first: drop lines already in the index; count: keep one copy with "
+        "its occurrence count, written by --format jsonl/parquet (default: first)",
+    )
+
+    parser.add_argument(
+        "--bloom-capacity",
+        type=int,
+        default=None,
+        metavar="LINES",
+        help="Add a Bloom filter sized for this many distinct lines to a new dedup "
+        "index",
+    )
+
+    parser.add_argument(
+        "--index",
+        default=None,
+        metavar="FILE",
+        help="Add the extracted lines to this full-text index (see the search command)",
+    )
+
+    parser.add_argument(
+        "--report",
+        default=None,
+        metavar="FILE",
+        help="Save the run report as JSON to this file",
+    )
+
+    parser.add_argument("--version", action="version", version="OCR PDF Reader 1.0.0")
+
+    args = parser.parse_args(argv)
+
+    if args.ocr_threads is not None and args.ocr_threads < 1:
+        parser.error("--ocr-threads must be at least 1")
+    if args.calibrate and args.workers not in (None, AUTO_WORKERS):
+        parser.error(
+            "--calibrate chooses the number of workers and can't be combined "
+            "with --workers N"
+        )
+
+    try:
+        stage_threads = parse_stage_threads(args.stage_threads)
+    except ValueError as e:
+        parser.error(str(e))
+
+    scheduled = args.priority is not None or args.time_budget is not None
+    if scheduled and (
+        args.processes
+        or args.pipeline
+        or args.manifest
+        or args.page_cache
+        or args.memory_budget is not None
+    ):
+        parser.error(
+            "--priority and --time-budget can't be combined with --processes, "
+            "--pipeline, --manifest, --page-cache or --memory-budget"
+        )
+    if scheduled and (
+        args.lang == "auto"
+        or args.preprocessing == AUTO_PREPROCESSING
+        or args.auto_languages != DEFAULT_AUTO_LANGUAGES
+        or args.tuning_tolerance != DEFAULT_TUNING_TOLERANCE
+    ):
+        parser.error(
+            "--priority and --time-budget can't be combined with --lang auto, "
+            "--auto-languages, --preprocessing auto or --tuning-tolerance, "
+            "which need the whole document before OCR starts"
+        )
+
     # Check if Tesseract is installed
     if not check_tesseract_installation():
         show_installation_help()
         return 1
-    
+
     # Check if file exists
     pdf_path = Path(args.pdf_path)
     if not pdf_path.exists():
         print(f"Error: File not found: {args.pdf_path}")
         return 1
-    
+
     try:
-        print(f"OCR PDF Reader v1.0.0")
+        print("OCR PDF Reader v1.0.0")
         print(f"File: {args.pdf_path}")
         print(f"Language: {args.lang}")
         print(f"Output: {args.output}")
         print("-" * 50)
-        
-        # Extract text
-        text_lines = extract_and_save(
-            pdf_path=str(pdf_path),
-            output_file=args.output,
-            lang=args.lang,
-            validate=not args.no_validate
+
+        dedup_index = None
+        if args.dedup_index:
+            dedup_index = DedupIndex.load(
+                args.dedup_index, bloom_capacity=args.bloom_capacity
+            )
+
+        workers = args.workers or 1
+        ocr_threads = args.ocr_threads
+        if workers == AUTO_WORKERS or args.calibrate:
+            concurrency = auto_configure(
+                str(pdf_path) if args.calibrate else None,
+                lang=args.auto_languages if args.lang == "auto" else args.lang,
+                preprocessing=(
+                    "default"
+                    if args.preprocessing == AUTO_PREPROCESSING
+                    else args.preprocessing
+                ),
+                fast_decode=not args.no_fast_decode,
+            )
+            workers = concurrency.workers
+            ocr_threads = ocr_threads or concurrency.ocr_threads
+            print(
+                f"Concurrency: {workers} worker(s) x {ocr_threads} OCR thread(s) "
+                f"({concurrency.source}, {concurrency.cpus} CPU(s))"
+            )
+        if ocr_threads:
+            apply_ocr_thread_limit(ocr_threads)
+
+        page_cache = None
+        if args.page_cache:
+            page_cache = PageCache(args.page_cache, int(args.page_cache_size * 1024**2))
+
+        # Validated once, for whichever path runs the extraction
+        options = ExtractionOptions(
+            page_timeout=args.page_timeout,
+            retry_on_timeout=not args.no_timeout_retry,
+            workers=workers,
+            memory_budget_mb=args.memory_budget,
+            use_processes=args.processes,
+            fast_decode=not args.no_fast_decode,
+            manifest_path=args.manifest,
+            pipeline=args.pipeline,
+            stage_threads=stage_threads,
+            queue_size=args.queue_size,
+            dedup_index=dedup_index,
+            dedup_mode=args.dedup_mode,
+            merge_similar=args.merge_similar,
+            auto_languages=args.auto_languages,
+            preprocessing=args.preprocessing,
+            tuning_tolerance=args.tuning_tolerance,
+            page_cache=page_cache,
         )
-        
+
+        # Extract text
+        report = RunReport()
+        if scheduled:
+            with OCRScheduler(workers) as scheduler:
+                job = scheduler.submit(
+                    str(pdf_path),
+                    lang=args.lang,
+                    validate=not args.no_validate,
+                    priority=PRIORITIES.get(args.priority, PRIORITY_BULK),
+                    time_budget=args.time_budget,
+                    options=options,
+                    report=report,
+                )
+                text_lines = save_result(
+                    job.result(), str(pdf_path), args.output, args.format, args.index
+                )
+        else:
+            text_lines = extract_and_save(
+                pdf_path=str(pdf_path),
+                output_file=args.output,
+                lang=args.lang,
+                validate=not args.no_validate,
+                output_format=args.format,
+                index_path=args.index,
+                options=options,
+                report=report,
+            )
+
+        if dedup_index is not None:
+            dedup_index.save(args.dedup_index)
+            print(
+                f"Dedup index: {len(dedup_index)} distinct lines in {args.dedup_index}"
+            )
+
+        if (
+            report.timed_out_images
+            or report.recovered_images
+            or report.reused_pages
+            or report.stage_stats
+            or report.detected_language
+            or report.preprocessing_choice
+            or report.partial
+            or page_cache is not None
+        ):
+            print(report.summary())
+
+        if args.report:
+            report.save(args.report)
+            print(f"Report saved to: {args.report}")
+
+        if report.partial:
+            print(
+                f"\n⚠️ Partial result: the time budget ran out before pages "
+                f"{', '.join(str(page) for page in report.missing_pages)}."
+            )
+
         if text_lines:
             print(f"\n✅ Success! {len(text_lines)} lines extracted.")
             print(f"Result saved to: {args.output}")
@@ -96,8 +484,8 @@ Usage examples:
         else:
             print("\n❌ No text was extracted.")
             return 1
-            
-    except FileNotFoundError as e:
+
+    except (FileNotFoundError, ImportError, ValueError, RuntimeError) as e:
         print(f"Error: {e}")
         return 1
     except Exception as e:
@@ -105,42 +493,287 @@ Usage examples:
         return 1
 
 
-def interactive_mode():
+def evaluate_main(argv: List[str]) -> int:
+    """Compares pipeline presets on a corpus of PDFs with ground-truth line files."""
+    parser = argparse.ArgumentParser(
+        prog="ocr-pdf-reader evaluate",
+        description="Compare speed and accuracy of pipeline presets",
+    )
+
+    parser.add_argument(
+        "corpus_dir",
+        help="Directory with PDFs and ground-truth .txt files of the same name",
+    )
+
+    parser.add_argument(
+        "--presets",
+        default=",".join(PRESETS),
+        help=f'Comma-separated presets to compare (default: {",".join(PRESETS)})',
+    )
+
+    parser.add_argument("--lang", default="eng", help="Language for OCR (default: eng)")
+
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Generate N synthetic PDFs in the corpus directory first",
+    )
+
+    args = parser.parse_args(argv)
+
+    if not check_tesseract_installation():
+        show_installation_help()
+        return 1
+
+    unknown = [name for name in args.presets.split(",") if name not in PRESETS]
+    if unknown:
+        print(f"Error: Unknown presets: {', '.join(unknown)}")
+        return 1
+
+    if args.synthetic:
+        make_synthetic_corpus(args.corpus_dir, documents=args.synthetic)
+
+    corpus = load_corpus(args.corpus_dir)
+    if not corpus:
+        print(f"Error: No PDFs with ground-truth files found in: {args.corpus_dir}")
+        return 1
+
+    print(f"Evaluating {len(corpus)} document(s)...")
+    presets = [PRESETS[name] for name in args.presets.split(",")]
+    results = evaluate_presets(corpus, presets, lang=args.lang)
+    print(format_comparison_table(results))
+    return 0
+
+
+def watch_main(argv: List[str]) -> int:
+    """Watches a directory and processes new PDFs as they arrive."""
+    parser = argparse.ArgumentParser(
+        prog="ocr-pdf-reader watch", description="Process PDFs dropped into a directory"
+    )
+
+    parser.add_argument("input_dir", help="Directory watched for new PDFs")
+
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        required=True,
+        help="Directory where extracted text files are written",
+    )
+
+    parser.add_argument(
+        "--processed-dir",
+        default=None,
+        help="Where processed PDFs are moved (default: INPUT_DIR/processed)",
+    )
+
+    parser.add_argument(
+        "--failed-dir",
+        default=None,
+        help="Where failed PDFs are moved (default: INPUT_DIR/failed)",
+    )
+
+    parser.add_argument(
+        "--state-file",
+        default=None,
+        help="State file that prevents repeated work across restarts",
+    )
+
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        metavar="SECONDS",
+        help=f"Seconds between directory scans (default: {DEFAULT_POLL_INTERVAL})",
+    )
+
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        metavar="SECONDS",
+        help=f"Seconds a file must stay unchanged (default: {DEFAULT_SETTLE_SECONDS})",
+    )
+
+    parser.add_argument(
+        "--file-workers",
+        type=int,
+        default=1,
+        help="Number of PDFs processed at the same time (default: 1)",
+    )
+
+    parser.add_argument("--lang", default="eng", help="Language for OCR (default: eng)")
+
+    parser.add_argument(
+        "--workers",
+        type=worker_count,
+        default=1,
+        help='Number of images of a PDF processed concurrently, or "auto" to share the '
+        "CPUs between --file-workers (default: 1)",
+    )
+
+    parser.add_argument(
+        "--ocr-threads",
+        type=int,
+        default=None,
+        metavar="N",
+        help="OpenMP threads per Tesseract process (OMP_THREAD_LIMIT)",
+    )
+
+    parser.add_argument(
+        "--page-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Time budget for the OCR of each image (default: no limit)",
+    )
+
+    parser.add_argument(
+        "--index",
+        default=None,
+        metavar="FILE",
+        help="Full-text index updated with each processed PDF",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.ocr_threads is not None and args.ocr_threads < 1:
+        parser.error("--ocr-threads must be at least 1")
+
+    # Checked once for the whole session instead of once per file
+    if not check_tesseract_installation():
+        show_installation_help()
+        return 1
+
+    if not Path(args.input_dir).is_dir():
+        print(f"Error: Directory not found: {args.input_dir}")
+        return 1
+
+    workers = args.workers
+    ocr_threads = args.ocr_threads
+    if workers == AUTO_WORKERS:
+        concurrency = auto_configure()
+        workers = max(1, concurrency.workers // args.file_workers)
+        ocr_threads = ocr_threads or concurrency.ocr_threads
+        print(
+            f"Concurrency: {args.file_workers} file(s) x {workers} worker(s) x "
+            f"{ocr_threads} OCR thread(s) ({concurrency.source})"
+        )
+    if ocr_threads:
+        apply_ocr_thread_limit(ocr_threads)
+
+    watcher = DirectoryWatcher(
+        args.input_dir,
+        args.output_dir,
+        processed_dir=args.processed_dir,
+        failed_dir=args.failed_dir,
+        state_path=args.state_file,
+        settle_seconds=args.settle,
+        file_workers=args.file_workers,
+        lang=args.lang,
+        index_path=args.index,
+        log=print,
+        workers=workers,
+        page_timeout=args.page_timeout,
+    )
+
+    try:
+        watcher.run(poll_interval=args.poll_interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+    return 0
+
+
+def search_main(argv: List[str]) -> int:
+    """Searches a full-text index of extracted lines."""
+    parser = argparse.ArgumentParser(
+        prog="ocr-pdf-reader search",
+        description="Find the PDF, page and line where words were extracted",
+    )
+
+    parser.add_argument("index_path", help="Index built with --index")
+
+    parser.add_argument(
+        "query",
+        nargs="+",
+        help="Words that must all appear in the line; end a word with * to match a "
+        "prefix",
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_SEARCH_LIMIT,
+        help=f"Maximum number of results (default: {DEFAULT_SEARCH_LIMIT})",
+    )
+
+    args = parser.parse_args(argv)
+
+    if not Path(args.index_path).exists():
+        print(f"Error: Index not found: {args.index_path}")
+        return 1
+
+    start = time.perf_counter()
+    try:
+        with SearchIndex(args.index_path) as index:
+            hits = index.search(" ".join(args.query), limit=args.limit)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for hit in hits:
+        print(f"{hit.document}:{hit.page}:{hit.line}: {hit.text}")
+
+    print(f"{len(hits)} result(s) in {elapsed_ms:.1f} ms")
+    return 0 if hits else 1
+
+
+SUBCOMMANDS = {
+    "evaluate": evaluate_main,
+    "search": search_main,
+    "watch": watch_main,
+}
+
+
+def interactive_mode() -> None:
     """Interactive mode for use without command line parameters."""
     print("=== OCR PDF Reader - Interactive Mode ===")
-    
+
     # Check Tesseract
     if not check_tesseract_installation():
         show_installation_help()
         return
-    
+
     # Request PDF path
     pdf_path = input("Enter the path to the PDF file: ").strip()
-    
+
     if not pdf_path:
         print("Error: You must provide the path to a PDF file.")
         return
-    
+
     try:
         # Extract text
         text_lines = extract_and_save(pdf_path)
-        
+
         if text_lines:
             print(f"\n{'='*50}")
             print(f"EXTRACTED TEXT ({len(text_lines)} lines):")
             print(f"{'='*50}")
-            
+
             # Show first 10 lines
             for i, line in enumerate(text_lines[:10], 1):
                 print(f"{i:3d}: {line}")
-            
+
             if len(text_lines) > 10:
                 print(f"... and {len(text_lines) - 10} more lines")
-            
-            print(f"\nComplete text saved to: extracted_text.txt")
+
+            print("\nComplete text saved to: extracted_text.txt")
         else:
             print("No text was extracted from the PDF.")
-            
+
     except Exception as e:
         print(f"Error: {e}")
 
@@ -149,4 +782,4 @@ if __name__ == "__main__":
     if len(sys.argv) == 1:
         interactive_mode()
     else:
-        sys.exit(main()) 
\ No newline at end of file
+        sys.exit(main())
@@ -4,76 +4,1170 @@ Main module of the OCR PDF Reader.
 This module integrates all functionalities to extract text from PDFs containing images.
 """
 
-from typing import List
-from .image_processor import extract_images_from_pdf, extract_text_from_image
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple
+import json
+import fitz  # PyMuPDF
+import numpy as np
+from .image_processor import (
+    ImageSource,
+    PageImage,
+    open_pdf,
+    list_image_sources,
+    load_image_source,
+    OCRResult,
+    ocr_image,
+    simplify_image,
+    preprocess_image,
+    resolve_preprocessing_chain,
+    OCRTimeoutError,
+    RENDER_RESOLUTION_MULTIPLIER,
+)
 from .text_processor import process_text_lines, validate_extracted_lines
+from .governor import MemoryGovernor, estimate_memory_bytes
+from .shared_buffers import PageBufferHandle, SharedPageRing, attach_page_buffer
+from .results import ExtractionResult, LineRecord, locate_lines
+from .manifest import PageManifest, StoredLine, page_fingerprint
+from .pipeline import PIPELINE_STAGES, StagedPipeline
+from .dedup import DedupIndex
+from .fuzzy import merge_similar_lines
+from .search_index import SearchIndex
+from .page_cache import PageCache
+from .packed_page import pack_if_binary
+from .detection import detect_document_language
+from .tuning import AUTO_PREPROCESSING, TUNING_CANDIDATES, tune_preprocessing
+from .options import ExtractionOptions, resolve_options
+from .report import RunReport
 
 
-def extract_text_from_pdf(pdf_path: str, lang: str = 'eng', validate: bool = True) -> List[str]:
+# Formats accepted by extract_and_save
+OUTPUT_FORMATS = ("txt", "jsonl", "parquet")
+
+# Decoded images allowed to wait for a free worker, per worker
+QUEUED_IMAGES_PER_WORKER = 2
+
+# Value of `lang` that detects the language and rotation of each document
+AUTO_LANGUAGE = "auto"
+
+# Language, time budget, retry flag and options for ocr_image
+OCRArgs = Tuple[str, Optional[float], bool, Dict[str, Any]]
+
+
+def extract_text_from_pdf(
+    pdf_path: str, lang: str = "eng", validate: bool = True, **options: Any
+) -> List[str]:
     """
     Main function that extracts text from a PDF containing images.
-    
+
+    This is a list-of-strings view over extract_results_from_pdf().
+
     Args:
         pdf_path (str): Path to the PDF file
         lang (str): Language for OCR (default: 'eng' for English)
         validate (bool): Whether to validate extracted lines (default: True)
-    
+        **options: Additional options of extract_results_from_pdf
+            (options, report, page_timeout, workers, ...)
+
     Returns:
         List[str]: List of extracted text lines (without numbers)
-        
+
+    Raises:
+        FileNotFoundError: If the PDF file is not found
+    """
+    return list(extract_results_from_pdf(pdf_path, lang, validate, **options).texts)
+
+
+def extract_results_from_pdf(
+    pdf_path: str,
+    lang: str = "eng",
+    validate: bool = True,
+    options: Optional[ExtractionOptions] = None,
+    report: Optional[RunReport] = None,
+    **option_values: Any,
+) -> ExtractionResult:
+    """
+    Extracts lines from a PDF with their page, source image, box and confidence.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        lang (str): Language for OCR (default: 'eng' for English). 'auto' detects the
+            language and rotation once, on sample pages, and runs the other pages
+            with that single model and pre-rotated images
+        validate (bool): Whether to validate extracted lines (default: True)
+        options (Optional[ExtractionOptions]): Options built once, e.g. for a batch
+            of documents (default: ExtractionOptions())
+        report (Optional[RunReport]): Report to fill with run information
+        **option_values: ExtractionOptions fields overriding those of `options`
+            (page_timeout, workers, pipeline, dedup_index, page_cache, ...)
+
+    Returns:
+        ExtractionResult: Extracted lines (without numbers) and their metadata
+
     Raises:
         FileNotFoundError: If the PDF file is not found
+        TypeError: If an option is not an ExtractionOptions field
+        ValueError: If an option is invalid (see ExtractionOptions)
     """
+    options = resolve_options(options, **option_values)
+
+    if report is None:
+        report = RunReport()
+    report.pdf_path = pdf_path
+
     print(f"Extracting images from PDF: {pdf_path}")
-    images = extract_images_from_pdf(pdf_path)
-    
-    if not images:
-        print("No images found in the PDF.")
-        return []
-    
-    print(f"Found {len(images)} image(s). Applying OCR...")
-    
-    all_text_lines = []
-    
-    for i, image in enumerate(images):
-        print(f"Processing image {i+1}/{len(images)}...")
-        
-        # Extract text from image
-        raw_text = extract_text_from_image(image, lang)
-        
-        if raw_text:
-            # Process text to extract only relevant content
-            processed_lines = process_text_lines(raw_text)
-            all_text_lines.extend(processed_lines)
-    
+
+    with open_pdf(pdf_path) as pdf_document:
+        sources = list_image_sources(pdf_document, options.render_scale)
+        report.total_images = len(sources)
+
+        if not sources:
+            print("No images found in the PDF.")
+            return ExtractionResult()
+
+        page_numbers = sorted({source.page_number for source in sources})
+        page_lines: Dict[int, List[StoredLine]] = {}
+        manifest = PageManifest()
+        fingerprints: Dict[int, str] = {}
+
+        if options.manifest_path:
+            manifest, fingerprints, page_lines = _reuse_manifest_pages(
+                pdf_document, options.manifest_path, page_numbers, lang, options, report
+            )
+            sources = [
+                source for source in sources if source.page_number not in page_lines
+            ]
+
+        ocr_options: Dict[str, Any] = {
+            "config": options.ocr_config,
+            "preprocessing": options.preprocessing,
+        }
+        if lang == AUTO_LANGUAGE:
+            # Detected once per document
+            lang, ocr_options["rotate"] = _detect_language(
+                pdf_document, sources, options, report
+            )
+
+        source_lines = _ocr_sources(
+            pdf_document, sources, lang, ocr_options, options, report
+        )
+
+    recomputed_pages = sorted({source.page_number for source in sources})
+    for page_number in recomputed_pages:
+        page_lines[page_number] = []
+
+    for source, lines in zip(sources, source_lines):
+        page_lines[source.page_number].extend(lines)
+
+    if options.manifest_path:
+        report.recomputed_pages = [page_number + 1 for page_number in recomputed_pages]
+        for page_number in recomputed_pages:
+            manifest.put(fingerprints[page_number], page_lines[page_number])
+        manifest.retain(fingerprints.values())
+        manifest.save(options.manifest_path)
+
+    return build_result(
+        page_numbers,
+        page_lines,
+        validate,
+        options.merge_similar,
+        options.dedup_index,
+        options.dedup_mode,
+    )
+
+
+def _reuse_manifest_pages(
+    pdf_document: fitz.Document,
+    manifest_path: str,
+    page_numbers: Sequence[int],
+    lang: str,
+    options: ExtractionOptions,
+    report: RunReport,
+) -> Tuple[PageManifest, Dict[int, str], Dict[int, List[StoredLine]]]:
+    """
+    Looks up the pages of a document in the manifest of a previous run.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        manifest_path (str): Path of the manifest
+        page_numbers (Sequence[int]): 0-based numbers of the pages with images
+        lang (str): Language for OCR, possibly 'auto'
+        options (ExtractionOptions): Extraction options, part of the page fingerprints
+        report (RunReport): Report where the reused pages are recorded
+
+    Returns:
+        Tuple[PageManifest, Dict[int, str], Dict[int, List[StoredLine]]]: The manifest,
+            the fingerprint of each page and the stored lines of the unchanged pages
+    """
+    lang_key = (
+        f"{AUTO_LANGUAGE}:{options.auto_languages}" if lang == AUTO_LANGUAGE else lang
+    )
+    preprocessing_key = (
+        options.preprocessing
+        if options.preprocessing == AUTO_PREPROCESSING
+        else list(options.preprocessing)
+    )
+    settings_key = json.dumps(
+        [
+            lang_key,
+            options.ocr_config,
+            preprocessing_key,
+            options.render_scale,
+            options.fast_decode,
+        ]
+    )
+    manifest = PageManifest.load(manifest_path)
+    fingerprints = {
+        page_number: page_fingerprint(pdf_document, page_number, settings_key)
+        for page_number in page_numbers
+    }
+
+    page_lines: Dict[int, List[StoredLine]] = {}
+    for page_number, fingerprint in fingerprints.items():
+        stored = manifest.get(fingerprint)
+        if stored is not None:
+            page_lines[page_number] = stored
+
+    report.reused_pages = [page_number + 1 for page_number in sorted(page_lines)]
+    print(f"Reusing {len(page_lines)} unchanged page(s) from the manifest.")
+    return manifest, fingerprints, page_lines
+
+
+def _detect_language(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    options: ExtractionOptions,
+    report: RunReport,
+) -> Tuple[str, int]:
+    """
+    Detects the language and rotation of a document for lang='auto'.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images left to process
+        options (ExtractionOptions): Extraction options, with the candidate languages
+        report (RunReport): Report where the detection is recorded
+
+    Returns:
+        Tuple[str, int]: Language for OCR and clockwise rotation in degrees; all
+            candidates and no rotation when no image is left to process
+    """
+    if not sources:
+        return options.auto_languages, 0
+
+    detection = detect_document_language(
+        pdf_document,
+        sources,
+        options.auto_languages,
+        options.render_scale,
+        options.fast_decode,
+    )
+    report.detected_language = detection.language
+    report.detected_rotation = detection.rotate
+    print(
+        f"Detected language: {detection.language}, "
+        f"rotation: {detection.rotate} degrees"
+    )
+    return detection.language, detection.rotate
+
+
+def _ocr_sources(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    lang: str,
+    ocr_options: Dict[str, Any],
+    options: ExtractionOptions,
+    report: RunReport,
+) -> List[List[StoredLine]]:
+    """
+    Applies OCR to the images, taking preprocessed ones from the page cache.
+
+    The preprocessing chain is tuned first with preprocessing='auto'. Images
+    missing from the cache go through the pipeline, worker processes, worker
+    threads or the calling thread, depending on the options.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        lang (str): Language for OCR
+        ocr_options (Dict[str, Any]): Options for ocr_image (config, preprocessing,
+            rotate); the tuned chain is stored in it
+        options (ExtractionOptions): Extraction options
+        report (RunReport): Report to fill with run information
+
+    Returns:
+        List[List[StoredLine]]: Stored lines of each image, in the order of `sources`
+    """
+    page_cache = options.page_cache
+    page_keys: Dict[int, str] = {}
+    if page_cache is not None and sources:
+        # The settings that change the preprocessed pixels, but the chain;
+        # language and Tesseract flags are left out so re-runs with other ones hit
+        cache_settings = json.dumps(
+            [options.render_scale, options.fast_decode, ocr_options.get("rotate", 0)]
+        )
+        page_keys = {
+            page_number: page_fingerprint(pdf_document, page_number, cache_settings)
+            for page_number in {source.page_number for source in sources}
+        }
+
+    tuned = options.preprocessing == AUTO_PREPROCESSING
+    if tuned and sources:
+        ocr_options["preprocessing"] = _choose_preprocessing(
+            pdf_document,
+            sources,
+            lang,
+            ocr_options.get("rotate", 0),
+            page_keys,
+            options,
+            report,
+        )
+
+    ocr_args: OCRArgs = (
+        lang,
+        options.page_timeout,
+        options.retry_on_timeout,
+        ocr_options,
+    )
+    cache_keys: List[str] = []
+    cached_lines: Dict[int, List[StoredLine]] = {}
+
+    if page_cache is not None and page_keys:
+        cache_keys = _page_cache_keys(
+            page_keys, sources, ocr_options["preprocessing"], tuned=tuned
+        )
+        cached_lines = _ocr_cached_sources(
+            page_cache, sources, cache_keys, options.workers, ocr_args, report
+        )
+        report.page_cache_hits = len(cached_lines)
+        report.page_cache_misses = len(sources) - len(cached_lines)
+        print(f"Reusing {len(cached_lines)} preprocessed image(s) from the page cache.")
+
+    # Images keep their number in `sources` whether they come from the cache or not
+    skip = frozenset(cached_lines)
+    uncached = [i for i in range(len(sources)) if i not in skip]
+    print(f"Found {len(uncached)} image(s) to process. Applying OCR...")
+
+    source_lines: List[List[StoredLine]] = []
+    if uncached:
+        source_lines = _ocr_uncached_sources(
+            pdf_document, sources, skip, ocr_args, cache_keys, options, report
+        )
+
+    if cached_lines:
+        uncached_lines = iter(source_lines)
+        source_lines = [
+            cached_lines[i] if i in cached_lines else next(uncached_lines)
+            for i in range(len(sources))
+        ]
+
+    return source_lines
+
+
+def _choose_preprocessing(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    lang: str,
+    rotate: int,
+    page_keys: Dict[int, str],
+    options: ExtractionOptions,
+    report: RunReport,
+) -> Tuple[str, ...]:
+    """
+    Chooses the preprocessing chain of a document for preprocessing='auto'.
+
+    A chain tuned by an earlier run with all its images in the page cache
+    is reused without tuning.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        lang (str): Language for OCR
+        rotate (int): Clockwise rotation applied before preprocessing
+        page_keys (Dict[int, str]): Page cache fingerprint of each page, empty
+            without a page cache
+        options (ExtractionOptions): Extraction options
+        report (RunReport): Report where the choice and the tuning trials are recorded
+
+    Returns:
+        Tuple[str, ...]: Steps of the chosen chain
+    """
+    if options.page_cache is not None and page_keys:
+        for chain in TUNING_CANDIDATES:
+            steps = resolve_preprocessing_chain(chain)
+            keys = _page_cache_keys(page_keys, sources, steps, tuned=True)
+            if all(key in options.page_cache for key in keys):
+                report.preprocessing_choice = chain
+                print(f"Preprocessing chain: {chain} (tuned by an earlier run)")
+                return steps
+
+    tuning = tune_preprocessing(
+        pdf_document,
+        sources,
+        lang,
+        tolerance=options.tuning_tolerance,
+        render_scale=options.render_scale,
+        fast_decode=options.fast_decode,
+        config=options.ocr_config,
+        rotate=rotate,
+        timeout=options.page_timeout,
+    )
+    report.preprocessing_choice = tuning.chain
+    report.preprocessing_trials = tuning.trials
+    report.tuning_seconds = round(tuning.seconds, 3)
+    print(f"Preprocessing chain: {tuning.chain} " f"(tuned in {tuning.seconds:.1f}s)")
+    return resolve_preprocessing_chain(tuning.chain)
+
+
+def _ocr_uncached_sources(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    skip: AbstractSet[int],
+    ocr_args: OCRArgs,
+    cache_keys: Sequence[str],
+    options: ExtractionOptions,
+    report: RunReport,
+) -> List[List[StoredLine]]:
+    """
+    Decodes, preprocesses and applies OCR to the images not read from the page cache.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        skip (AbstractSet[int]): Indexes in `sources` of images read from the cache
+        ocr_args (OCRArgs): Language, time budget, retry flag and options for ocr_image
+        cache_keys (Sequence[str]): Page cache key of each image, empty without a cache
+        options (ExtractionOptions): Extraction options
+        report (RunReport): Report to fill with run information
+
+    Returns:
+        List[List[StoredLine]]: Stored lines of each image not skipped, in
+            document order
+    """
+    lang, page_timeout, retry_on_timeout, ocr_options = ocr_args
+    page_cache = options.page_cache
+
+    if options.pipeline:
+        return _ocr_sources_in_pipeline(
+            pdf_document,
+            sources,
+            options.pipeline_threads(),
+            options.queue_size,
+            report,
+            ocr_args,
+            options.fast_decode,
+            options.render_scale,
+            page_cache,
+            cache_keys,
+            skip,
+        )
+
+    def ocr(image: PageImage, image_number: int) -> OCRResult:
+        preprocessed = None
+        if page_cache is not None and cache_keys:
+            # Stored for later runs; the first OCR attempt reuses it
+            preprocessed = preprocess_image(
+                np.asarray(image),
+                ocr_options["preprocessing"],
+                ocr_options.get("rotate", 0),
+            )
+            page_cache.put(cache_keys[image_number - 1], preprocessed)
+        return ocr_image_with_budget(
+            image,
+            image_number,
+            lang,
+            page_timeout,
+            retry_on_timeout,
+            report,
+            preprocessed=preprocessed,
+            **ocr_options,
+        )
+
+    if options.workers > 1:
+        budget = (
+            int(options.memory_budget_mb * 1024**2)
+            if options.memory_budget_mb
+            else None
+        )
+        governor = MemoryGovernor(
+            budget, max_items=options.workers * QUEUED_IMAGES_PER_WORKER
+        )
+        if options.use_processes:
+            ocr_results = _ocr_sources_in_processes(
+                pdf_document,
+                sources,
+                ocr_args,
+                options.workers,
+                governor,
+                report,
+                options.fast_decode,
+                options.render_scale,
+                skip,
+            )
+        else:
+            ocr_results = _ocr_sources_concurrently(
+                pdf_document,
+                sources,
+                ocr,
+                options.workers,
+                governor,
+                options.fast_decode,
+                options.render_scale,
+                skip,
+            )
+        report.peak_estimated_memory_bytes = governor.peak_bytes
+    else:
+        ocr_results = _ocr_sources_serially(
+            pdf_document, sources, ocr, options.fast_decode, options.render_scale, skip
+        )
+
+    uncached = [i for i in range(len(sources)) if i not in skip]
+    return [
+        stored_lines(sources[i], ocr_result)
+        for i, ocr_result in zip(uncached, ocr_results)
+    ]
+
+
+def build_result(
+    page_numbers: Sequence[int],
+    page_lines: Dict[int, List[StoredLine]],
+    validate: bool = True,
+    merge_similar: Optional[float] = None,
+    dedup_index: Optional[DedupIndex] = None,
+    dedup_mode: str = "first",
+    missing_pages: Sequence[int] = (),
+) -> ExtractionResult:
+    """
+    Builds the result of a document from the stored lines of its pages.
+
+    Args:
+        page_numbers (Sequence[int]): 0-based numbers of the pages to include, in order
+        page_lines (Dict[int, List[StoredLine]]): Stored lines by page number
+        validate (bool): Whether to validate extracted lines
+        merge_similar (Optional[float]): Similarity threshold for merging
+            near-duplicates
+        dedup_index (Optional[DedupIndex]): Corpus-wide dedup index
+        dedup_mode (str): 'first' or 'count'
+        missing_pages (Sequence[int]): 1-based pages left out, which mark the result
+            partial
+
+    Returns:
+        ExtractionResult: Lines of the pages, post-processed
+    """
+    result = ExtractionResult()
+
+    for page_number in page_numbers:
+        for text, image_index, bbox, confidence in page_lines[page_number]:
+            result.append(
+                text,
+                page_number + 1,
+                image_index,
+                tuple(bbox) if bbox else None,
+                confidence,
+            )
+
     # Validate lines if requested
     if validate:
-        all_text_lines = validate_extracted_lines(all_text_lines)
-    
-    return all_text_lines
+        result = result.filter(_validate_record)
+
+    # Merged first, so the dedup index sees the canonical forms
+    if merge_similar is not None:
+        result = merge_similar_lines(result, merge_similar)
+
+    if dedup_index is not None:
+        result = dedup_index.apply(result, dedup_mode)
+
+    result.missing_pages = list(missing_pages)
+    return result
+
+
+def _validate_record(record: LineRecord) -> Optional[str]:
+    """
+    Applies validate_extracted_lines to a single record.
+
+    Args:
+        record (LineRecord): Record to validate
+
+    Returns:
+        Optional[str]: Cleaned text, or None if the line is not valid
+    """
+    valid = validate_extracted_lines([record.text])
+    return valid[0] if valid else None
+
+
+def stored_lines(source: ImageSource, ocr_result: OCRResult) -> List[StoredLine]:
+    """
+    Processes the OCR output of one image into stored lines.
+
+    Args:
+        source (ImageSource): Image the OCR output comes from
+        ocr_result (OCRResult): OCR output
+
+    Returns:
+        List[StoredLine]: [text, image_index, bbox or None, confidence] of each line
+    """
+    if not ocr_result.text:
+        return []
 
+    # Process text to extract only relevant content
+    processed_lines = process_text_lines(ocr_result.text)
 
-def extract_and_save(pdf_path: str, output_file: str = "extracted_text.txt", 
-                    lang: str = 'eng', validate: bool = True) -> List[str]:
+    return [
+        [line, source.image_index, list(bbox) if bbox else None, confidence]
+        for line, (bbox, confidence) in zip(
+            processed_lines, locate_lines(processed_lines, ocr_result)
+        )
+    ]
+
+
+def _ocr_sources_serially(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    ocr: Callable[[PageImage, int], OCRResult],
+    fast_decode: bool = True,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    skip: AbstractSet[int] = frozenset(),
+) -> List[OCRResult]:
+    """
+    Decodes and applies OCR to the images one at a time.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        ocr (Callable[[PageImage, int], OCRResult]): OCR function for one image
+        fast_decode (bool): Whether to use the fast decode path
+        render_scale (float): Scale used to render pages without embedded images
+        skip (AbstractSet[int]): Indexes in `sources` of images not to process
+
+    Returns:
+        List[OCRResult]: OCR output of each image not skipped, in document order
+    """
+    ocr_results = []
+
+    for i, source in enumerate(sources):
+        if i in skip:
+            continue
+        print(f"Processing image {i+1}/{len(sources)}...")
+
+        image = load_image_source(pdf_document, source, render_scale, fast_decode)
+        ocr_results.append(ocr(image, i + 1) if image is not None else OCRResult())
+
+    return ocr_results
+
+
+def _ocr_sources_concurrently(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    ocr: Callable[[PageImage, int], OCRResult],
+    workers: int,
+    governor: MemoryGovernor,
+    fast_decode: bool = True,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    skip: AbstractSet[int] = frozenset(),
+) -> List[OCRResult]:
+    """
+    Applies OCR to several images at a time within a memory budget.
+
+    Each image is admitted by the governor using its estimated footprint
+    before it is decoded. Decoding stays in the calling thread, since the
+    PDF document must not be shared between threads; OCR runs in the workers
+    and returns the memory to the budget when it finishes.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        ocr (Callable[[PageImage, int], OCRResult]): OCR function for one image
+        workers (int): Number of worker threads
+        governor (MemoryGovernor): Admission control for the memory budget
+        fast_decode (bool): Whether to use the fast decode path
+        render_scale (float): Scale used to render pages without embedded images
+        skip (AbstractSet[int]): Indexes in `sources` of images not to process
+
+    Returns:
+        List[OCRResult]: OCR output of each image not skipped, in document order
+    """
+
+    def run_admitted(image: PageImage, image_number: int, nbytes: int) -> OCRResult:
+        try:
+            return ocr(image, image_number)
+        finally:
+            governor.release(nbytes)
+
+    futures: List[Optional[Future]] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for i, source in enumerate(sources):
+            if i in skip:
+                continue
+            nbytes = estimate_memory_bytes(source)
+            governor.acquire(nbytes)
+
+            try:
+                image = load_image_source(
+                    pdf_document, source, render_scale, fast_decode
+                )
+            except Exception:
+                governor.release(nbytes)
+                raise
+
+            if image is None:
+                governor.release(nbytes)
+                futures.append(None)
+                continue
+
+            print(f"Processing image {i+1}/{len(sources)}...")
+            # Bilevel scans wait in the executor queue bit-packed
+            packed = pack_if_binary(image, check_values=False)
+            futures.append(executor.submit(run_admitted, packed, i + 1, nbytes))
+
+        return [
+            future.result() if future is not None else OCRResult() for future in futures
+        ]
+
+
+def _ocr_sources_in_processes(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    ocr_args: OCRArgs,
+    workers: int,
+    governor: MemoryGovernor,
+    report: RunReport,
+    fast_decode: bool = True,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    skip: AbstractSet[int] = frozenset(),
+) -> List[OCRResult]:
+    """
+    Applies OCR to several images at a time in worker processes.
+
+    Rendering stays in this process, which owns the PDF document. Each
+    image is written once into a ring of shared-memory slots and workers
+    read it in place, so page images are never pickled. A slot and its
+    memory admission are released when the worker finishes or crashes.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        ocr_args (OCRArgs): Language, time budget, retry flag and options for ocr_image
+        workers (int): Number of worker processes
+        governor (MemoryGovernor): Admission control for the memory budget
+        report (RunReport): Report where worker timeouts are merged
+        fast_decode (bool): Whether to use the fast decode path
+        render_scale (float): Scale used to render pages without embedded images
+        skip (AbstractSet[int]): Indexes in `sources` of images not to process
+
+    Returns:
+        List[OCRResult]: OCR output of each image not skipped, in document order
+    """
+    futures: List[Optional[Future]] = []
+
+    def release(handle: PageBufferHandle, nbytes: int, _: Future) -> None:
+        # Done callback: runs when the worker finishes or crashes
+        ring.release(handle)
+        governor.release(nbytes)
+
+    with (
+        SharedPageRing(slots=governor.max_items or workers) as ring,
+        ProcessPoolExecutor(max_workers=workers) as executor,
+    ):
+        for i, source in enumerate(sources):
+            if i in skip:
+                continue
+            nbytes = estimate_memory_bytes(source)
+            governor.acquire(nbytes)
+
+            try:
+                image = load_image_source(
+                    pdf_document, source, render_scale, fast_decode
+                )
+                handle = ring.write(np.asarray(image)) if image is not None else None
+            except Exception:
+                governor.release(nbytes)
+                raise
+
+            if handle is None:
+                governor.release(nbytes)
+                futures.append(None)
+                continue
+
+            print(f"Processing image {i+1}/{len(sources)}...")
+            submitted = executor.submit(_ocr_shared_image, handle, i + 1, *ocr_args)
+            submitted.add_done_callback(partial(release, handle, nbytes))
+            futures.append(submitted)
+
+        ocr_results = []
+        for future in futures:
+            if future is None:
+                ocr_results.append(OCRResult())
+                continue
+            ocr_result, worker_report = future.result()
+            report.merge_timeouts(worker_report)
+            ocr_results.append(ocr_result)
+
+        return ocr_results
+
+
+def _ocr_sources_in_pipeline(
+    pdf_document: fitz.Document,
+    sources: List[ImageSource],
+    threads: Dict[str, int],
+    queue_size: int,
+    report: RunReport,
+    ocr_args: OCRArgs,
+    fast_decode: bool = True,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    page_cache: Optional[PageCache] = None,
+    cache_keys: Sequence[str] = (),
+    skip: AbstractSet[int] = frozenset(),
+) -> List[List[StoredLine]]:
+    """
+    Runs decoding, preprocessing, OCR and text processing as overlapping stages.
+
+    Stages are connected by bounded queues, so a slow stage holds back the
+    ones before it and at most a few images per queue are in memory. The
+    decode stage has a single thread, since the PDF document must not be
+    used by two threads at once; the calling thread doesn't touch it
+    while the pipeline runs. Queue occupancy of each stage is saved in the
+    report.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (List[ImageSource]): Images to process
+        threads (Dict[str, int]): Number of threads of each stage
+        queue_size (int): Capacity of each queue between stages
+        report (RunReport): Report where timeouts and stage statistics are recorded
+        ocr_args (OCRArgs): Language, time budget, retry flag and options for ocr_image
+        fast_decode (bool): Whether to use the fast decode path
+        render_scale (float): Scale used to render pages without embedded images
+        page_cache (Optional[PageCache]): Cache where preprocessed images are stored
+        cache_keys (Sequence[str]): Cache key of each image
+        skip (AbstractSet[int]): Indexes in `sources` of images not to process
+
+    Returns:
+        List[List[StoredLine]]: Stored lines of each image not skipped, in
+            document order
+    """
+    lang, page_timeout, retry_on_timeout, ocr_options = ocr_args
+
+    # Items flow through the stages as (image number, source, payload)
+    def decode(item: Tuple[int, ImageSource]) -> Tuple[int, ImageSource, Any]:
+        image_number, source = item
+        print(f"Processing image {image_number}/{len(sources)}...")
+        image = load_image_source(pdf_document, source, render_scale, fast_decode)
+        return image_number, source, pack_if_binary(image, check_values=False)
+
+    def preprocess(item: Tuple[int, ImageSource, Any]) -> Tuple[int, ImageSource, Any]:
+        image_number, source, image = item
+        if image is None:
+            return item
+        # Thresholded pages wait for OCR bit-packed, and are unpacked right before it
+        processed = pack_if_binary(
+            preprocess_image(
+                np.asarray(image),
+                ocr_options["preprocessing"],
+                ocr_options.get("rotate", 0),
+            )
+        )
+        if page_cache is not None:
+            page_cache.put(cache_keys[image_number - 1], processed)
+        # The original is only kept when a timed-out image may be retried from it
+        original = image if page_timeout and retry_on_timeout else None
+        return image_number, source, (original, processed)
+
+    def ocr(item: Tuple[int, ImageSource, Any]) -> Tuple[ImageSource, OCRResult]:
+        image_number, source, images = item
+        if images is None:
+            return source, OCRResult()
+        image, processed = images
+        return source, ocr_image_with_budget(
+            image,
+            image_number,
+            lang,
+            page_timeout,
+            retry_on_timeout,
+            report,
+            preprocessed=processed,
+            **ocr_options,
+        )
+
+    def text(item: Tuple[ImageSource, OCRResult]) -> List[StoredLine]:
+        return stored_lines(*item)
+
+    functions: Dict[str, Callable[[Any], Any]] = {
+        "decode": decode,
+        "preprocess": preprocess,
+        "ocr": ocr,
+        "text": text,
+    }
+    staged = StagedPipeline(
+        [(name, functions[name], threads[name]) for name in PIPELINE_STAGES], queue_size
+    )
+
+    try:
+        return staged.run(
+            (i + 1, source) for i, source in enumerate(sources) if i not in skip
+        )
+    finally:
+        report.stage_stats = {stats.name: stats.to_dict() for stats in staged.stats}
+
+
+def _page_cache_keys(
+    page_keys: Dict[int, str],
+    sources: Sequence[ImageSource],
+    chain: Sequence[str],
+    tuned: bool = False,
+) -> List[str]:
+    """
+    Builds the page cache key of each image for a preprocessing chain.
+
+    Args:
+        page_keys (Dict[int, str]): Fingerprint of each page with the other settings
+        sources (Sequence[ImageSource]): Images to key
+        chain (Sequence[str]): Preprocessing steps
+        tuned (bool): Whether the chain was chosen by preprocessing='auto'. Tuned
+            images are keyed apart, so a later 'auto' run can tell which chain
+            was tuned for the document
+
+    Returns:
+        List[str]: Cache key of each image, in the order of `sources`
+    """
+    chain_key = json.dumps([AUTO_PREPROCESSING if tuned else None, list(chain)])
+    return [
+        PageCache.key(
+            f"{page_keys[source.page_number]}:{chain_key}", source.image_index
+        )
+        for source in sources
+    ]
+
+
+def _ocr_cached_sources(
+    page_cache: PageCache,
+    sources: List[ImageSource],
+    cache_keys: List[str],
+    workers: int,
+    ocr_args: OCRArgs,
+    report: RunReport,
+) -> Dict[int, List[StoredLine]]:
+    """
+    Applies OCR to the images found in the page cache, skipping decode and
+    preprocessing.
+
+    Entries are read by the worker threads right before their OCR call, so
+    at most `workers` cached images are in memory at a time.
+
+    Args:
+        page_cache (PageCache): Cache of preprocessed images
+        sources (List[ImageSource]): Images to process
+        cache_keys (List[str]): Cache key of each image
+        workers (int): Number of worker threads
+        ocr_args (OCRArgs): Language, time budget, retry flag and options for ocr_image
+        report (RunReport): Report where timeouts are recorded
+
+    Returns:
+        Dict[int, List[StoredLine]]: Stored lines by index in `sources`, for the
+            images read from the cache
+    """
+    lang, page_timeout, retry_on_timeout, ocr_options = ocr_args
+    # Cached images are already rotated; a timed-out retry must not rotate them again
+    cached_options = dict(ocr_options, rotate=0)
+
+    def ocr_cached(index: int) -> Optional[List[StoredLine]]:
+        image = page_cache.get(cache_keys[index])
+        if image is None:
+            return None
+        print(f"Processing cached image {index+1}/{len(sources)}...")
+        ocr_result = ocr_image_with_budget(
+            image,
+            index + 1,
+            lang,
+            page_timeout,
+            retry_on_timeout,
+            report,
+            preprocessed=image,
+            **cached_options,
+        )
+        return stored_lines(sources[index], ocr_result)
+
+    indexes = [i for i, key in enumerate(cache_keys) if key in page_cache]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return {
+            index: lines
+            for index, lines in zip(indexes, executor.map(ocr_cached, indexes))
+            if lines is not None
+        }
+
+
+def _ocr_shared_image(
+    handle: PageBufferHandle,
+    image_number: int,
+    lang: str,
+    page_timeout: Optional[float],
+    retry_on_timeout: bool,
+    ocr_options: Dict[str, Any],
+) -> Tuple[OCRResult, RunReport]:
+    """
+    Worker process entry point: applies OCR to an image in shared memory.
+
+    Args:
+        handle (PageBufferHandle): Shared image to process
+        image_number (int): 1-based number of the image
+        lang (str): Language for OCR
+        page_timeout (Optional[float]): Time budget in seconds
+        retry_on_timeout (bool): Whether to retry once with a simplified image
+        ocr_options (Dict[str, Any]): Options passed to ocr_image
+
+    Returns:
+        Tuple[OCRResult, RunReport]: OCR output and the timeouts recorded by the worker
+    """
+    report = RunReport()
+
+    with attach_page_buffer(handle) as image:
+        ocr_result = ocr_image_with_budget(
+            image,
+            image_number,
+            lang,
+            page_timeout,
+            retry_on_timeout,
+            report,
+            **ocr_options,
+        )
+
+    return ocr_result, report
+
+
+def ocr_image_with_budget(
+    image: PageImage,
+    image_number: int,
+    lang: str,
+    page_timeout: Optional[float],
+    retry_on_timeout: bool,
+    report: RunReport,
+    preprocessed: Optional[PageImage] = None,
+    **ocr_options: Any,
+) -> OCRResult:
+    """
+    Applies OCR to an image within the per-image time budget.
+
+    Args:
+        image (PageImage): Image to process
+        image_number (int): 1-based number of the image, used in the report
+        lang (str): Language for OCR
+        page_timeout (Optional[float]): Time budget in seconds
+        retry_on_timeout (bool): Whether to retry once with a simplified image
+        report (RunReport): Report where timeouts are recorded
+        preprocessed (Optional[PageImage]): The image already preprocessed, possibly
+            bit-packed, used for the first attempt instead of preprocessing it again
+        **ocr_options: Options passed to ocr_image (config, preprocessing, rotate)
+
+    Returns:
+        OCRResult: OCR output, empty if the budget was exceeded
+    """
+    try:
+        if preprocessed is not None:
+            first_options = dict(ocr_options, preprocessing="none", rotate=0)
+            return ocr_image(preprocessed, lang, timeout=page_timeout, **first_options)
+        return ocr_image(image, lang, timeout=page_timeout, **ocr_options)
+    except OCRTimeoutError:
+        print(f"Image {image_number} exceeded the time budget of {page_timeout}s.")
+
+    if not retry_on_timeout:
+        report.record_timeout(image_number, retried=False, recovered=False)
+        return OCRResult()
+
+    print(f"Retrying image {image_number} with a simplified copy...")
+    try:
+        ocr_result = ocr_image(
+            simplify_image(image), lang, timeout=page_timeout, **ocr_options
+        )
+    except OCRTimeoutError:
+        print(f"Image {image_number} timed out again, skipping.")
+        report.record_timeout(image_number, retried=True, recovered=False)
+        return OCRResult()
+
+    report.record_timeout(image_number, retried=True, recovered=True)
+    return ocr_result
+
+
+def extract_and_save(
+    pdf_path: str,
+    output_file: str = "extracted_text.txt",
+    lang: str = "eng",
+    validate: bool = True,
+    output_format: str = "txt",
+    index_path: Optional[str] = None,
+    **options: Any,
+) -> List[str]:
     """
     Extracts text from a PDF and saves to file.
-    
+
     Args:
         pdf_path (str): Path to the PDF file
         output_file (str): Output file name
         lang (str): Language for OCR
         validate (bool): Whether to validate extracted lines
-        
+        output_format (str): 'txt' (one line per row), 'jsonl' or 'parquet'
+            (with page, source image, box and confidence)
+        index_path (Optional[str]): Full-text index (SQLite) where the lines are added
+            for `ocr-pdf-reader search` (default: no index)
+        **options: Additional options passed to extract_results_from_pdf
+            (page_timeout, report, workers, ...)
+
     Returns:
         List[str]: List of extracted text lines
+
+    Raises:
+        ValueError: If the output format is unknown
     """
-    text_lines = extract_text_from_pdf(pdf_path, lang, validate)
-    
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    result = extract_results_from_pdf(pdf_path, lang, validate, **options)
+    return save_result(result, pdf_path, output_file, output_format, index_path)
+
+
+def save_result(
+    result: ExtractionResult,
+    pdf_path: str,
+    output_file: str = "extracted_text.txt",
+    output_format: str = "txt",
+    index_path: Optional[str] = None,
+) -> List[str]:
+    """
+    Saves extracted lines to a file and optionally adds them to a search index.
+
+    Args:
+        result (ExtractionResult): Extracted lines
+        pdf_path (str): Path of the PDF the lines come from
+        output_file (str): Output file name
+        output_format (str): 'txt', 'jsonl' or 'parquet'
+        index_path (Optional[str]): Full-text index where the lines are added
+
+    Returns:
+        List[str]: List of extracted text lines
+
+    Raises:
+        ValueError: If the output format is unknown
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    text_lines = list(result.texts)
+
     if text_lines:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for line in text_lines:
-                f.write(line + '\n')
-        
+        if output_format == "jsonl":
+            result.to_jsonl(output_file)
+        elif output_format == "parquet":
+            result.to_parquet(output_file)
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                for line in text_lines:
+                    f.write(line + "\n")
+
         print(f"Text saved to: {output_file}")
-    
-    return text_lines 
\ No newline at end of file
+
+    if index_path:
+        with SearchIndex(index_path) as index:
+            if index.add_document(pdf_path, result):
+                print(f"Indexed {len(result)} line(s) in: {index_path}")
+
+    return text_lines
@@ -0,0 +1,349 @@
+"""
+Corpus-wide line deduplication.
+
+This module contains functions for:
+- Hashing lines to compact 64-bit keys
+- A persistent index of line hashes and occurrence counts, shared across
+  pages, documents and runs, with an optional Bloom filter in front
+- Keeping only the first occurrence of each line, or annotating lines
+  with their occurrence count
+"""
+
+import hashlib
+import math
+import os
+import threading
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .results import ExtractionResult
+
+
+DEDUP_INDEX_VERSION = 1
+
+# Modes accepted by DedupIndex.apply
+DEDUP_MODES = ("first", "count")
+
+DEFAULT_BLOOM_ERROR_RATE = 0.01
+
+
+def line_hash(text: str) -> int:
+    """
+    Computes the 64-bit key of a line.
+
+    Whitespace is collapsed first, so lines that only differ in spacing
+    share a key.
+
+    Args:
+        text (str): Line text
+
+    Returns:
+        int: Unsigned 64-bit hash
+    """
+    normalized = " ".join(text.split()).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(normalized, digest_size=8).digest(), "little")
+
+
+def line_hashes(texts: Sequence[str]) -> np.ndarray:
+    """
+    Computes the 64-bit keys of several lines.
+
+    Args:
+        texts (Sequence[str]): Line texts
+
+    Returns:
+        np.ndarray: uint64 array of hashes
+    """
+    hashes: np.ndarray = np.fromiter(
+        (line_hash(text) for text in texts), dtype=np.uint64, count=len(texts)
+    )
+    return hashes
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 64-bit hashes.
+
+    Bit positions come from double hashing of the two 32-bit halves of the
+    key. The size is fixed at creation, so memory stays predictable; past
+    its capacity the filter only answers "maybe" more often.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+        bits: Optional[np.ndarray] = None,
+    ):
+        """
+        Args:
+            capacity (int): Expected number of distinct keys
+            error_rate (float): False-positive rate at capacity
+            bits (Optional[np.ndarray]): Packed bits of a saved filter
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        bit_count = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.bit_count = max(8, bit_count)
+        self.hash_count = max(1, round(self.bit_count / self.capacity * math.log(2)))
+        self.bits = (
+            bits if bits is not None else np.zeros((self.bit_count + 7) // 8, np.uint8)
+        )
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        """Bit positions of each key, one row per key."""
+        low = hashes & np.uint64(0xFFFFFFFF)
+        high = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.hash_count, dtype=np.uint64)
+        positions: np.ndarray = (
+            low[:, None] + steps[None, :] * high[:, None]
+        ) % np.uint64(self.bit_count)
+        return positions
+
+    def add(self, hashes: np.ndarray) -> None:
+        """
+        Adds keys to the filter.
+
+        Args:
+            hashes (np.ndarray): uint64 keys
+        """
+        positions = self._positions(hashes).ravel()
+        np.bitwise_or.at(
+            self.bits,
+            positions >> np.uint64(3),
+            (1 << (positions & np.uint64(7))).astype(np.uint8),
+        )
+
+    def might_contain(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Tests keys against the filter.
+
+        Args:
+            hashes (np.ndarray): uint64 keys
+
+        Returns:
+            np.ndarray: False for keys that were certainly never added
+        """
+        positions = self._positions(hashes)
+        set_bits = (
+            self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7))
+        ) & 1
+        contained: np.ndarray = set_bits.all(axis=1)
+        return contained
+
+
+class DedupIndex:
+    """
+    Sorted array of 64-bit line hashes with occurrence counts.
+
+    Memory is 12 bytes per distinct line (a uint64 hash and a uint32 count),
+    about 12 MB per million lines, plus about 1.2 MB per million of capacity
+    for the optional Bloom filter at a 1% error rate. Lookups are binary
+    searches over the whole batch at once; the Bloom filter skips them for
+    lines that are certainly new. Different lines with the same 64-bit hash
+    are counted as one, which is negligible below billions of lines.
+    """
+
+    def __init__(
+        self,
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+    ):
+        """
+        Args:
+            bloom_capacity (Optional[int]): Expected number of distinct lines for the
+                Bloom filter (default: no Bloom filter)
+            bloom_error_rate (float): False-positive rate of the Bloom filter at
+                capacity
+        """
+        self._hashes = np.empty(0, np.uint64)
+        self._counts = np.empty(0, np.uint32)
+        self.bloom = (
+            BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, text: str) -> bool:
+        return self.count(text) > 0
+
+    def count(self, text: str) -> int:
+        """
+        Returns how many times a line was seen.
+
+        Args:
+            text (str): Line text
+
+        Returns:
+            int: Occurrence count, 0 for an unknown line
+        """
+        found, positions = self._lookup(np.array([line_hash(text)], np.uint64))
+        return int(self._counts[positions[0]]) if found[0] else 0
+
+    def memory_bytes(self) -> int:
+        """Memory used by the hash, count and Bloom filter arrays, in bytes."""
+        bloom_bytes = self.bloom.bits.nbytes if self.bloom else 0
+        return int(self._hashes.nbytes + self._counts.nbytes + bloom_bytes)
+
+    def _lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds keys in the sorted array: (found mask, insertion positions)."""
+        # searchsorted is typed as returning a scalar; it returns an array here
+        positions: np.ndarray = np.asarray(np.searchsorted(self._hashes, hashes))
+        found = np.zeros(len(hashes), bool)
+
+        candidates = positions < len(self._hashes)
+        if self.bloom is not None:
+            candidates &= self.bloom.might_contain(hashes)
+
+        found[candidates] = self._hashes[positions[candidates]] == hashes[candidates]
+        return found, positions
+
+    def update(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Counts a batch of lines, in order.
+
+        Each batch that brings new lines rewrites the arrays once, which is
+        linear in the size of the index, so lines should be counted a whole
+        document at a time rather than one by one.
+
+        Args:
+            texts (Sequence[str]): Lines to count
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: For each line, whether it is the
+                first occurrence within the batch, how many times it was seen before
+                the batch, and its total count after the batch
+        """
+        hashes = line_hashes(texts)
+        unique, first_indexes, inverse, batch_counts = np.unique(
+            hashes, return_index=True, return_inverse=True, return_counts=True
+        )
+
+        with self._lock:
+            found, positions = self._lookup(unique)
+            previous = np.zeros(len(unique), np.int64)
+            previous[found] = self._counts[positions[found]]
+
+            totals = np.minimum(previous + batch_counts, np.iinfo(np.uint32).max)
+            self._counts[positions[found]] = totals[found]
+
+            # One merge per batch: both runs are sorted, so the stable sort
+            # (timsort) merges them in a single linear pass
+            new = ~found
+            if new.any():
+                merged = np.concatenate((self._hashes, unique[new]))
+                order = np.argsort(merged, kind="stable")
+                self._hashes = merged[order]
+                self._counts = np.concatenate(
+                    (self._counts, totals[new].astype(np.uint32))
+                )[order]
+                if self.bloom is not None:
+                    self.bloom.add(unique[new])
+
+        first_in_batch = np.zeros(len(hashes), bool)
+        first_in_batch[first_indexes] = True
+
+        return first_in_batch, previous[inverse], totals[inverse]
+
+    def apply(self, result: ExtractionResult, mode: str = "first") -> ExtractionResult:
+        """
+        Deduplicates a result against the index and adds its lines to it.
+
+        Args:
+            result (ExtractionResult): Lines of a document
+            mode (str): 'first' keeps only lines never seen before in the index;
+                'count' keeps the first occurrence of each line in the document
+                and stores its total count in `occurrences`
+
+        Returns:
+            ExtractionResult: Deduplicated result
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup mode: {mode}")
+
+        first_in_batch, previous, totals = self.update(result.texts)
+        deduplicated = ExtractionResult()
+
+        for index, record in enumerate(result):
+            if not first_in_batch[index]:
+                continue
+            if mode == "first" and previous[index]:
+                continue
+            occurrences = int(totals[index]) if mode == "count" else 1
+            deduplicated.append(
+                record.text,
+                record.page,
+                record.image_index,
+                record.bbox,
+                record.confidence,
+                occurrences,
+            )
+
+        return deduplicated
+
+    @classmethod
+    def load(
+        cls, index_path: str, bloom_capacity: Optional[int] = None
+    ) -> "DedupIndex":
+        """
+        Loads an index, or creates an empty one if the file doesn't exist or
+        was written by another index version.
+
+        A saved Bloom filter is kept as it is. If the saved index has none and
+        a capacity is given, the filter is built from the loaded hashes.
+
+        Args:
+            index_path (str): Path of the .npz index
+            bloom_capacity (Optional[int]): Bloom filter capacity for an index
+                saved without one
+
+        Returns:
+            DedupIndex: Loaded index
+        """
+        index = cls(bloom_capacity)
+        if not os.path.exists(index_path):
+            return index
+
+        with np.load(index_path) as data:
+            version, capacity = (int(value) for value in data["meta"][:2])
+            if version != DEDUP_INDEX_VERSION:
+                return index
+
+            index._hashes = data["hashes"]
+            index._counts = data["counts"]
+            if capacity:
+                index.bloom = BloomFilter(
+                    capacity, float(data["error_rate"]), data["bloom"]
+                )
+            elif bloom_capacity:
+                index.bloom = BloomFilter(max(bloom_capacity, len(index._hashes)))
+                index.bloom.add(index._hashes)
+
+        return index
+
+    def save(self, index_path: str) -> None:
+        """
+        Saves the index atomically.
+
+        Args:
+            index_path (str): Path of the .npz index
+        """
+        capacity = self.bloom.capacity if self.bloom else 0
+        temp_path = index_path + ".tmp"
+
+        with self._lock, open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array([DEDUP_INDEX_VERSION, capacity], np.int64),
+                error_rate=np.float64(self.bloom.error_rate if self.bloom else 0.0),
+                hashes=self._hashes,
+                counts=self._counts,
+                bloom=self.bloom.bits if self.bloom else np.empty(0, np.uint8),
+            )
+        os.replace(temp_path, index_path)
@@ -0,0 +1,254 @@
+"""
+Language and orientation detection for the OCR PDF Reader.
+
+This module contains functions for:
+- Detecting page rotation and script with Tesseract OSD
+- Classifying the language of sample text among candidate languages
+- Detecting once per document, on one or two downscaled sample pages,
+  which language model and rotation the remaining pages need
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import fitz  # PyMuPDF
+import numpy as np
+import pytesseract
+
+from .image_processor import (
+    ImageSource,
+    PageImage,
+    load_image_source,
+    ocr_image,
+    sample_image_sources,
+    RENDER_RESOLUTION_MULTIPLIER,
+)
+
+
+# Languages tried by --lang auto when none are given
+DEFAULT_AUTO_LANGUAGES = "eng+por+spa"
+
+# Pages sampled per document
+DETECTION_SAMPLE_PAGES = 2
+
+# Sample pages are downscaled so their longest side is at most this many pixels
+DETECTION_MAX_SIDE = 1600
+
+# OSD orientations below this confidence are ignored
+MIN_ORIENTATION_CONFIDENCE = 2.0
+
+# Tesseract model for scripts that identify the language on their own
+SCRIPT_LANGUAGES: Dict[str, str] = {
+    "Arabic": "ara",
+    "Cyrillic": "rus",
+    "Devanagari": "hin",
+    "Greek": "ell",
+    "Han": "chi_sim",
+    "Hangul": "kor",
+    "Hebrew": "heb",
+    "Japanese": "jpn",
+    "Thai": "tha",
+}
+
+# Frequent short words of each language
+LANGUAGE_STOPWORDS: Dict[str, frozenset] = {
+    "eng": frozenset(
+        "the and of to in is for with on that by from this are be or".split()
+    ),
+    "por": frozenset(
+        "de da do das dos em para com não uma um os ao às pela pelo são".split()
+    ),
+    "spa": frozenset("de la el los las del en para con una un por y es al su".split()),
+    "fra": frozenset(
+        "le la les des du de et en pour avec une un sur est au aux".split()
+    ),
+    "deu": frozenset(
+        "der die das und mit für von zu den ein eine ist auf im dem".split()
+    ),
+}
+
+# Letters that only occur in some of the languages
+LANGUAGE_CHARACTERS: Dict[str, str] = {
+    "eng": "",
+    "por": "ãõçâêô",
+    "spa": "ñ¿¡",
+    "fra": "èêëîïûùœç",
+    "deu": "äöüß",
+}
+
+# A letter counts as much as this many stopwords
+CHARACTER_WEIGHT = 3
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+@dataclass
+class DocumentLanguage:
+    """Language model and rotation chosen for a document."""
+
+    language: str
+    rotate: int = 0
+    script: str = ""
+    sampled_pages: List[int] = field(default_factory=list)
+
+
+def detect_orientation(image: PageImage) -> Tuple[int, str, float]:
+    """
+    Runs Tesseract orientation and script detection (OSD) on an image.
+
+    Args:
+        image (PageImage): Image to analyze
+
+    Returns:
+        Tuple[int, str, float]: Clockwise rotation in degrees that makes the text
+            upright, script name and orientation confidence; (0, "", 0.0) if OSD
+            failed, e.g. because the page has too little text
+    """
+    try:
+        osd = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
+    except Exception as e:
+        print(f"Orientation detection failed: {e}")
+        return 0, "", 0.0
+
+    return (
+        int(osd.get("rotate", 0)),
+        str(osd.get("script", "")),
+        float(osd.get("orientation_conf", 0)),
+    )
+
+
+def classify_language(text: str, candidates: Sequence[str]) -> Optional[str]:
+    """
+    Picks the candidate language whose stopwords and letters appear most in a text.
+
+    Args:
+        text (str): Sample text
+        candidates (Sequence[str]): Tesseract language codes to choose from
+
+    Returns:
+        Optional[str]: Best language, or None if no candidate scores or the best two tie
+    """
+    words = [word.lower() for word in _WORD_PATTERN.findall(text)]
+    letters = Counter(text.lower())
+    scores = {}
+
+    for language in candidates:
+        stopwords = LANGUAGE_STOPWORDS.get(language, frozenset())
+        score = sum(word in stopwords for word in words)
+        characters = LANGUAGE_CHARACTERS.get(language, "")
+        score += CHARACTER_WEIGHT * sum(letters[char] for char in characters)
+        scores[language] = score
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    if (
+        not ranked
+        or ranked[0][1] == 0
+        or (len(ranked) > 1 and ranked[0][1] == ranked[1][1])
+    ):
+        return None
+    return ranked[0][0]
+
+
+def _downscale(image: PageImage, max_side: int = DETECTION_MAX_SIDE) -> np.ndarray:
+    """Shrinks an image so its longest side is at most max_side pixels."""
+    array: np.ndarray = np.asarray(image)
+    if array.dtype == bool:
+        array = array.astype(np.uint8) * 255
+
+    height, width = array.shape[:2]
+    scale = max_side / max(height, width)
+    if scale >= 1:
+        return array
+    resized: np.ndarray = cv2.resize(
+        array,
+        (max(1, int(width * scale)), max(1, int(height * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+    return resized
+
+
+def _installed_languages() -> Optional[List[str]]:
+    """Returns the installed Tesseract models, or None if they can't be listed."""
+    try:
+        languages: List[str] = pytesseract.get_languages(config="")
+        return languages
+    except Exception:
+        return None
+
+
+def detect_document_language(
+    pdf_document: fitz.Document,
+    sources: Sequence[ImageSource],
+    candidates: str = DEFAULT_AUTO_LANGUAGES,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    fast_decode: bool = True,
+    sample_pages: int = DETECTION_SAMPLE_PAGES,
+) -> DocumentLanguage:
+    """
+    Chooses the language model and rotation of a document from sample pages.
+
+    Each sample page is downscaled and analyzed with OSD for rotation and
+    script. Scripts such as Cyrillic or Arabic select their model directly;
+    Latin text is read once with all candidate models and classified by its
+    stopwords and letters. When the samples are inconclusive, all candidates
+    are kept, as with an explicit --lang eng+por+spa. Candidates without an
+    installed model are dropped first, when the models can be listed.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (Sequence[ImageSource]): Images of the document
+        candidates (str): Candidate languages joined by '+' (default: 'eng+por+spa')
+        render_scale (float): Scale used to render pages without embedded images
+        fast_decode (bool): Whether to use the fast decode path
+        sample_pages (int): Number of pages sampled (default: 2)
+
+    Returns:
+        DocumentLanguage: Language (one model, or the candidates) and rotation
+    """
+    installed = _installed_languages()
+    if installed is not None:
+        # Left as given if none is installed, so Tesseract names the missing model
+        candidates = (
+            "+".join(
+                language for language in candidates.split("+") if language in installed
+            )
+            or candidates
+        )
+
+    detection = DocumentLanguage(language=candidates)
+    rotations: Counter = Counter()
+    scripts: Counter = Counter()
+    texts = []
+
+    for source in sample_image_sources(sources, sample_pages):
+        image = load_image_source(pdf_document, source, render_scale, fast_decode)
+        if image is None:
+            continue
+
+        sample = _downscale(image)
+        rotate, script, confidence = detect_orientation(sample)
+        if confidence >= MIN_ORIENTATION_CONFIDENCE:
+            rotations[rotate] += 1
+        if script:
+            scripts[script] += 1
+
+        texts.append(ocr_image(sample, candidates, rotate=rotate).text)
+        detection.sampled_pages.append(source.page_number + 1)
+
+    if rotations:
+        detection.rotate = rotations.most_common(1)[0][0]
+    if scripts:
+        detection.script = scripts.most_common(1)[0][0]
+
+    script_language = SCRIPT_LANGUAGES.get(detection.script)
+    # Without a list of installed models, the script's model is assumed to be there
+    if script_language and (installed is None or script_language in installed):
+        detection.language = script_language
+    elif detection.script in ("", "Latin"):
+        language = classify_language("\n".join(texts), candidates.split("+"))
+        detection.language = language or candidates
+
+    return detection
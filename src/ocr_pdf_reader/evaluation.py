@@ -0,0 +1,341 @@
+"""
+Accuracy-vs-speed evaluation of pipeline presets.
+
+This module contains functions for:
+- Defining pipeline presets (render scale, Tesseract flags, preprocessing chain)
+- Generating synthetic PDFs from known text, so evaluation works offline
+- Measuring pages/s, character error rate and line recall for each preset
+- Formatting the results as a comparison table
+"""
+
+import contextlib
+import io
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import fitz  # PyMuPDF
+
+from .core import extract_text_from_pdf
+
+
+@dataclass
+class PipelinePreset:
+    """A combination of pipeline settings that trades accuracy for speed."""
+
+    name: str
+    render_scale: float
+    ocr_config: str
+    preprocessing: str
+
+
+@dataclass
+class PresetResult:
+    """Evaluation results of a preset over a corpus."""
+
+    preset: str
+    pages: int
+    seconds: float
+    character_error_rate: float
+    line_recall: float
+
+    @property
+    def pages_per_second(self) -> float:
+        """Throughput of the preset."""
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
+
+
+PRESETS: Dict[str, PipelinePreset] = {
+    "fast": PipelinePreset("fast", 1.0, r"--oem 3 --psm 6", "none"),
+    "balanced": PipelinePreset("balanced", 2.0, r"--oem 3 --psm 6", "default"),
+    "accurate": PipelinePreset("accurate", 3.0, r"--oem 1 --psm 6", "denoise"),
+}
+
+# Catalog-style descriptions used to build synthetic documents
+SAMPLE_DESCRIPTIONS = [
+    "INSTITUTE OF AFRICAN STUDIES - GR",
+    "ADMINISTRATIVE COORDINATION - GR",
+    "PROCESS ANALYSIS DIVISION - GR",
+    "PROTOCOL DIVISION - CCsA",
+    "PROGRAM SECRETARIAT - PROGEPE",
+    "HEXAGONAL SCREW WITH NUT",
+    "STAINLESS STEEL FLAT WASHER",
+    "ELECTRICAL CABLE FLEXIBLE COPPER",
+]
+
+# Extension of the ground-truth line file stored next to each PDF
+GROUND_TRUTH_SUFFIX = ".txt"
+
+
+def edit_distance(reference: str, hypothesis: str) -> int:
+    """
+    Computes the Levenshtein distance between two strings.
+
+    Args:
+        reference (str): Expected text
+        hypothesis (str): Obtained text
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions
+    """
+    if len(reference) < len(hypothesis):
+        reference, hypothesis = hypothesis, reference
+
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_char in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_char in enumerate(hypothesis, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_char != hyp_char),
+                )
+            )
+        previous = current
+
+    return previous[-1]
+
+
+def character_errors(
+    reference_lines: Sequence[str], extracted_lines: Sequence[str]
+) -> Tuple[int, int]:
+    """
+    Counts the character errors of extracted lines against the ground truth.
+
+    Args:
+        reference_lines (Sequence[str]): Ground-truth lines
+        extracted_lines (Sequence[str]): Lines returned by the pipeline
+
+    Returns:
+        Tuple[int, int]: Edit distance and length of the ground truth
+    """
+    reference = "\n".join(reference_lines)
+    hypothesis = "\n".join(extracted_lines)
+    return edit_distance(reference, hypothesis), len(reference)
+
+
+def character_error_rate(
+    reference_lines: Sequence[str], extracted_lines: Sequence[str]
+) -> float:
+    """
+    Computes the character error rate of extracted lines against the ground truth.
+
+    Args:
+        reference_lines (Sequence[str]): Ground-truth lines
+        extracted_lines (Sequence[str]): Lines returned by the pipeline
+
+    Returns:
+        float: Edit distance divided by the length of the ground truth
+    """
+    return _error_rate(*character_errors(reference_lines, extracted_lines))
+
+
+def line_recall(
+    reference_lines: Sequence[str], extracted_lines: Sequence[str]
+) -> float:
+    """
+    Computes the fraction of ground-truth lines found exactly in the output.
+
+    Args:
+        reference_lines (Sequence[str]): Ground-truth lines
+        extracted_lines (Sequence[str]): Lines returned by the pipeline
+
+    Returns:
+        float: Line-level recall between 0 and 1
+    """
+    if not reference_lines:
+        return 1.0
+
+    extracted = {" ".join(line.split()) for line in extracted_lines}
+    found = sum(1 for line in reference_lines if " ".join(line.split()) in extracted)
+    return found / len(reference_lines)
+
+
+def make_synthetic_pdf(
+    lines: Sequence[str], pdf_path: str, lines_per_page: int = 20, font_size: float = 11
+) -> None:
+    """
+    Writes a PDF with numbered lines and its ground-truth line file.
+
+    Lines are written as "N - DESCRIPTION", the format process_text_lines
+    expects, and the ground truth keeps only the descriptions.
+
+    Args:
+        lines (Sequence[str]): Descriptions to write
+        pdf_path (str): Path of the PDF to create
+        lines_per_page (int): Number of lines on each page
+        font_size (float): Font size of the text
+    """
+    document = fitz.open()
+
+    try:
+        for start in range(0, len(lines), lines_per_page):
+            page = document.new_page()
+            for offset, line in enumerate(lines[start : start + lines_per_page]):
+                position = fitz.Point(56, 72 + offset * font_size * 2)
+                page.insert_text(
+                    position, f"{start + offset + 1} - {line}", fontsize=font_size
+                )
+        document.save(pdf_path)
+    finally:
+        document.close()
+
+    with open(_ground_truth_path(pdf_path), "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+
+def make_synthetic_corpus(
+    directory: str, documents: int = 3, lines_per_document: int = 24
+) -> List[Tuple[str, str]]:
+    """
+    Generates a corpus of synthetic PDFs from the sample descriptions.
+
+    Args:
+        directory (str): Directory where the corpus is written
+        documents (int): Number of PDFs to generate
+        lines_per_document (int): Number of lines in each PDF
+
+    Returns:
+        List[Tuple[str, str]]: (PDF path, ground-truth path) pairs
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    for number in range(documents):
+        descriptions = len(SAMPLE_DESCRIPTIONS)
+        lines = [
+            f"{SAMPLE_DESCRIPTIONS[(number + i) % descriptions]} {chr(65 + i % 26)}"
+            for i in range(lines_per_document)
+        ]
+        make_synthetic_pdf(
+            lines, os.path.join(directory, f"synthetic_{number + 1:03d}.pdf")
+        )
+
+    return load_corpus(directory)
+
+
+def load_corpus(directory: str) -> List[Tuple[str, str]]:
+    """
+    Finds the PDFs of a directory that have a ground-truth line file.
+
+    Args:
+        directory (str): Corpus directory
+
+    Returns:
+        List[Tuple[str, str]]: (PDF path, ground-truth path) pairs, sorted by name
+    """
+    corpus = []
+
+    for pdf_path in sorted(Path(directory).glob("*.pdf")):
+        truth_path = _ground_truth_path(str(pdf_path))
+        if os.path.exists(truth_path):
+            corpus.append((str(pdf_path), truth_path))
+
+    return corpus
+
+
+def evaluate_presets(
+    corpus: Sequence[Tuple[str, str]],
+    presets: Optional[Sequence[PipelinePreset]] = None,
+    lang: str = "eng",
+) -> List[PresetResult]:
+    """
+    Runs every preset over the corpus and measures speed and quality.
+
+    Args:
+        corpus (Sequence[Tuple[str, str]]): (PDF path, ground-truth path) pairs
+        presets (Optional[Sequence[PipelinePreset]]): Presets to compare
+            (default: all entries of PRESETS)
+        lang (str): Language for OCR
+
+    Returns:
+        List[PresetResult]: One result per preset
+    """
+    if presets is None:
+        presets = list(PRESETS.values())
+
+    results = []
+
+    for preset in presets:
+        pages = 0
+        seconds = 0.0
+        errors = 0
+        reference_length = 0
+        reference_all: List[str] = []
+        extracted_all: List[str] = []
+
+        for pdf_path, truth_path in corpus:
+            with open(truth_path, encoding="utf-8") as f:
+                reference_lines = [line.strip() for line in f if line.strip()]
+            with fitz.open(pdf_path) as document:
+                pages += document.page_count
+
+            start = time.perf_counter()
+            # The pipeline progress output would drown the comparison table
+            with contextlib.redirect_stdout(io.StringIO()):
+                extracted_lines = extract_text_from_pdf(
+                    pdf_path,
+                    lang,
+                    render_scale=preset.render_scale,
+                    ocr_config=preset.ocr_config,
+                    preprocessing=preset.preprocessing,
+                )
+            seconds += time.perf_counter() - start
+
+            # Per document, since the edit distance is quadratic in the text length
+            document_errors, document_length = character_errors(
+                reference_lines, extracted_lines
+            )
+            errors += document_errors
+            reference_length += document_length
+            reference_all.extend(reference_lines)
+            extracted_all.extend(extracted_lines)
+
+        results.append(
+            PresetResult(
+                preset=preset.name,
+                pages=pages,
+                seconds=seconds,
+                character_error_rate=_error_rate(errors, reference_length),
+                line_recall=line_recall(reference_all, extracted_all),
+            )
+        )
+
+    return results
+
+
+def format_comparison_table(results: Sequence[PresetResult]) -> str:
+    """
+    Formats evaluation results as a text table.
+
+    Args:
+        results (Sequence[PresetResult]): Results to format
+
+    Returns:
+        str: Table with one row per preset
+    """
+    header = f"{'Preset':<12}{'Pages':>7}{'Pages/s':>10}{'CER':>9}{'Line recall':>13}"
+    rows = [header, "-" * len(header)]
+
+    for result in results:
+        rows.append(
+            f"{result.preset:<12}{result.pages:>7}{result.pages_per_second:>10.2f}"
+            f"{result.character_error_rate:>9.2%}{result.line_recall:>13.2%}"
+        )
+
+    return "\n".join(rows)
+
+
+def _ground_truth_path(pdf_path: str) -> str:
+    """Returns the ground-truth line file that belongs to a PDF."""
+    return os.path.splitext(pdf_path)[0] + GROUND_TRUTH_SUFFIX
+
+
+def _error_rate(errors: int, reference_length: int) -> float:
+    """Divides an edit distance by the ground-truth length; empty truths give 0 or 1."""
+    if not reference_length:
+        return 0.0 if not errors else 1.0
+    return errors / reference_length
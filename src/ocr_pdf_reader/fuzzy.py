@@ -0,0 +1,276 @@
+"""
+Fuzzy merging of near-duplicate OCR lines.
+
+This module contains functions for:
+- Character n-gram shingling and MinHash signatures of lines
+- Grouping near-duplicate lines with locality-sensitive hashing (LSH),
+  without comparing every pair of lines
+- Replacing each group by a canonical form
+"""
+
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from .results import ExtractionResult
+
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.7
+
+SHINGLE_SIZE = 3
+
+SIGNATURE_SIZE = 64
+
+# Mersenne prime used by the MinHash permutations; 32-bit shingle hashes
+# times 31-bit coefficients fit in 64 bits
+_MERSENNE_PRIME = (1 << 31) - 1
+
+_SEED = 20240531
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    Splits a line into overlapping character n-grams.
+
+    Whitespace is collapsed and the line is padded with spaces, so words at
+    the start and end contribute as many n-grams as the others.
+
+    Args:
+        text (str): Line text
+        size (int): Length of each n-gram
+
+    Returns:
+        Set[str]: Distinct n-grams of the line
+    """
+    normalized = f" {' '.join(text.split())} "
+    if len(normalized) <= size:
+        return {normalized}
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+def jaccard_similarity(first: Set[str], second: Set[str]) -> float:
+    """
+    Computes the Jaccard similarity of two shingle sets.
+
+    Args:
+        first (Set[str]): Shingles of one line
+        second (Set[str]): Shingles of the other line
+
+    Returns:
+        float: Size of the intersection over size of the union (0-1)
+    """
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def numeric_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Returns the tokens made mostly of digits, such as sizes and part numbers.
+
+    Lines that differ in these tokens ("M8" and "M10") describe different
+    items however similar their characters are, while an OCR slip inside a
+    word ("PARAFUS0") doesn't make the word numeric.
+
+    Args:
+        text (str): Line text
+
+    Returns:
+        Tuple[str, ...]: Numeric tokens in line order
+    """
+    return tuple(
+        token
+        for token in text.split()
+        if sum(char.isdigit() for char in token)
+        >= sum(char.isalpha() for char in token)
+    )
+
+
+def lsh_bands(
+    threshold: float, signature_size: int = SIGNATURE_SIZE
+) -> Tuple[int, int]:
+    """
+    Chooses the LSH banding whose similarity cut-off is closest to a threshold.
+
+    With b bands of r rows, two lines share a bucket with probability
+    1 - (1 - s^r)^b, which rises steeply around s = (1/b)^(1/r). The cut-off
+    is kept slightly below the threshold so few similar pairs are missed;
+    candidates are then checked against the exact threshold.
+
+    Args:
+        threshold (float): Jaccard similarity at which lines are merged
+        signature_size (int): Number of MinHash values per line
+
+    Returns:
+        Tuple[int, int]: Number of bands and rows per band
+    """
+    target = threshold * 0.9
+    options = [
+        (bands, signature_size // bands)
+        for bands in range(1, signature_size + 1)
+        if signature_size % bands == 0
+    ]
+    return min(
+        options, key=lambda option: abs((1 / option[0]) ** (1 / option[1]) - target)
+    )
+
+
+class MinHasher:
+    """MinHash signatures from a fixed family of random permutations."""
+
+    def __init__(self, signature_size: int = SIGNATURE_SIZE, seed: int = _SEED):
+        """
+        Args:
+            signature_size (int): Number of MinHash values per line
+            seed (int): Seed of the permutation coefficients
+        """
+        generator = np.random.default_rng(seed)
+        self.signature_size = signature_size
+        self._a = generator.integers(
+            1, _MERSENNE_PRIME, signature_size, dtype=np.uint64
+        )
+        self._b = generator.integers(
+            0, _MERSENNE_PRIME, signature_size, dtype=np.uint64
+        )
+
+    def signature(self, line_shingles: Set[str]) -> np.ndarray:
+        """
+        Computes the MinHash signature of a shingle set.
+
+        Args:
+            line_shingles (Set[str]): Shingles of a line
+
+        Returns:
+            np.ndarray: uint64 array of signature_size minimums
+        """
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in line_shingles),
+            dtype=np.uint64,
+            count=len(line_shingles),
+        )
+        permuted = self._a[:, None] * hashes[None, :] + self._b[:, None]
+        signature: np.ndarray = (permuted % np.uint64(_MERSENNE_PRIME)).min(axis=1)
+        return signature
+
+
+def cluster_similar_lines(
+    texts: Sequence[str], threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> List[int]:
+    """
+    Groups lines whose shingle sets are at least `threshold` similar and
+    whose numeric tokens are equal.
+
+    Each distinct text gets a MinHash signature, which is cut into bands;
+    lines that share a band land in the same bucket. Every bucket member is
+    only compared with the first member of the bucket, so the work grows
+    with the number of lines, not with the number of pairs. Groups are
+    joined transitively.
+
+    Args:
+        texts (Sequence[str]): Lines to group
+        threshold (float): Jaccard similarity at which lines are merged (0-1)
+
+    Returns:
+        List[int]: Cluster id of each line (the index of its first member)
+
+    Raises:
+        ValueError: If the threshold is not between 0 and 1
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"Similarity threshold must be between 0 and 1: {threshold}")
+
+    # Identical lines are grouped directly and hashed once
+    distinct: Dict[str, int] = {}
+    for text in texts:
+        distinct.setdefault(text, len(distinct))
+    distinct_texts = list(distinct)
+
+    parents = list(range(len(distinct_texts)))
+
+    def find(item: int) -> int:
+        while parents[item] != item:
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    hasher = MinHasher()
+    bands, rows = lsh_bands(threshold, hasher.signature_size)
+    line_shingles = [shingles(text) for text in distinct_texts]
+    line_numbers = [numeric_tokens(text) for text in distinct_texts]
+    buckets: Dict[Tuple[int, bytes], int] = {}
+
+    for item, item_shingles in enumerate(line_shingles):
+        signature = hasher.signature(item_shingles)
+        for band in range(bands):
+            key = (band, signature[band * rows : (band + 1) * rows].tobytes())
+            first = buckets.setdefault(key, item)
+            if first == item or find(first) == find(item):
+                continue
+            if line_numbers[first] != line_numbers[item]:
+                continue
+            if jaccard_similarity(line_shingles[first], item_shingles) >= threshold:
+                parents[find(item)] = find(first)
+
+    # Cluster ids point at the first line of each cluster in input order
+    first_lines: Dict[int, int] = {}
+    cluster_ids = []
+    for index, text in enumerate(texts):
+        root = find(distinct[text])
+        cluster_ids.append(first_lines.setdefault(root, index))
+
+    return cluster_ids
+
+
+def merge_similar_lines(
+    result: ExtractionResult, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> ExtractionResult:
+    """
+    Replaces each group of near-duplicate lines by one canonical line.
+
+    The canonical form is the most frequent variant of the group, then the
+    one with the highest mean confidence. It is kept at the position of the
+    group's first line, with the summed occurrences of the group.
+
+    Args:
+        result (ExtractionResult): Lines to merge
+        threshold (float): Jaccard similarity at which lines are merged (0-1)
+
+    Returns:
+        ExtractionResult: Merged result
+    """
+    texts = list(result.texts)
+    cluster_ids = cluster_similar_lines(texts, threshold)
+
+    # Per cluster and variant: [count, summed confidence, first index]
+    variants: Dict[int, Dict[str, List[float]]] = defaultdict(dict)
+    occurrences: Dict[int, int] = defaultdict(int)
+
+    for index, (text, cluster_id) in enumerate(zip(texts, cluster_ids)):
+        record = result[index]
+        stats = variants[cluster_id].setdefault(text, [0, 0.0, index])
+        stats[0] += 1
+        stats[1] += record.confidence
+        occurrences[cluster_id] += record.occurrences
+
+    merged = ExtractionResult()
+
+    for index, cluster_id in enumerate(cluster_ids):
+        if index != cluster_id:
+            continue
+        canonical = max(
+            variants[cluster_id].items(),
+            key=lambda item: (item[1][0], item[1][1] / item[1][0], -item[1][2]),
+        )[0]
+        record = result[index]
+        merged.append(
+            canonical,
+            record.page,
+            record.image_index,
+            record.bbox,
+            record.confidence,
+            occurrences[cluster_id],
+        )
+
+    return merged
@@ -0,0 +1,135 @@
+"""
+Memory-aware concurrency control for OCR work.
+
+This module contains functions for:
+- Estimating the memory needed to process an image from PDF metadata
+- Admitting work against a RAM budget, so large pages run alone and
+  small pages run many at a time
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .image_processor import ImageSource
+
+
+# Copies of the full-color image alive at the peak of processing:
+# pixmap samples, PPM bytes, PIL image and numpy array
+COLOR_COPIES = 4
+
+# Single-channel copies alive at the peak of processing:
+# grayscale, threshold, morphology output and the image sent to Tesseract
+GRAY_COPIES = 4
+
+# Fraction of the physical memory used when no budget is given
+DEFAULT_MEMORY_FRACTION = 0.5
+
+# Budget used when the physical memory cannot be determined
+FALLBACK_MEMORY_BUDGET = 2 * 1024**3
+
+
+def estimate_memory_bytes(source: ImageSource) -> int:
+    """
+    Estimates the peak memory needed to decode, preprocess and OCR an image.
+
+    Decoded pixmaps always use 8 bits per component, whatever the bit depth
+    of the embedded stream.
+
+    Args:
+        source (ImageSource): Image to estimate
+
+    Returns:
+        int: Estimated peak memory in bytes
+    """
+    return source.pixel_count * (source.components * COLOR_COPIES + GRAY_COPIES)
+
+
+def default_memory_budget() -> int:
+    """
+    Computes a memory budget from the physical memory of the machine.
+
+    Returns:
+        int: Memory budget in bytes
+    """
+    try:
+        total = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return FALLBACK_MEMORY_BUDGET
+
+    return int(total * DEFAULT_MEMORY_FRACTION)
+
+
+class MemoryGovernor:
+    """
+    Admits work items against a memory budget.
+
+    An item is admitted when its estimate fits in the remaining budget and
+    fewer than max_items are running. An item larger than the whole budget
+    is admitted only when nothing else is running, so it runs alone instead
+    of blocking forever.
+    """
+
+    def __init__(
+        self, budget_bytes: Optional[int] = None, max_items: Optional[int] = None
+    ):
+        """
+        Args:
+            budget_bytes (Optional[int]): Memory budget in bytes
+                (default: half of the physical memory)
+            max_items (Optional[int]): Maximum number of items admitted at once
+                (default: no limit)
+        """
+        self.budget_bytes = budget_bytes if budget_bytes else default_memory_budget()
+        self.max_items = max_items
+        self.in_use_bytes = 0
+        self.active_items = 0
+        self.peak_bytes = 0
+        self._condition = threading.Condition()
+
+    def _fits(self, nbytes: int) -> bool:
+        if self.active_items == 0:
+            return True
+        if self.max_items is not None and self.active_items >= self.max_items:
+            return False
+        return self.in_use_bytes + nbytes <= self.budget_bytes
+
+    def acquire(self, nbytes: int) -> None:
+        """
+        Blocks until an item of the given size can be admitted.
+
+        Args:
+            nbytes (int): Estimated memory of the item
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._fits(nbytes))
+            self.in_use_bytes += nbytes
+            self.active_items += 1
+            self.peak_bytes = max(self.peak_bytes, self.in_use_bytes)
+
+    def release(self, nbytes: int) -> None:
+        """
+        Returns the memory of a finished item to the budget.
+
+        Args:
+            nbytes (int): Estimate passed to acquire()
+        """
+        with self._condition:
+            self.in_use_bytes -= nbytes
+            self.active_items -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[None]:
+        """
+        Context manager that holds an admission for the duration of a block.
+
+        Args:
+            nbytes (int): Estimated memory of the item
+        """
+        self.acquire(nbytes)
+        try:
+            yield
+        finally:
+            self.release(nbytes)
@@ -3,8 +3,9 @@ Module for image processing and text extraction via OCR.
 
 This module contains functions for:
 - Extracting images from PDF files
+- Describing the images of a PDF before decoding them
 - Preprocessing images to improve OCR quality
-- Applying OCR to images to extract text
+- Applying OCR to images to extract text, word boxes and confidences
 """
 
 import fitz  # PyMuPDF
@@ -14,118 +15,707 @@ import cv2
 import numpy as np
 import io
 import os
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from .packed_page import PackedBinaryPage
 
-def preprocess_image(image_array: np.ndarray) -> np.ndarray:
+
+# Scale factor and median blur size used when retrying an image that
+# exceeded its OCR time budget
+RETRY_DOWNSCALE_FACTOR = 0.5
+RETRY_MEDIAN_BLUR_SIZE = 3
+
+# Tesseract flags used by default: LSTM engine, uniform block of text
+DEFAULT_OCR_CONFIG = r"--oem 3 --psm 6"
+
+# Neighbourhood size and offset of the adaptive threshold
+ADAPTIVE_BLOCK_SIZE = 31
+ADAPTIVE_OFFSET = 10
+
+# Scale used to render pages that have no embedded images
+RENDER_RESOLUTION_MULTIPLIER = 2.0
+
+# Resolution that OCR needs; embedded JPEGs above twice this are decoded at reduced
+# scale
+TARGET_OCR_DPI = 300
+
+# cv2.imdecode flags for each JPEG reduction factor, largest first
+JPEG_REDUCED_GRAYSCALE_FLAGS = [
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+]
+
+# An image as passed to OCR: a PIL image, a grayscale uint8 array or,
+# for bilevel scans, a boolean array that is already binary; binary arrays
+# may be bit-packed while they wait, and are unpacked by np.asarray()
+PageImage = Union[Image.Image, np.ndarray, PackedBinaryPage]
+
+# Number of color components for the colorspace names reported by get_images()
+COLORSPACE_COMPONENTS = {
+    "DeviceGray": 1,
+    "DeviceRGB": 3,
+    "DeviceCMYK": 4,
+}
+
+
+class OCRTimeoutError(RuntimeError):
+    """Raised when the OCR call for an image exceeds its time budget."""
+
+
+@dataclass
+class ImageSource:
+    """
+    Describes an image of a PDF that will be passed to OCR, without decoding it.
+
+    Embedded images are identified by their xref; pages without embedded
+    images are rendered and have xref 0.
+    """
+
+    page_number: int
+    image_index: int
+    xref: int
+    width: int
+    height: int
+    components: int
+    bits_per_component: int = 8
+
+    @property
+    def rendered(self) -> bool:
+        """Whether the image is a rendered page rather than an embedded image."""
+        return self.xref == 0
+
+    @property
+    def pixel_count(self) -> int:
+        """Number of pixels of the decoded image."""
+        return self.width * self.height
+
+
+@dataclass
+class OCRWord:
+    """A word recognized by Tesseract, with its box in preprocessed-image pixels."""
+
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    confidence: float
+
+
+@dataclass
+class OCRResult:
+    """Text of an image together with the words it was built from."""
+
+    text: str = ""
+    words: List[OCRWord] = field(default_factory=list)
+
+    @property
+    def mean_confidence(self) -> float:
+        """Mean word confidence (0-100), or -1 if no word was recognized."""
+        if not self.words:
+            return -1.0
+        return sum(word.confidence for word in self.words) / len(self.words)
+
+
+def _to_grayscale(image_array: np.ndarray) -> np.ndarray:
+    """Converts an RGB image to grayscale, leaving grayscale images untouched."""
+    if len(image_array.shape) == 3:
+        return cv2.cvtColor(image_array, cv2.COLOR_RGB2GRAY)
+    return image_array
+
+
+def _otsu_threshold(gray: np.ndarray) -> np.ndarray:
+    """Applies a global Otsu threshold to improve contrast."""
+    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return thresh
+
+
+def _adaptive_threshold(gray: np.ndarray) -> np.ndarray:
+    """Applies a local threshold, which handles faded or unevenly lit scans."""
+    return cv2.adaptiveThreshold(
+        gray,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        ADAPTIVE_BLOCK_SIZE,
+        ADAPTIVE_OFFSET,
+    )
+
+
+def _morphology_close(binary: np.ndarray) -> np.ndarray:
+    """Removes noise with a morphological close."""
+    kernel = np.ones((1, 1), np.uint8)
+    return cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+
+
+def _denoise(gray: np.ndarray) -> np.ndarray:
+    """Removes speckle noise with a median blur."""
+    return cv2.medianBlur(gray, RETRY_MEDIAN_BLUR_SIZE)
+
+
+def _downscale(gray: np.ndarray) -> np.ndarray:
+    """Halves the resolution, which speeds up OCR on oversampled images."""
+    height, width = gray.shape[:2]
+    new_size = (max(1, width // 2), max(1, height // 2))
+    return cv2.resize(gray, new_size, interpolation=cv2.INTER_AREA)
+
+
+# Preprocessing steps that can be combined into chains
+PREPROCESSING_STEPS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "grayscale": _to_grayscale,
+    "otsu": _otsu_threshold,
+    "adaptive": _adaptive_threshold,
+    "close": _morphology_close,
+    "denoise": _denoise,
+    "downscale": _downscale,
+}
+
+# Named preprocessing chains; 'default' is the original fixed chain
+PREPROCESSING_CHAINS: Dict[str, Tuple[str, ...]] = {
+    "default": ("grayscale", "otsu", "close"),
+    "none": ("grayscale",),
+    "adaptive": ("grayscale", "adaptive", "close"),
+    "denoise": ("grayscale", "denoise", "otsu", "close"),
+    "downscale": ("grayscale", "downscale", "otsu", "close"),
+}
+
+
+def resolve_preprocessing_chain(chain: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+    """
+    Resolves a chain name or a sequence of step names to step names.
+
+    Args:
+        chain (Union[str, Sequence[str]]): Name in PREPROCESSING_CHAINS or step names
+
+    Returns:
+        Tuple[str, ...]: Step names
+
+    Raises:
+        ValueError: If the chain or one of its steps is unknown
+    """
+    if isinstance(chain, str):
+        if chain not in PREPROCESSING_CHAINS:
+            raise ValueError(f"Unknown preprocessing chain: {chain}")
+        return PREPROCESSING_CHAINS[chain]
+
+    unknown = [step for step in chain if step not in PREPROCESSING_STEPS]
+    if unknown:
+        raise ValueError(f"Unknown preprocessing steps: {', '.join(unknown)}")
+    return tuple(chain)
+
+
+def preprocess_image(
+    image_array: np.ndarray,
+    chain: Union[str, Sequence[str]] = "default",
+    rotate: int = 0,
+) -> np.ndarray:
     """
     Preprocesses the image to improve OCR quality.
-    
+
     Args:
         image_array (np.ndarray): Image array to be processed
-        
+        chain (Union[str, Sequence[str]]): Preprocessing chain name or step names
+            (default: grayscale, Otsu threshold, noise removal)
+        rotate (int): Clockwise rotation in degrees (a multiple of 90) that makes
+            the text upright, as reported by Tesseract OSD (default: 0)
+
     Returns:
         np.ndarray: Processed image
     """
-    # Convert to grayscale if necessary
-    if len(image_array.shape) == 3:
-        gray = cv2.cvtColor(image_array, cv2.COLOR_RGB2GRAY)
+    steps = resolve_preprocessing_chain(chain)
+
+    if rotate % 360:
+        # np.rot90 turns counterclockwise, so clockwise degrees become negative turns
+        image_array = np.ascontiguousarray(np.rot90(image_array, k=-(rotate // 90)))
+
+    # Bilevel images are already binary, so thresholding is skipped
+    if image_array.dtype == bool:
+        return image_array.astype(np.uint8) * 255
+
+    processed = image_array
+    for step in steps:
+        processed = PREPROCESSING_STEPS[step](processed)
+
+    return processed
+
+
+def open_pdf(pdf_path: str) -> fitz.Document:
+    """
+    Opens a PDF file with PyMuPDF.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+
+    Returns:
+        fitz.Document: Opened document
+
+    Raises:
+        FileNotFoundError: If the PDF file is not found
+    """
+    if not os.path.exists(pdf_path):
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    return fitz.open(pdf_path)
+
+
+def list_image_sources(
+    pdf_document: fitz.Document,
+    resolution_multiplier: float = RENDER_RESOLUTION_MULTIPLIER,
+) -> List[ImageSource]:
+    """
+    Lists the images of a PDF using only metadata, without decoding pixels.
+
+    Embedded images take their size from get_images(); pages without
+    embedded images are described by the page rectangle times the render matrix.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        resolution_multiplier (float): Scale used to render pages without images
+
+    Returns:
+        List[ImageSource]: Image sources in document order
+    """
+    sources = []
+
+    for page_num in range(len(pdf_document)):
+        page = pdf_document[page_num]
+        image_list = page.get_images()
+
+        for img_index, img in enumerate(image_list):
+            xref, _, width, height, bpc, colorspace = img[:6]
+            components = 1 if bpc == 1 else COLORSPACE_COMPONENTS.get(colorspace, 3)
+            sources.append(
+                ImageSource(page_num, img_index, xref, width, height, components, bpc)
+            )
+
+        # If no embedded images found, the page will be rendered as image
+        if not image_list:
+            rect = page.rect * fitz.Matrix(resolution_multiplier, resolution_multiplier)
+            sources.append(
+                ImageSource(
+                    page_num,
+                    -1,
+                    0,
+                    int(np.ceil(rect.width)),
+                    int(np.ceil(rect.height)),
+                    3,
+                )
+            )
+
+    return sources
+
+
+def load_image_source(
+    pdf_document: fitz.Document,
+    source: ImageSource,
+    resolution_multiplier: float = RENDER_RESOLUTION_MULTIPLIER,
+    fast_decode: bool = False,
+) -> Optional[PageImage]:
+    """
+    Decodes the pixels of an image source.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        source (ImageSource): Image to decode
+        resolution_multiplier (float): Scale used to render pages without images
+        fast_decode (bool): Whether to decode straight to a grayscale or binary
+            array (see decode_image_source_fast) instead of a PIL image
+
+    Returns:
+        Optional[PageImage]: Decoded image, or None if its colorspace is not supported
+    """
+    if fast_decode:
+        return decode_image_source_fast(pdf_document, source, resolution_multiplier)
+    return decode_image_source_pil(pdf_document, source, resolution_multiplier)
+
+
+def decode_image_source_pil(
+    pdf_document: fitz.Document,
+    source: ImageSource,
+    resolution_multiplier: float = RENDER_RESOLUTION_MULTIPLIER,
+) -> Optional[Image.Image]:
+    """
+    Decodes an image source to a PIL image with its original colors.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        source (ImageSource): Image to decode
+        resolution_multiplier (float): Scale used to render pages without images
+
+    Returns:
+        Optional[Image.Image]: Decoded image, or None if it is not GRAY or RGB
+    """
+    if source.rendered:
+        page = pdf_document[source.page_number]
+        mat = fitz.Matrix(
+            resolution_multiplier, resolution_multiplier
+        )  # Increase resolution
+        pix = page.get_pixmap(matrix=mat)
     else:
-        gray = image_array
-    
-    # Apply threshold to improve contrast
-    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    
-    # Remove noise
-    kernel = np.ones((1, 1), np.uint8)
-    cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-    
-    return cleaned
+        pix = fitz.Pixmap(pdf_document, source.xref)
+
+        if pix.n - pix.alpha >= 4:  # Only GRAY or RGB are supported
+            return None
+
+    img_data = pix.tobytes("ppm")
+    return Image.open(io.BytesIO(img_data))
+
+
+def decode_image_source_fast(
+    pdf_document: fitz.Document,
+    source: ImageSource,
+    resolution_multiplier: float = RENDER_RESOLUTION_MULTIPLIER,
+) -> np.ndarray:
+    """
+    Decodes an image source straight to the array that preprocessing needs.
+
+    - Rendered pages are rendered directly in grayscale
+    - Embedded JPEGs are decoded to grayscale by OpenCV, at reduced scale
+      when their resolution exceeds what OCR needs. Their EXIF orientation
+      is ignored, as PDF renderers do; JPEGs with a /Decode array are left
+      to PyMuPDF, which applies it
+    - Bilevel scans (JBIG2, CCITT, 1-bit) become a boolean array that
+      bypasses thresholding
+    - Other images, including CMYK, are converted to grayscale by PyMuPDF
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        source (ImageSource): Image to decode
+        resolution_multiplier (float): Scale used to render pages without images
+
+    Returns:
+        np.ndarray: Grayscale uint8 array, or boolean array for bilevel images
+    """
+    if source.rendered:
+        page = pdf_document[source.page_number]
+        mat = fitz.Matrix(resolution_multiplier, resolution_multiplier)
+        return _pixmap_to_gray_array(
+            page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY)
+        )
+
+    if source.bits_per_component == 1:
+        gray = _pixmap_to_gray_array(fitz.Pixmap(pdf_document, source.xref))
+        binary: np.ndarray = gray > 127
+        return binary
+
+    image_info = pdf_document.extract_image(source.xref)
+
+    # CMYK JPEGs are left to PyMuPDF, which handles inverted Adobe streams
+    if (
+        image_info
+        and image_info["ext"] == "jpeg"
+        and image_info["colorspace"] in (1, 3)
+        and pdf_document.xref_get_key(source.xref, "Decode")[0] == "null"
+    ):
+        reduction = _jpeg_reduction_factor(pdf_document, source)
+        flag = dict(JPEG_REDUCED_GRAYSCALE_FLAGS).get(reduction, cv2.IMREAD_GRAYSCALE)
+        decoded: Optional[np.ndarray] = cv2.imdecode(
+            np.frombuffer(image_info["image"], np.uint8),
+            flag | cv2.IMREAD_IGNORE_ORIENTATION,
+        )
+
+        if decoded is not None:
+            return decoded
+
+    return _pixmap_to_gray_array(fitz.Pixmap(pdf_document, source.xref))
+
+
+def _pixmap_to_gray_array(pix: fitz.Pixmap) -> np.ndarray:
+    """
+    Converts a pixmap of any colorspace to a grayscale uint8 array.
+
+    Args:
+        pix (fitz.Pixmap): Pixmap to convert
+
+    Returns:
+        np.ndarray: Grayscale array of shape (height, width)
+    """
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)  # Drop the alpha channel
+
+    if pix.n != 1:
+        pix = fitz.Pixmap(fitz.csGRAY, pix)
+
+    samples = np.frombuffer(pix.samples, dtype=np.uint8)
+    gray: np.ndarray = samples.reshape(pix.height, pix.stride)[:, : pix.width]
+    return gray
+
+
+def _jpeg_reduction_factor(pdf_document: fitz.Document, source: ImageSource) -> int:
+    """
+    Chooses the JPEG decode reduction from the image's effective resolution.
+
+    The effective resolution is the image width divided by the width at
+    which it is displayed on the page.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        source (ImageSource): Embedded JPEG image
+
+    Returns:
+        int: Reduction factor (1, 2, 4 or 8)
+    """
+    page = pdf_document[source.page_number]
+    rects = page.get_image_rects(source.xref)
+
+    if not rects or rects[0].width <= 0:
+        return 1
+
+    effective_dpi = source.width / (rects[0].width / 72)
+
+    for factor, _ in JPEG_REDUCED_GRAYSCALE_FLAGS:
+        if effective_dpi / factor >= TARGET_OCR_DPI:
+            return factor
+
+    return 1
+
+
+def sample_image_sources(
+    sources: Sequence[ImageSource], count: int = 2
+) -> List[ImageSource]:
+    """
+    Picks representative images for per-document decisions: the largest
+    image of the first page, then of the middle page.
+
+    Args:
+        sources (Sequence[ImageSource]): Images of a document
+        count (int): Number of pages sampled, 1 or 2 (default: 2)
+
+    Returns:
+        List[ImageSource]: Sampled images, one per page
+    """
+    pages: Dict[int, ImageSource] = {}
+    for source in sources:
+        best = pages.get(source.page_number)
+        if best is None or source.pixel_count > best.pixel_count:
+            pages[source.page_number] = source
+
+    if not pages:
+        return []
+
+    page_numbers = sorted(pages)
+    picks = [page_numbers[0], page_numbers[len(page_numbers) // 2]][:count]
+    return [pages[page_number] for page_number in dict.fromkeys(picks)]
 
 
 def extract_images_from_pdf(pdf_path: str) -> List[Image.Image]:
     """
     Extracts all images from a PDF file.
-    
+
     Args:
         pdf_path (str): Path to the PDF file
-        
+
     Returns:
         List[Image.Image]: List of extracted images
-        
+
     Raises:
         FileNotFoundError: If the PDF file is not found
     """
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    
     images = []
-    pdf_document = fitz.open(pdf_path)
-    
+    pdf_document = open_pdf(pdf_path)
+
     try:
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            image_list = page.get_images()
-            
-            for img_index, img in enumerate(image_list):
-                # Extract the image
-                xref = img[0]
-                pix = fitz.Pixmap(pdf_document, xref)
-                
-                if pix.n - pix.alpha < 4:  # GRAY or RGB
-                    img_data = pix.tobytes("ppm")
-                    img_pil = Image.open(io.BytesIO(img_data))
-                    images.append(img_pil)
-                
-                pix = None
-            
-            # If no embedded images found, render page as image
-            if not image_list:
-                mat = fitz.Matrix(2.0, 2.0)  # Increase resolution
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
-                img_pil = Image.open(io.BytesIO(img_data))
+        for source in list_image_sources(pdf_document):
+            img_pil = decode_image_source_pil(pdf_document, source)
+
+            if img_pil is not None:
                 images.append(img_pil)
-                pix = None
-    
+
     finally:
         pdf_document.close()
-    
+
     return images
 
 
-def extract_text_from_image(image: Image.Image, lang: str = 'eng') -> str:
+def extract_text_from_image(
+    image: PageImage,
+    lang: str = "eng",
+    timeout: Optional[float] = None,
+    config: str = DEFAULT_OCR_CONFIG,
+    preprocessing: Union[str, Sequence[str]] = "default",
+    rotate: int = 0,
+) -> str:
     """
     Extracts text from an image using OCR.
-    
+
     Args:
-        image (Image.Image): Image to extract text from
+        image (PageImage): Image to extract text from
         lang (str): Language for OCR (default: 'eng' for English)
-        
+        timeout (Optional[float]): Time budget in seconds for the Tesseract call.
+            The Tesseract process is killed when it expires (default: no limit)
+        config (str): Tesseract flags (default: '--oem 3 --psm 6')
+        preprocessing (Union[str, Sequence[str]]): Preprocessing chain name or step
+            names
+        rotate (int): Clockwise rotation in degrees that makes the text upright
+
     Returns:
         str: Text extracted from the image
+
+    Raises:
+        OCRTimeoutError: If the OCR call exceeds the time budget
+    """
+    text = _run_tesseract(
+        pytesseract.image_to_string, image, lang, timeout, config, preprocessing, rotate
+    )
+    return text if text is not None else ""
+
+
+def ocr_image(
+    image: PageImage,
+    lang: str = "eng",
+    timeout: Optional[float] = None,
+    config: str = DEFAULT_OCR_CONFIG,
+    preprocessing: Union[str, Sequence[str]] = "default",
+    rotate: int = 0,
+) -> OCRResult:
+    """
+    Applies OCR to an image and keeps the box and confidence of every word.
+
+    The text is rebuilt from the words, one line per Tesseract line, with
+    single spaces between words. It differs from image_to_string() output
+    only in whitespace (blank lines between paragraphs, repeated spaces and
+    the final form feed), which process_text_lines collapses, so both give
+    the same processed lines. Word boxes are in pixels of the preprocessed
+    image Tesseract read, not in page coordinates.
+
+    Args:
+        image (PageImage): Image to extract text from
+        lang (str): Language for OCR (default: 'eng' for English)
+        timeout (Optional[float]): Time budget in seconds for the Tesseract call
+        config (str): Tesseract flags (default: '--oem 3 --psm 6')
+        preprocessing (Union[str, Sequence[str]]): Preprocessing chain name or step
+            names
+        rotate (int): Clockwise rotation in degrees that makes the text upright
+
+    Returns:
+        OCRResult: Text and words; empty if OCR failed
+
+    Raises:
+        OCRTimeoutError: If the OCR call exceeds the time budget
+    """
+    data = _run_tesseract(
+        pytesseract.image_to_data,
+        image,
+        lang,
+        timeout,
+        config,
+        preprocessing,
+        rotate,
+        output_type=pytesseract.Output.DICT,
+    )
+    if data is None:
+        return OCRResult()
+
+    words = []
+    lines: List[List[str]] = []
+    current_line = None
+
+    for i, word_text in enumerate(data["text"]):
+        word_text = word_text.strip()
+        if not word_text:
+            continue
+
+        line_key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        if line_key != current_line:
+            lines.append([])
+            current_line = line_key
+        lines[-1].append(word_text)
+
+        words.append(
+            OCRWord(
+                word_text,
+                int(data["left"][i]),
+                int(data["top"][i]),
+                int(data["width"][i]),
+                int(data["height"][i]),
+                float(data["conf"][i]),
+            )
+        )
+
+    text = "\n".join(" ".join(line) for line in lines)
+    return OCRResult(text, words)
+
+
+def _run_tesseract(
+    function: Callable[..., Any],
+    image: PageImage,
+    lang: str,
+    timeout: Optional[float],
+    config: str,
+    preprocessing: Union[str, Sequence[str]],
+    rotate: int,
+    **options: Any,
+) -> Optional[Any]:
+    """
+    Preprocesses an image and passes it to a pytesseract function.
+
+    Args:
+        function (Callable[..., Any]): pytesseract.image_to_string or image_to_data
+        image (PageImage): Image to extract text from
+        lang (str): Language for OCR
+        timeout (Optional[float]): Time budget in seconds for the Tesseract call
+        config (str): Tesseract flags
+        preprocessing (Union[str, Sequence[str]]): Preprocessing chain name or step
+            names
+        rotate (int): Clockwise rotation in degrees that makes the text upright
+        **options: Other arguments of the pytesseract function (output_type)
+
+    Returns:
+        Optional[Any]: Output of the function, or None if OCR failed
+
+    Raises:
+        OCRTimeoutError: If the OCR call exceeds the time budget
     """
     try:
-        # Convert PIL to numpy array
-        img_array = np.array(image)
-        
-        # Preprocess the image
-        processed_img = preprocess_image(img_array)
-        
-        # Apply OCR
-        custom_config = r'--oem 3 --psm 6'
-        text = pytesseract.image_to_string(processed_img, lang=lang, config=custom_config)
-        
-        return text
+        processed_img = preprocess_image(np.asarray(image), preprocessing, rotate)
+        return function(
+            processed_img, lang=lang, config=config, timeout=timeout or 0, **options
+        )
+    except RuntimeError as e:
+        # pytesseract signals an expired timeout with a RuntimeError
+        if timeout and "timeout" in str(e).lower():
+            raise OCRTimeoutError(f"OCR exceeded the time budget of {timeout}s") from e
+        print(f"Error extracting text from image: {e}")
+        return None
     except Exception as e:
         print(f"Error extracting text from image: {e}")
-        return ""
+        return None
+
+
+def simplify_image(
+    image: PageImage, scale: float = RETRY_DOWNSCALE_FACTOR
+) -> Image.Image:
+    """
+    Downscales and denoises an image so a retried OCR call finishes faster.
+
+    Args:
+        image (PageImage): Image to simplify
+        scale (float): Scale factor applied to both dimensions
+
+    Returns:
+        Image.Image: Simplified image
+    """
+    img_array = np.asarray(image)
+    if img_array.dtype == bool:
+        img_array = img_array.astype(np.uint8) * 255
+    height, width = img_array.shape[:2]
+    new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+    # INTER_AREA avoids aliasing when shrinking
+    resized = cv2.resize(img_array, new_size, interpolation=cv2.INTER_AREA)
+
+    # Median blur removes the speckle noise that makes Tesseract slow
+    denoised = cv2.medianBlur(resized, RETRY_MEDIAN_BLUR_SIZE)
+
+    return Image.fromarray(denoised)
 
 
 def check_tesseract_installation() -> bool:
     """
     Checks if Tesseract OCR is installed and accessible.
-    
+
     Returns:
         bool: True if Tesseract is available, False otherwise
     """
@@ -133,4 +723,4 @@ def check_tesseract_installation() -> bool:
         pytesseract.get_tesseract_version()
         return True
     except Exception:
-        return False 
\ No newline at end of file
+        return False
@@ -0,0 +1,146 @@
+"""
+Per-page manifest for incremental re-extraction of revised PDFs.
+
+This module contains functions for:
+- Fingerprinting a page from its content stream and the raw streams of
+  the images and forms it uses
+- Storing the processed lines of each page under its fingerprint, so a
+  revised PDF only needs OCR for the pages that changed
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import fitz  # PyMuPDF
+
+
+MANIFEST_VERSION = 1
+
+# A stored line: [text, image_index, bbox or None, confidence]
+StoredLine = List[Any]
+
+
+def page_fingerprint(
+    pdf_document: fitz.Document, page_number: int, settings_key: str = ""
+) -> str:
+    """
+    Computes a fingerprint that changes whenever the page's pixels could change.
+
+    The fingerprint covers the page geometry, its content stream, the raw
+    (still compressed) streams of its images and form XObjects, and the
+    extraction settings, so the same page processed with other settings is
+    not reused.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        page_number (int): 0-based page number
+        settings_key (str): Serialized extraction settings
+
+    Returns:
+        str: Hex digest
+    """
+    page = pdf_document[page_number]
+    digest = hashlib.sha256()
+
+    digest.update(settings_key.encode("utf-8"))
+    digest.update(f"{tuple(page.rect)}:{page.rotation}".encode("ascii"))
+    digest.update(page.read_contents())
+
+    xrefs = [img[0] for img in page.get_images(full=True)]
+    xrefs += [xobject[0] for xobject in page.get_xobjects()]
+
+    for xref in xrefs:
+        digest.update(
+            hashlib.sha256(pdf_document.xref_stream_raw(xref) or b"").digest()
+        )
+
+    return digest.hexdigest()
+
+
+class PageManifest:
+    """
+    Processed lines of each page, keyed by page fingerprint.
+
+    Keying by fingerprint rather than by page number lets pages that moved
+    (e.g. after an insertion) be reused as well.
+    """
+
+    def __init__(self, pages: Optional[Dict[str, List[StoredLine]]] = None):
+        """
+        Args:
+            pages (Optional[Dict[str, List[StoredLine]]]): Stored lines by fingerprint
+        """
+        self.pages: Dict[str, List[StoredLine]] = pages or {}
+
+    @classmethod
+    def load(cls, manifest_path: str) -> "PageManifest":
+        """
+        Loads a manifest, or returns an empty one if the file doesn't exist
+        or was written by another manifest version.
+
+        Args:
+            manifest_path (str): Path of the JSON manifest
+
+        Returns:
+            PageManifest: Loaded manifest
+        """
+        if not os.path.exists(manifest_path):
+            return cls()
+
+        with open(manifest_path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != MANIFEST_VERSION:
+            return cls()
+
+        return cls(data.get("pages", {}))
+
+    def get(self, fingerprint: str) -> Optional[List[StoredLine]]:
+        """
+        Returns the stored lines of a page.
+
+        Args:
+            fingerprint (str): Page fingerprint
+
+        Returns:
+            Optional[List[StoredLine]]: Stored lines, or None if the page is unknown
+        """
+        return self.pages.get(fingerprint)
+
+    def put(self, fingerprint: str, lines: List[StoredLine]) -> None:
+        """
+        Stores the lines of a page.
+
+        Args:
+            fingerprint (str): Page fingerprint
+            lines (List[StoredLine]): Lines of the page
+        """
+        self.pages[fingerprint] = lines
+
+    def retain(self, fingerprints: Iterable[str]) -> None:
+        """
+        Drops pages that are no longer part of the document.
+
+        Args:
+            fingerprints (Iterable[str]): Fingerprints of the current pages
+        """
+        keep = set(fingerprints)
+        self.pages = {fp: lines for fp, lines in self.pages.items() if fp in keep}
+
+    def save(self, manifest_path: str) -> None:
+        """
+        Saves the manifest atomically.
+
+        Args:
+            manifest_path (str): Path of the JSON manifest
+        """
+        temp_path = manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "pages": self.pages},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, manifest_path)
@@ -0,0 +1,168 @@
+"""
+Extraction options of the OCR PDF Reader.
+
+This module contains the options shared by extract_results_from_pdf() and
+OCRScheduler.submit(). They are validated once, when the options are built,
+so a batch of documents can reuse them without checking them again.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Union
+
+from .image_processor import (
+    resolve_preprocessing_chain,
+    DEFAULT_OCR_CONFIG,
+    RENDER_RESOLUTION_MULTIPLIER,
+)
+from .pipeline import DEFAULT_QUEUE_SIZE, PIPELINE_STAGES
+from .dedup import DEDUP_MODES, DedupIndex
+from .page_cache import PageCache
+from .detection import DEFAULT_AUTO_LANGUAGES
+from .tuning import AUTO_PREPROCESSING, DEFAULT_TUNING_TOLERANCE
+
+
+@dataclass
+class ExtractionOptions:
+    """
+    How the images of a document are read, processed and post-processed.
+
+    A named preprocessing chain is resolved to its step names when the
+    options are built.
+
+    Attributes:
+        page_timeout (Optional[float]): Time budget in seconds for the OCR of each
+            image (default: no limit)
+        retry_on_timeout (bool): Whether to retry a timed-out image once with a
+            downscaled, denoised copy
+        workers (int): Number of images processed concurrently
+        memory_budget_mb (Optional[float]): Memory budget in MB for images being
+            processed concurrently (default: half of the physical memory)
+        fast_decode (bool): Whether to decode images straight to grayscale or
+            binary arrays, converting CMYK images instead of skipping them
+        render_scale (float): Scale used to render pages without embedded images
+        ocr_config (str): Tesseract flags
+        preprocessing (Union[str, Sequence[str]]): Preprocessing chain name or step
+            names. 'auto' tries candidate chains on sample pages and keeps the
+            cheapest one whose OCR confidence is close to the best
+        use_processes (bool): Whether the workers are processes instead of threads.
+            Images are passed to them through shared memory
+        manifest_path (Optional[str]): Per-page manifest of a previous run. Pages whose
+            fingerprint is unchanged are taken from it instead of being processed,
+            and the manifest is updated
+        pipeline (bool): Whether to overlap decoding, preprocessing, OCR and text
+            processing in a staged pipeline with bounded queues
+        stage_threads (Optional[Dict[str, int]]): Threads per pipeline stage ('decode',
+            'preprocess', 'ocr', 'text'); unlisted stages use 1 thread for decode and
+            text and `workers` threads for preprocess and OCR. Decode always has
+            a single thread
+        queue_size (int): Capacity of each queue between pipeline stages
+        dedup_index (Optional[DedupIndex]): Index of lines seen in other pages,
+            documents and runs; the lines of each document are deduplicated
+            against it and added to it
+        dedup_mode (str): 'first' keeps only lines never seen before; 'count' keeps
+            one copy of each line with its corpus-wide occurrence count
+        merge_similar (Optional[float]): Similarity threshold (0-1) at which
+            near-duplicate lines of a document are merged into one canonical line
+        auto_languages (str): Candidate languages for lang='auto', joined by '+'
+        tuning_tolerance (float): Confidence points the chain chosen by
+            preprocessing='auto' may lose against the best candidate
+        page_cache (Optional[PageCache]): Cache of preprocessed images. Cached images
+            go straight to OCR; the others are stored after preprocessing, except
+            with worker processes. With preprocessing='auto', tuning is skipped when
+            an earlier run's tuned chain has every image cached
+    """
+
+    page_timeout: Optional[float] = None
+    retry_on_timeout: bool = True
+    workers: int = 1
+    memory_budget_mb: Optional[float] = None
+    fast_decode: bool = True
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER
+    ocr_config: str = DEFAULT_OCR_CONFIG
+    preprocessing: Union[str, Sequence[str]] = "default"
+    use_processes: bool = False
+    manifest_path: Optional[str] = None
+    pipeline: bool = False
+    stage_threads: Optional[Dict[str, int]] = None
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    dedup_index: Optional[DedupIndex] = None
+    dedup_mode: str = "first"
+    merge_similar: Optional[float] = None
+    auto_languages: str = DEFAULT_AUTO_LANGUAGES
+    tuning_tolerance: float = DEFAULT_TUNING_TOLERANCE
+    page_cache: Optional[PageCache] = None
+
+    def __post_init__(self) -> None:
+        """
+        Validates the options and resolves the preprocessing chain.
+
+        Raises:
+            ValueError: If the preprocessing chain, a pipeline stage or the dedup
+                mode is unknown, the decode stage is given several threads, or the
+                similarity threshold is out of range
+        """
+        if self.preprocessing != AUTO_PREPROCESSING:
+            self.preprocessing = resolve_preprocessing_chain(self.preprocessing)
+
+        if self.dedup_mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup mode: {self.dedup_mode}")
+        if self.merge_similar is not None and not 0 < self.merge_similar <= 1:
+            raise ValueError(
+                f"Similarity threshold must be between 0 and 1: "
+                f"{self.merge_similar}"
+            )
+
+        stage_threads = self.stage_threads or {}
+        if set(stage_threads) - set(PIPELINE_STAGES):
+            unknown = ", ".join(sorted(set(stage_threads) - set(PIPELINE_STAGES)))
+            raise ValueError(f"Unknown pipeline stages: {unknown}")
+        if stage_threads.get("decode", 1) != 1:
+            # The decode stage reads the PDF document, which threads must not share
+            raise ValueError(
+                f"The decode stage must have a single thread: "
+                f"{stage_threads['decode']}"
+            )
+
+    def pipeline_threads(self) -> Dict[str, int]:
+        """
+        Returns the number of threads of each pipeline stage.
+
+        Returns:
+            Dict[str, int]: Thread count by stage name, in PIPELINE_STAGES order
+        """
+        threads = {
+            "decode": 1,
+            "preprocess": self.workers,
+            "ocr": self.workers,
+            "text": 1,
+        }
+        threads.update(self.stage_threads or {})
+        return threads
+
+
+def resolve_options(
+    options: Optional[ExtractionOptions] = None, **values: Any
+) -> ExtractionOptions:
+    """
+    Builds the options of a call from prebuilt options and keyword values.
+
+    Prebuilt options without keyword values are returned as they are, so
+    they are only validated when they were built.
+
+    Args:
+        options (Optional[ExtractionOptions]): Prebuilt options (default: the defaults)
+        **values: ExtractionOptions fields overriding those of `options`
+
+    Returns:
+        ExtractionOptions: Validated options
+
+    Raises:
+        TypeError: If a keyword is not an ExtractionOptions field
+        ValueError: If an option is invalid
+    """
+    if options is None:
+        return ExtractionOptions(**values)
+    if values:
+        return dataclasses.replace(options, **values)
+    return options
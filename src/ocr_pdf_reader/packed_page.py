@@ -0,0 +1,149 @@
+"""
+Bit-packed storage of binary page images.
+
+This module contains functions for:
+- Packing thresholded pages (0/255 uint8) and bilevel scans (bool) to one bit
+  per pixel, eight times smaller than a uint8 array
+- Unpacking a whole page lazily, when it is converted to an array right
+  before OCR, or one band of rows at a time
+"""
+
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+
+class PackedBinaryPage:
+    """
+    A binary image packed row by row with np.packbits.
+
+    Each row is padded to a whole number of bytes, so a band of rows can be
+    unpacked without touching the rest of the page. np.asarray() on a packed
+    page unpacks it, so it can be passed wherever an image array is expected.
+
+    Attributes:
+        shape (Tuple[int, int]): Height and width in pixels
+        dtype (np.dtype): Type of the unpacked array, bool or uint8 (0/255)
+        bits (np.ndarray): Packed rows, (height, ceil(width / 8)) uint8
+    """
+
+    __slots__ = ("shape", "dtype", "bits")
+
+    def __init__(
+        self,
+        bits: np.ndarray,
+        shape: Tuple[int, int],
+        dtype: Union[type, np.dtype] = np.uint8,
+    ):
+        self.bits = bits
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.dtype = np.dtype(dtype)
+
+    @staticmethod
+    def is_binary(image: np.ndarray) -> bool:
+        """
+        Tells whether an image can be packed without loss.
+
+        Args:
+            image (np.ndarray): Image array
+
+        Returns:
+            bool: True for 2-D bool arrays and 2-D uint8 arrays holding only 0 and 255
+        """
+        if image.ndim != 2:
+            return False
+        if image.dtype == bool:
+            return True
+        return image.dtype == np.uint8 and bool(np.all((image == 0) | (image == 255)))
+
+    @classmethod
+    def pack(cls, image: np.ndarray) -> "PackedBinaryPage":
+        """
+        Packs a binary image.
+
+        Args:
+            image (np.ndarray): 2-D bool array, or uint8 array holding only 0 and 255
+
+        Returns:
+            PackedBinaryPage: Packed image
+
+        Raises:
+            ValueError: If the image is not binary
+        """
+        if not cls.is_binary(image):
+            raise ValueError("Only 2-D bool or 0/255 uint8 images can be packed")
+        return cls(
+            np.packbits(image.astype(bool, copy=False), axis=1),
+            image.shape,
+            image.dtype,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the packed bits."""
+        return self.bits.nbytes
+
+    @property
+    def unpacked_nbytes(self) -> int:
+        """Memory the unpacked array would use."""
+        return self.shape[0] * self.shape[1] * self.dtype.itemsize
+
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """
+        Unpacks a band of rows, e.g. one tile of a page.
+
+        Args:
+            start (int): First row
+            stop (int): Row after the last one
+
+        Returns:
+            np.ndarray: Rows start to stop, with the page's width and unpacked dtype
+        """
+        band: np.ndarray = np.unpackbits(
+            self.bits[start:stop], axis=1, count=self.shape[1]
+        )
+        if self.dtype == bool:
+            band = band.view(bool)
+        else:
+            band = band * np.uint8(255)
+        return band
+
+    def unpack(self) -> np.ndarray:
+        """
+        Unpacks the whole page.
+
+        Returns:
+            np.ndarray: Image with the original shape and dtype
+        """
+        return self.rows(0, self.shape[0])
+
+    def __array__(
+        self, dtype: Optional[Any] = None, copy: Optional[bool] = None
+    ) -> np.ndarray:
+        image = self.unpack()
+        return image if dtype is None else image.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"PackedBinaryPage(shape={self.shape}, dtype={self.dtype}, "
+            f"nbytes={self.nbytes})"
+        )
+
+
+def pack_if_binary(image: Any, check_values: bool = True) -> Any:
+    """
+    Packs an image array if it is binary, otherwise returns it unchanged.
+
+    Args:
+        image (Any): Image array, PIL image or None
+        check_values (bool): Whether uint8 arrays are scanned for 0/255 values; if
+            False only bool arrays (decoded bilevel scans) are packed (default: True)
+
+    Returns:
+        Any: PackedBinaryPage for binary arrays, the image itself otherwise
+    """
+    if not isinstance(image, np.ndarray) or (not check_values and image.dtype != bool):
+        return image
+    if PackedBinaryPage.is_binary(image):
+        return PackedBinaryPage.pack(image)
+    return image
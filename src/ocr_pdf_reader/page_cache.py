@@ -0,0 +1,253 @@
+"""
+On-disk cache of preprocessed page images.
+
+This module contains functions for:
+- Keying preprocessed images by page content, image, render scale and
+  preprocessing chain, so re-runs with another language or Tesseract
+  configuration skip decoding and preprocessing
+- Storing binary images as 1-bit packed bitmaps (PackedBinaryPage) and
+  other images as losslessly compressed arrays
+- Evicting the least recently used entries when the cache exceeds its size
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Optional, Union
+
+import numpy as np
+
+from .packed_page import PackedBinaryPage, pack_if_binary
+
+
+# Default size limit of a page cache
+DEFAULT_PAGE_CACHE_MB = 1024
+
+# File name suffix of cache entries
+ENTRY_SUFFIX = ".page"
+
+# Entry header: magic, format version, kind, number of dimensions
+_HEADER = struct.Struct("<4sBBB")
+_MAGIC = b"OPRC"
+_VERSION = 2
+
+# Entry kinds
+_KIND_ARRAY = 0
+_KIND_PACKED_BINARY = 1
+_KIND_PACKED_BOOL = 2
+
+# zlib level: bitmaps of scanned text compress well even at the fastest level
+_COMPRESSION_LEVEL = 1
+
+
+def encode_page(image: Union[np.ndarray, PackedBinaryPage]) -> bytes:
+    """
+    Serializes a preprocessed image compactly.
+
+    Binary images, the output of the thresholding chains, are stored as
+    PackedBinaryPage bits, one bit per pixel; other uint8 images are stored
+    as they are. Both are then zlib-compressed.
+
+    Args:
+        image (Union[np.ndarray, PackedBinaryPage]): Preprocessed image
+
+    Returns:
+        bytes: Encoded entry
+
+    Raises:
+        ValueError: If the image is neither binary nor uint8
+    """
+    if not isinstance(image, PackedBinaryPage):
+        image = pack_if_binary(np.ascontiguousarray(image))
+
+    if isinstance(image, PackedBinaryPage):
+        kind = _KIND_PACKED_BOOL if image.dtype == bool else _KIND_PACKED_BINARY
+        payload = np.ascontiguousarray(image.bits).tobytes()
+    elif image.dtype == np.uint8:
+        kind = _KIND_ARRAY
+        payload = image.tobytes()
+    else:
+        raise ValueError(f"Unsupported image type for the page cache: {image.dtype}")
+
+    ndim = len(image.shape)
+    header = _HEADER.pack(_MAGIC, _VERSION, kind, ndim)
+    shape = struct.pack(f"<{ndim}I", *image.shape)
+    return header + shape + zlib.compress(payload, _COMPRESSION_LEVEL)
+
+
+def decode_page(data: bytes) -> Union[np.ndarray, PackedBinaryPage]:
+    """
+    Restores an image serialized by encode_page().
+
+    Args:
+        data (bytes): Encoded entry
+
+    Returns:
+        Union[np.ndarray, PackedBinaryPage]: uint8 image, or a packed page for
+            binary images, unpacked when it is converted to an array
+
+    Raises:
+        ValueError: If the data is not a cache entry of this version
+    """
+    magic, version, kind, ndim = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a page cache entry")
+
+    offset = _HEADER.size
+    shape = struct.unpack_from(f"<{ndim}I", data, offset)
+    payload = zlib.decompress(data[offset + 4 * ndim :])
+
+    if kind in (_KIND_PACKED_BINARY, _KIND_PACKED_BOOL):
+        height, width = shape
+        bits = np.frombuffer(payload, np.uint8).reshape(height, (width + 7) // 8)
+        return PackedBinaryPage(
+            bits, shape, bool if kind == _KIND_PACKED_BOOL else np.uint8
+        )
+    image: np.ndarray = np.frombuffer(payload, np.uint8).reshape(shape).copy()
+    return image
+
+
+class PageCache:
+    """
+    Directory of preprocessed images with a size limit.
+
+    Entries are files named by their key. Recency is kept in memory and in
+    the files' modification times, so a reopened cache evicts in the same
+    order. Writes are atomic, and entries deleted by another process are
+    treated as misses.
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int = DEFAULT_PAGE_CACHE_MB * 1024**2
+    ):
+        """
+        Opens a cache directory, creating it if needed.
+
+        Args:
+            directory (str): Directory holding the entries
+            max_bytes (int): Size above which the least recently used entries are
+                evicted (default: 1 GB)
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"Page cache size must be positive: {max_bytes}")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        found = []
+        for name in os.listdir(directory):
+            if name.endswith(ENTRY_SUFFIX):
+                stat = os.stat(os.path.join(directory, name))
+                found.append((stat.st_mtime, name[: -len(ENTRY_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def key(page_fingerprint: str, image_index: int) -> str:
+        """
+        Builds the key of one image of a page.
+
+        Args:
+            page_fingerprint (str): Fingerprint of the page content and the settings
+                that change its pixels (render scale, decode path, chain, rotation)
+            image_index (int): Index of the image on the page, -1 for a rendered page
+
+        Returns:
+            str: Hex key
+        """
+        return hashlib.sha256(
+            f"{page_fingerprint}:{image_index}".encode("ascii")
+        ).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Size of the entries on disk."""
+        with self._lock:
+            return self._total_bytes
+
+    def get(self, key: str) -> Optional[Union[np.ndarray, PackedBinaryPage]]:
+        """
+        Reads an entry and marks it as recently used.
+
+        Args:
+            key (str): Entry key
+
+        Returns:
+            Optional[Union[np.ndarray, PackedBinaryPage]]: Preprocessed image, binary
+                images still packed; None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                image = decode_page(f.read())
+            os.utime(path)
+        except (OSError, ValueError, zlib.error, struct.error):
+            with self._lock:
+                self._forget(key)
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return image
+
+    def put(self, key: str, image: Union[np.ndarray, PackedBinaryPage]) -> None:
+        """
+        Stores an entry, evicting the least recently used ones beyond the size limit.
+
+        Args:
+            key (str): Entry key
+            image (Union[np.ndarray, PackedBinaryPage]): Preprocessed uint8 image
+        """
+        data = encode_page(image)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._forget(oldest)
+                try:
+                    os.remove(self._path(oldest))
+                except FileNotFoundError:
+                    pass
+
+    def _path(self, key: str) -> str:
+        """Returns the file of an entry."""
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _forget(self, key: str) -> None:
+        """Drops an entry from the in-memory index; the caller holds the lock."""
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
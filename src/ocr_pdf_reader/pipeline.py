@@ -0,0 +1,242 @@
+"""
+Threaded producer/consumer pipeline.
+
+This module contains the StagedPipeline, which runs a sequence of stages
+in their own threads, connected by bounded queues. Stages overlap, the
+bounded queues apply backpressure so memory stays bounded by their sizes,
+and the occupancy of each queue is recorded to show which stage is the
+bottleneck.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_QUEUE_SIZE = 4
+
+# Stages of the extraction pipeline, in order
+PIPELINE_STAGES = ("decode", "preprocess", "ocr", "text")
+
+# Marks the end of the input in a queue
+_END = object()
+
+
+@dataclass
+class StageStats:
+    """Activity of a pipeline stage and of the queue that feeds it."""
+
+    name: str
+    threads: int
+    queue_capacity: int
+    items: int = 0
+    busy_seconds: float = 0.0
+    occupancy_samples: int = 0
+    occupancy_total: int = 0
+    max_occupancy: int = 0
+
+    @property
+    def mean_occupancy(self) -> float:
+        """Mean number of items waiting in the input queue when the stage took one."""
+        if not self.occupancy_samples:
+            return 0.0
+        return self.occupancy_total / self.occupancy_samples
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the statistics to a JSON-serializable dictionary."""
+        return {
+            "threads": self.threads,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "queue_capacity": self.queue_capacity,
+            "mean_queue_occupancy": round(self.mean_occupancy, 2),
+            "max_queue_occupancy": self.max_occupancy,
+        }
+
+
+class StagedPipeline:
+    """
+    Runs items through stages, each with its own threads and input queue.
+
+    A full queue in front of a stage means that stage is the bottleneck; an
+    empty one means it is starved by the stages before it.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Tuple[str, Callable[[Any], Any], int]],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        Args:
+            stages (Sequence[Tuple[str, Callable[[Any], Any], int]]): (name, function,
+                thread count) of each stage, in order
+            queue_size (int): Capacity of each queue between stages
+        """
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.stats = [
+            StageStats(name, threads, queue_size) for name, _, threads in stages
+        ]
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Runs all items through the stages.
+
+        Args:
+            items (Iterable[Any]): Inputs of the first stage
+
+        Returns:
+            List[Any]: Outputs of the last stage, in input order
+
+        Raises:
+            Exception: The first exception raised by a stage
+        """
+        queues: List["queue.Queue[Any]"] = [
+            queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+        # The last queue collects results and must never block the last stage
+        queues[-1] = queue.Queue()
+        errors: List[BaseException] = []
+        abort = threading.Event()
+        threads = []
+
+        for index, (_, function, thread_count) in enumerate(self.stages):
+            remaining = [thread_count]
+            lock = threading.Lock()
+            for _ in range(thread_count):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(
+                        function,
+                        self.stats[index],
+                        queues[index],
+                        queues[index + 1],
+                        remaining,
+                        lock,
+                        errors,
+                        abort,
+                    ),
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        try:
+            for position, item in enumerate(items):
+                if not self._put(queues[0], (position, item), abort):
+                    break
+        except BaseException as e:
+            errors.append(e)
+            abort.set()
+        finally:
+            self._put(queues[0], _END, abort)
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        results: Dict[int, Any] = {}
+        while True:
+            entry = queues[-1].get()
+            if entry is _END:
+                break
+            position, value = entry
+            results[position] = value
+
+        return [results[position] for position in sorted(results)]
+
+    @staticmethod
+    def _put(target: "queue.Queue[Any]", entry: Any, abort: threading.Event) -> bool:
+        """Puts an entry, giving up if the pipeline is aborted."""
+        while True:
+            try:
+                target.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                if abort.is_set():
+                    if entry is _END:
+                        continue  # The end marker must get through for threads to exit
+                    return False
+
+    def _work(
+        self,
+        function: Callable[[Any], Any],
+        stats: StageStats,
+        source: "queue.Queue[Any]",
+        target: "queue.Queue[Any]",
+        remaining: List[int],
+        lock: threading.Lock,
+        errors: List[BaseException],
+        abort: threading.Event,
+    ) -> None:
+        """Thread body: takes items from a queue, processes and forwards them."""
+        while True:
+            occupancy = source.qsize()
+            entry = source.get()
+
+            if entry is _END:
+                # Let the other threads of this stage see the end marker too
+                source.put(_END)
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    self._put(target, _END, abort)
+                return
+
+            if abort.is_set():
+                continue  # Drain without processing
+
+            position, item = entry
+            start = time.perf_counter()
+            try:
+                value = function(item)
+            except BaseException as e:
+                errors.append(e)
+                abort.set()
+                continue
+            elapsed = time.perf_counter() - start
+
+            with lock:
+                stats.items += 1
+                stats.busy_seconds += elapsed
+                stats.occupancy_samples += 1
+                stats.occupancy_total += occupancy
+                stats.max_occupancy = max(stats.max_occupancy, occupancy)
+
+            self._put(target, (position, value), abort)
+
+
+def parse_stage_threads(value: Optional[str]) -> Dict[str, int]:
+    """
+    Parses per-stage thread counts written as "stage=count,stage=count".
+
+    Args:
+        value (Optional[str]): Thread counts, or None
+
+    Returns:
+        Dict[str, int]: Thread count by stage name
+
+    Raises:
+        ValueError: If an entry is malformed, a count is not positive, or the
+            decode stage is given more than one thread
+    """
+    counts: Dict[str, int] = {}
+
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        name, _, count = entry.partition("=")
+        if not count.strip().isdigit() or int(count) < 1:
+            raise ValueError(f"Invalid stage thread count: {entry}")
+        if name.strip() == "decode" and int(count) != 1:
+            # Decode threads would share one PDF document, which isn't thread-safe
+            raise ValueError(f"The decode stage must have a single thread: {entry}")
+        counts[name.strip()] = int(count)
+
+    return counts
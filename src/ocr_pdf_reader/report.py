@@ -0,0 +1,162 @@
+"""
+Run report for the OCR PDF Reader.
+
+This module contains the structure used to collect information about a
+processing run, such as images that exceeded their OCR time budget.
+"""
+
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List
+
+
+@dataclass
+class RunReport:
+    """
+    Collects information about a single extraction run.
+
+    Image numbers are 1-based, in the same order as the progress output
+    ("Processing image i/n"). Page numbers are 1-based as well.
+    """
+
+    pdf_path: str = ""
+    total_images: int = 0
+    timed_out_images: List[int] = field(default_factory=list)
+    retried_images: List[int] = field(default_factory=list)
+    recovered_images: List[int] = field(default_factory=list)
+    peak_estimated_memory_bytes: int = 0
+    reused_pages: List[int] = field(default_factory=list)
+    recomputed_pages: List[int] = field(default_factory=list)
+    stage_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    detected_language: str = ""
+    detected_rotation: int = 0
+    preprocessing_choice: str = ""
+    preprocessing_trials: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    tuning_seconds: float = 0.0
+    partial: bool = False
+    page_cache_hits: int = 0
+    page_cache_misses: int = 0
+    missing_pages: List[int] = field(default_factory=list)
+    deadline_skipped_images: List[int] = field(default_factory=list)
+
+    def record_timeout(self, image_number: int, retried: bool, recovered: bool) -> None:
+        """
+        Records an image whose OCR call exceeded the time budget.
+
+        Args:
+            image_number (int): 1-based number of the image
+            retried (bool): Whether a simplified retry was attempted
+            recovered (bool): Whether the retry finished within the budget
+        """
+        if retried:
+            self.retried_images.append(image_number)
+        if recovered:
+            self.recovered_images.append(image_number)
+        else:
+            self.timed_out_images.append(image_number)
+
+    def record_deadline_skip(self, image_number: int) -> None:
+        """
+        Records an image left out because the document's time budget ran out.
+
+        These are kept apart from per-image timeouts: the image may have been
+        fast, but started too late.
+
+        Args:
+            image_number (int): 1-based number of the image
+        """
+        self.deadline_skipped_images.append(image_number)
+
+    def merge_timeouts(self, other: "RunReport") -> None:
+        """
+        Adds the timeouts recorded by another report, e.g. one filled by a worker
+        process.
+
+        Args:
+            other (RunReport): Report to merge
+        """
+        self.timed_out_images.extend(other.timed_out_images)
+        self.retried_images.extend(other.retried_images)
+        self.recovered_images.extend(other.recovered_images)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the report to a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Report contents
+        """
+        return asdict(self)
+
+    def save(self, output_file: str) -> None:
+        """
+        Saves the report as JSON.
+
+        Args:
+            output_file (str): Path of the JSON file
+        """
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def summary(self) -> str:
+        """
+        Builds a short human-readable summary of the report.
+
+        Returns:
+            str: Summary text
+        """
+        lines = [f"Images processed: {self.total_images}"]
+        if self.detected_language:
+            lines.append(
+                f"Detected language: {self.detected_language} "
+                f"(rotation {self.detected_rotation} degrees)"
+            )
+        if self.recovered_images:
+            lines.append(
+                f"Recovered after retry: {_format_numbers(self.recovered_images)}"
+            )
+        if self.timed_out_images:
+            lines.append(
+                f"Timed out (skipped): {_format_numbers(self.timed_out_images)}"
+            )
+        if self.preprocessing_choice:
+            lines.append(
+                f"Preprocessing chain: {self.preprocessing_choice} "
+                f"(tuning took {self.tuning_seconds}s)"
+            )
+        if self.stage_stats:
+            # A stage whose input queue stays near capacity is the bottleneck
+            lines.append("Pipeline stages (input queue mean/max of capacity):")
+            for name, stats in self.stage_stats.items():
+                lines.append(
+                    f"  {name}: {stats['threads']} thread(s), "
+                    f"{stats['busy_seconds']}s busy, queue "
+                    f"{stats['mean_queue_occupancy']}/{stats['max_queue_occupancy']} "
+                    f"of {stats['queue_capacity']}"
+                )
+        if self.page_cache_hits or self.page_cache_misses:
+            lines.append(
+                f"Page cache: {self.page_cache_hits} hit(s), "
+                f"{self.page_cache_misses} miss(es)"
+            )
+        if self.partial:
+            lines.append(
+                f"Partial result, pages not finished in time: "
+                f"{_format_numbers(self.missing_pages)}"
+            )
+        if self.deadline_skipped_images:
+            lines.append(
+                f"Skipped at the deadline: "
+                f"{_format_numbers(self.deadline_skipped_images)}"
+            )
+        if self.reused_pages:
+            lines.append(
+                f"Pages reused from manifest: {_format_numbers(self.reused_pages)}"
+            )
+            lines.append(f"Pages recomputed: {_format_numbers(self.recomputed_pages)}")
+        return "\n".join(lines)
+
+
+def _format_numbers(numbers: List[int]) -> str:
+    """Formats a list of image or page numbers for display."""
+    return ", ".join(str(n) for n in numbers)
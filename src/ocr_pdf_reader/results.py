@@ -0,0 +1,411 @@
+"""
+Structured extraction results.
+
+This module contains the ExtractionResult, a compact columnar store of
+extracted lines with their page, source image, bounding box and OCR
+confidence, plus export to JSONL and Parquet/Arrow.
+"""
+
+import bisect
+import json
+from array import array
+from collections.abc import Sequence as SequenceABC
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from .image_processor import OCRResult, OCRWord
+
+
+# Box stored for lines that could not be located among the OCR words
+NO_BBOX = (-1, -1, -1, -1)
+
+BBox = Tuple[int, int, int, int]
+
+
+class LineRecord:
+    """
+    A single extracted line.
+
+    Attributes:
+        text (str): Processed line text
+        page (int): 1-based page number
+        image_index (int): Index of the embedded image on the page, -1 for a
+            rendered page
+        bbox (Optional[BBox]): (left, top, right, bottom) in pixels of the image
+            Tesseract read, None if unknown. That image is the decoded or rendered
+            one after preprocessing, so decode reduction, render scale, the
+            'downscale' step, rotation and simplified retries change its scale
+            and orientation; boxes are not page coordinates
+        confidence (float): Mean word confidence (0-100), -1 if unknown
+        occurrences (int): Times the line was seen, counted by a dedup index
+            (default: 1)
+    """
+
+    __slots__ = ("text", "page", "image_index", "bbox", "confidence", "occurrences")
+
+    def __init__(
+        self,
+        text: str,
+        page: int,
+        image_index: int,
+        bbox: Optional[BBox],
+        confidence: float,
+        occurrences: int = 1,
+    ):
+        self.text = text
+        self.page = page
+        self.image_index = image_index
+        self.bbox = bbox
+        self.confidence = confidence
+        self.occurrences = occurrences
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the record to a JSON-serializable dictionary."""
+        return {
+            "text": self.text,
+            "page": self.page,
+            "image_index": self.image_index,
+            "bbox": list(self.bbox) if self.bbox else None,
+            "confidence": self.confidence,
+            "occurrences": self.occurrences,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"LineRecord(text={self.text!r}, page={self.page}, "
+            f"image_index={self.image_index}, bbox={self.bbox}, "
+            f"confidence={self.confidence:.1f})"
+        )
+
+
+class ExtractionResult:
+    """
+    Column-oriented store of extracted lines.
+
+    Texts live in one UTF-8 buffer addressed by an offset array, and the
+    other fields in typed arrays, so a line costs a few dozen bytes instead
+    of a Python object per field.
+
+    Attributes:
+        missing_pages (List[int]): 1-based pages left out of a partial result,
+            e.g. because the time budget ran out before they were read
+    """
+
+    def __init__(self) -> None:
+        self._text_buffer = bytearray()
+        self._offsets = array("q", [0])
+        self._pages = array("i")
+        self._image_indexes = array("i")
+        self._bboxes = array("i")
+        self._confidences = array("f")
+        self._occurrences = array("I")
+        self.missing_pages: List[int] = []
+
+    def append(
+        self,
+        text: str,
+        page: int,
+        image_index: int,
+        bbox: Optional[BBox] = None,
+        confidence: float = -1.0,
+        occurrences: int = 1,
+    ) -> None:
+        """
+        Adds a line.
+
+        Args:
+            text (str): Processed line text
+            page (int): 1-based page number
+            image_index (int): Index of the image on the page, -1 for a rendered page
+            bbox (Optional[BBox]): (left, top, right, bottom), None if unknown
+            confidence (float): Mean word confidence, -1 if unknown
+            occurrences (int): Times the line was seen (default: 1)
+        """
+        self._text_buffer += text.encode("utf-8")
+        self._offsets.append(len(self._text_buffer))
+        self._pages.append(page)
+        self._image_indexes.append(image_index)
+        self._bboxes.extend(bbox if bbox else NO_BBOX)
+        self._confidences.append(confidence)
+        self._occurrences.append(occurrences)
+
+    def text_at(self, index: int) -> str:
+        """
+        Decodes the text of one line.
+
+        Args:
+            index (int): Line index
+
+        Returns:
+            str: Line text
+        """
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._text_buffer[start:end].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    @property
+    def partial(self) -> bool:
+        """Whether some pages of the document are missing from the result."""
+        return bool(self.missing_pages)
+
+    def __getitem__(self, index: int) -> LineRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+
+        x0, y0, x1, y1 = self._bboxes[4 * index : 4 * index + 4]
+        bbox = (x0, y0, x1, y1)
+        return LineRecord(
+            self.text_at(index),
+            self._pages[index],
+            self._image_indexes[index],
+            bbox if bbox != NO_BBOX else None,
+            self._confidences[index],
+            self._occurrences[index],
+        )
+
+    def __iter__(self) -> Iterator[LineRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def texts(self) -> "TextLinesView":
+        """Read-only list-of-strings view over the line texts."""
+        return TextLinesView(self)
+
+    def filter(self, keep: Callable[[LineRecord], Optional[str]]) -> "ExtractionResult":
+        """
+        Builds a new result with the lines accepted by a function.
+
+        Args:
+            keep (Callable[[LineRecord], Optional[str]]): Returns the text to keep
+                for a record (possibly rewritten), or None to drop it
+
+        Returns:
+            ExtractionResult: Filtered result
+        """
+        filtered = ExtractionResult()
+        for record in self:
+            text = keep(record)
+            if text is not None:
+                filtered.append(
+                    text,
+                    record.page,
+                    record.image_index,
+                    record.bbox,
+                    record.confidence,
+                    record.occurrences,
+                )
+        filtered.missing_pages = list(self.missing_pages)
+        return filtered
+
+    def extend(self, other: "ExtractionResult") -> None:
+        """
+        Appends all lines of another result.
+
+        Args:
+            other (ExtractionResult): Result to append
+        """
+        for record in other:
+            self.append(
+                record.text,
+                record.page,
+                record.image_index,
+                record.bbox,
+                record.confidence,
+                record.occurrences,
+            )
+
+    def memory_bytes(self) -> int:
+        """Approximate memory used by the stored columns, in bytes."""
+        columns = (
+            self._offsets,
+            self._pages,
+            self._image_indexes,
+            self._bboxes,
+            self._confidences,
+            self._occurrences,
+        )
+        return len(self._text_buffer) + sum(
+            column.itemsize * len(column) for column in columns
+        )
+
+    def to_jsonl(self, output_file: str) -> None:
+        """
+        Writes one JSON object per line.
+
+        Args:
+            output_file (str): Path of the JSONL file
+        """
+        with open(output_file, "w", encoding="utf-8") as f:
+            for record in self:
+                f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+
+    def to_arrow(self) -> Any:
+        """
+        Converts the result to a pyarrow Table.
+
+        Texts are passed to Arrow from the shared buffer and offset array
+        without re-encoding. Unknown boxes are stored as (-1, -1, -1, -1).
+
+        Returns:
+            pyarrow.Table: Table with text, page, image_index, bbox, confidence and
+                occurrences columns
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "Arrow/Parquet export requires pyarrow: pip install pyarrow"
+            ) from e
+
+        count = len(self)
+        texts = pa.LargeStringArray.from_buffers(
+            count, pa.py_buffer(self._offsets), pa.py_buffer(bytes(self._text_buffer))
+        )
+        bboxes = pa.FixedSizeListArray.from_arrays(
+            pa.array(self._bboxes, pa.int32()), 4
+        )
+
+        return pa.table(
+            {
+                "text": texts,
+                "page": pa.array(self._pages, pa.int32()),
+                "image_index": pa.array(self._image_indexes, pa.int32()),
+                "bbox": bboxes,
+                "confidence": pa.array(self._confidences, pa.float32()),
+                "occurrences": pa.array(self._occurrences, pa.uint32()),
+            }
+        )
+
+    def to_parquet(self, output_file: str) -> None:
+        """
+        Writes the result as a Parquet file.
+
+        Args:
+            output_file (str): Path of the Parquet file
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, output_file)
+
+
+class TextLinesView(SequenceABC):
+    """Sequence of the line texts of an ExtractionResult, decoded on access."""
+
+    def __init__(self, result: ExtractionResult):
+        self._result = result
+
+    def __len__(self) -> int:
+        return len(self._result)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self._result.text_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self._result.text_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, TextLinesView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TextLinesView({list(self)!r})"
+
+
+def locate_lines(
+    lines: Sequence[str], ocr_result: OCRResult
+) -> List[Tuple[Optional[BBox], float]]:
+    """
+    Finds the box and confidence of processed lines among the OCR words.
+
+    process_text_lines works on the OCR text with whitespace collapsed, in
+    which each word starts at a known offset. Each processed line is searched
+    in that text after the previous match, and the words it overlaps, found
+    by bisecting the word offsets, give the union box and the mean
+    confidence. Boxes are in pixels of the preprocessed image, like the
+    words' boxes.
+
+    Args:
+        lines (Sequence[str]): Lines returned by process_text_lines
+        ocr_result (OCRResult): OCR output the lines were extracted from
+
+    Returns:
+        List[Tuple[Optional[BBox], float]]: Box (None if not found) and
+            confidence (-1 if not found) of each line
+    """
+    words = ocr_result.words
+    starts = []
+    position = 0
+    for word in words:
+        starts.append(position)
+        position += len(word.text) + 1
+    clean_text = " ".join(word.text for word in words)
+
+    located: List[Tuple[Optional[BBox], float]] = []
+    cursor = 0
+
+    for line in lines:
+        start = clean_text.find(line, cursor)
+        if start < 0:
+            start = clean_text.find(line)
+        if start < 0:
+            located.append((None, -1.0))
+            continue
+
+        end = start + len(line)
+        cursor = end
+        # Words don't overlap: only the last one starting at or before `start` can
+        # reach into the line, and every later one starting before `end` is in it
+        first = bisect.bisect_right(starts, start) - 1
+        if first < 0 or starts[first] + len(words[first].text) <= start:
+            first += 1
+        matched = words[first : bisect.bisect_left(starts, end)]
+        located.append(
+            (
+                _union_bbox(matched),
+                sum(word.confidence for word in matched) / len(matched),
+            )
+        )
+
+    return located
+
+
+def _union_bbox(words: Sequence[OCRWord]) -> BBox:
+    """Returns the smallest box that contains all the words."""
+    return (
+        min(word.left for word in words),
+        min(word.top for word in words),
+        max(word.left + word.width for word in words),
+        max(word.top + word.height for word in words),
+    )
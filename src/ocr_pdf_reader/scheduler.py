@@ -0,0 +1,386 @@
+"""
+Priority and deadline-aware scheduling of OCR work.
+
+This module contains functions for:
+- Sharing a fixed pool of OCR workers between documents of different priority
+- Splitting each document into page tasks, so a higher-priority document
+  takes over the workers at the next page boundary
+- Returning the pages finished within a document's time budget, marked partial,
+  instead of blocking until the whole document is done
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .image_processor import (
+    ImageSource,
+    list_image_sources,
+    load_image_source,
+    open_pdf,
+)
+from .manifest import StoredLine
+from .results import ExtractionResult
+from .core import AUTO_LANGUAGE, build_result, ocr_image_with_budget, stored_lines
+from .options import ExtractionOptions, resolve_options
+from .tuning import AUTO_PREPROCESSING
+from .report import RunReport
+
+
+# Priority of documents someone is waiting for; lower values run first
+PRIORITY_INTERACTIVE = 0
+
+# Priority of backfills and other unattended work
+PRIORITY_BULK = 10
+
+# Priority names accepted by the command line
+PRIORITIES: Dict[str, int] = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "bulk": PRIORITY_BULK,
+}
+
+
+class ScheduledJob:
+    """
+    A document submitted to an OCRScheduler.
+
+    The job owns the open PDF document. Pages are decoded under the job's
+    lock, since a PyMuPDF document must not be used by two threads at once,
+    and OCR runs outside it. Deadlines are measured with the scheduler's clock.
+    """
+
+    def __init__(
+        self,
+        pdf_path: str,
+        lang: str,
+        validate: bool,
+        priority: int,
+        time_budget: Optional[float],
+        report: RunReport,
+        options: ExtractionOptions,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.pdf_path = pdf_path
+        self.lang = lang
+        self.validate = validate
+        self.priority = priority
+        self._clock = clock
+        self.deadline = clock() + time_budget if time_budget is not None else None
+        self.report = report
+        self._options = options
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._result: Optional[ExtractionResult] = None
+        self._document = open_pdf(pdf_path)
+        self.sources = list_image_sources(self._document, options.render_scale)
+        self.page_numbers = sorted({source.page_number for source in self.sources})
+        self._page_lines: Dict[int, List[StoredLine]] = {}
+        self._remaining = len(self.page_numbers)
+        report.pdf_path = pdf_path
+        report.total_images = len(self.sources)
+        if not self.page_numbers:
+            self._done.set()
+
+    def page_tasks(self) -> List[Tuple[int, List[Tuple[int, ImageSource]]]]:
+        """
+        Splits the document into one task per page.
+
+        Returns:
+            List[Tuple[int, List[Tuple[int, ImageSource]]]]: Page number and the
+                1-based image numbers and sources of the page, in document order
+        """
+        tasks: Dict[int, List[Tuple[int, ImageSource]]] = {}
+        for image_number, source in enumerate(self.sources, start=1):
+            tasks.setdefault(source.page_number, []).append((image_number, source))
+        return list(tasks.items())
+
+    def remaining_seconds(self) -> float:
+        """Returns the time left in the budget, infinite without a budget."""
+        if self.deadline is None:
+            return math.inf
+        return self.deadline - self._clock()
+
+    def done(self) -> bool:
+        """Returns whether every page has finished or been given up."""
+        return self._done.is_set()
+
+    def run_page(
+        self, page_number: int, images: Sequence[Tuple[int, ImageSource]]
+    ) -> None:
+        """
+        Decodes and applies OCR to the images of one page.
+
+        The page counts as finished only if all its images were read before
+        the deadline; otherwise it is left out of the result, and its images
+        are recorded as skipped at the deadline rather than as OCR timeouts.
+
+        Args:
+            page_number (int): 0-based page number
+            images (Sequence[Tuple[int, ImageSource]]): Image numbers and sources of
+                the page
+        """
+        lines: List[StoredLine] = []
+        options = self._options
+
+        try:
+            for position, (image_number, source) in enumerate(images):
+                remaining = self.remaining_seconds()
+                if remaining <= 0:
+                    self._skip_at_deadline(images[position:])
+                    return
+                if self._error is not None or self._result is not None:
+                    return
+
+                with self._lock:
+                    # The document is closed once the result has been returned
+                    if self._result is not None:
+                        return
+                    image = load_image_source(
+                        self._document,
+                        source,
+                        options.render_scale,
+                        options.fast_decode,
+                    )
+                if image is None:
+                    continue
+
+                print(
+                    f"Processing image {image_number}/{len(self.sources)} "
+                    f"of {self.pdf_path}..."
+                )
+                page_timeout = options.page_timeout
+                retry_on_timeout = options.retry_on_timeout
+                image_report = self.report
+                if page_timeout is None or remaining < page_timeout:
+                    # Cut short by the document's budget: a retry would start too late,
+                    # and a timeout is a deadline skip, not a slow image
+                    page_timeout = None if remaining == math.inf else remaining
+                    retry_on_timeout = False
+                    image_report = RunReport()
+                ocr_result = ocr_image_with_budget(
+                    image,
+                    image_number,
+                    self.lang,
+                    page_timeout,
+                    retry_on_timeout,
+                    image_report,
+                    config=options.ocr_config,
+                    preprocessing=options.preprocessing,
+                )
+                if self.remaining_seconds() <= 0 or image_report.timed_out_images:
+                    self._skip_at_deadline(images[position:])
+                    return
+                lines.extend(stored_lines(source, ocr_result))
+
+            with self._lock:
+                self._page_lines[page_number] = lines
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+            self._done.set()
+        finally:
+            with self._lock:
+                self._remaining -= 1
+                finished = self._remaining == 0
+            if finished:
+                self._done.set()
+
+    def _skip_at_deadline(self, images: Sequence[Tuple[int, ImageSource]]) -> None:
+        """Records the images of a page left out because the deadline passed."""
+        for image_number, _ in images:
+            self.report.record_deadline_skip(image_number)
+
+    def result(self) -> ExtractionResult:
+        """
+        Waits for the document until it is done or its time budget runs out.
+
+        Returns:
+            ExtractionResult: Lines of the finished pages, in page order; if the
+                budget ran out first, `partial` is True and `missing_pages` lists
+                the 1-based pages left out
+
+        Raises:
+            Exception: The first error raised while processing a page
+        """
+        remaining = self.remaining_seconds()
+        self._done.wait(None if remaining == math.inf else max(remaining, 0))
+
+        with self._lock:
+            if self._result is None:
+                finished = [
+                    page_number
+                    for page_number in self.page_numbers
+                    if page_number in self._page_lines
+                ]
+                missing = [
+                    page_number + 1
+                    for page_number in self.page_numbers
+                    if page_number not in self._page_lines
+                ]
+                self._result = build_result(
+                    finished,
+                    self._page_lines,
+                    self.validate,
+                    self._options.merge_similar,
+                    self._options.dedup_index,
+                    self._options.dedup_mode,
+                    missing_pages=missing,
+                )
+                self.report.missing_pages = missing
+                self.report.partial = bool(missing)
+                self._document.close()
+
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class OCRScheduler:
+    """
+    A pool of OCR worker threads shared by submitted documents.
+
+    Work is queued as page tasks ordered by priority, then by deadline, then
+    by submission. Workers pick a new task after each page, so a document
+    submitted with a higher priority (a lower number) preempts queued bulk
+    pages at the next page boundary, while pages already being read finish.
+    Tasks of a job whose budget has run out are dropped when they come up.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, workers: int = 1, clock: Callable[[], float] = time.monotonic):
+        """
+        Starts the worker threads.
+
+        Args:
+            workers (int): Number of pages processed at the same time (default: 1)
+            clock (Callable[[], float]): Monotonic clock in seconds that time budgets
+                are measured with (default: time.monotonic)
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError(f"Workers must be at least 1: {workers}")
+
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._tasks: List[Tuple[int, float, int, ScheduledJob, int, list]] = []
+        self._sequence = itertools.count()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"ocr-scheduler-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self,
+        pdf_path: str,
+        lang: str = "eng",
+        validate: bool = True,
+        priority: int = PRIORITY_BULK,
+        time_budget: Optional[float] = None,
+        options: Optional[ExtractionOptions] = None,
+        report: Optional[RunReport] = None,
+        **option_values: Any,
+    ) -> ScheduledJob:
+        """
+        Queues the pages of a document.
+
+        Of the extraction options, the scheduler uses page_timeout, capped by the
+        time left in the document's budget, retry_on_timeout, render_scale,
+        fast_decode, ocr_config, preprocessing, dedup_index, dedup_mode and
+        merge_similar. Concurrency comes from the scheduler's own workers.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+            lang (str): Language for OCR (default: 'eng')
+            validate (bool): Whether to validate extracted lines (default: True)
+            priority (int): Lower runs first (default: PRIORITY_BULK)
+            time_budget (Optional[float]): Seconds after which result() returns the
+                pages finished so far (default: no budget)
+            options (Optional[ExtractionOptions]): Options built once, e.g. for a batch
+                of documents (default: ExtractionOptions())
+            report (Optional[RunReport]): Report filled with timeouts and missing pages
+            **option_values: ExtractionOptions fields overriding those of `options`
+
+        Returns:
+            ScheduledJob: Handle whose result() returns the extracted lines
+
+        Raises:
+            FileNotFoundError: If the PDF file is not found
+            ValueError: If an option is invalid, or lang or preprocessing is 'auto',
+                which need the whole document before OCR starts
+            RuntimeError: If the scheduler is closed
+        """
+        options = resolve_options(options, **option_values)
+        if lang == AUTO_LANGUAGE or options.preprocessing == AUTO_PREPROCESSING:
+            raise ValueError(
+                "Scheduled extraction doesn't support automatic language "
+                "or preprocessing detection"
+            )
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"Time budget must be positive: {time_budget}")
+        if self._closed:
+            raise RuntimeError("Scheduler is closed")
+
+        job = ScheduledJob(
+            pdf_path,
+            lang,
+            validate,
+            priority,
+            time_budget,
+            report if report is not None else RunReport(),
+            options,
+            self._clock,
+        )
+        deadline = job.deadline if job.deadline is not None else math.inf
+
+        with self._condition:
+            for page_number, images in job.page_tasks():
+                heapq.heappush(
+                    self._tasks,
+                    (
+                        priority,
+                        deadline,
+                        next(self._sequence),
+                        job,
+                        page_number,
+                        images,
+                    ),
+                )
+            self._condition.notify_all()
+
+        return job
+
+    def close(self) -> None:
+        """Lets the workers finish the queued pages and stops them."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> "OCRScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _work(self) -> None:
+        """Runs page tasks, highest priority first, until the scheduler is closed."""
+        while True:
+            with self._condition:
+                while not self._tasks and not self._closed:
+                    self._condition.wait()
+                if not self._tasks:
+                    return
+                _, _, _, job, page_number, images = heapq.heappop(self._tasks)
+
+            job.run_page(page_number, images)
@@ -0,0 +1,309 @@
+"""
+Local full-text index of extracted lines.
+
+This module contains the SearchIndex, an SQLite FTS5 index that maps
+normalized tokens to (document, page, line). Documents are added as they
+are extracted and re-indexed only when their file changes, and queries
+answer which PDF and page a description came from.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .results import ExtractionResult
+
+
+SEARCH_INDEX_VERSION = 1
+
+DEFAULT_SEARCH_LIMIT = 20
+
+# Line rowids are (document id << LINE_BITS) + line number, so the lines of a
+# document are one rowid range and can be deleted without a scan
+LINE_BITS = 24
+
+# Lines a single document may have, given LINE_BITS
+MAX_DOCUMENT_LINES = (1 << LINE_BITS) - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    fingerprint TEXT NOT NULL,
+    line_count INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+-- Case and accents are folded, so "ítem" matches "ITEM"
+CREATE VIRTUAL TABLE IF NOT EXISTS lines USING fts5(
+    text,
+    document_id UNINDEXED,
+    page UNINDEXED,
+    line UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+@dataclass
+class SearchHit:
+    """A line matching a query."""
+
+    document: str
+    page: int
+    line: int
+    text: str
+    score: float
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Computes the content hash of a file, read in chunks.
+
+    Args:
+        path (str): Path of the file
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def result_fingerprint(result: ExtractionResult) -> str:
+    """
+    Computes the hash of the lines an extraction produced, with their pages.
+
+    Args:
+        result (ExtractionResult): Extracted lines
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for record in result:
+        digest.update(json.dumps([record.page, record.text]).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turns free text into an FTS5 query that matches lines with all its words.
+
+    Every word is quoted, so characters such as '-' or ':' are not read as
+    query syntax; a trailing '*' keeps its prefix-search meaning.
+
+    Args:
+        query (str): Words to search for
+
+    Returns:
+        str: FTS5 MATCH expression, empty if the query has no words
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """
+    On-disk inverted index of extracted lines.
+
+    Each document is stored with the hash of its file and of its lines;
+    adding a document again replaces its lines if either changed, e.g.
+    after a run with another language or dedup mode. The schema version is
+    kept in the database's user_version, and indexes written by another
+    version are refused rather than read with the wrong layout.
+    """
+
+    def __init__(self, index_path: str):
+        """
+        Args:
+            index_path (str): Path of the SQLite database (created if missing)
+
+        Raises:
+            RuntimeError: If the SQLite library was built without FTS5, or the
+                index was created by another version of the schema
+        """
+        self.index_path = index_path
+        self._connection = sqlite3.connect(index_path)
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        has_tables = (
+            self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1"
+            ).fetchone()
+            is not None
+        )
+        if version != SEARCH_INDEX_VERSION and (version or has_tables):
+            self._connection.close()
+            raise RuntimeError(
+                f"Search index {index_path} has version {version}, "
+                f"expected {SEARCH_INDEX_VERSION}; delete it to rebuild"
+            )
+
+        try:
+            self._connection.executescript(_SCHEMA)
+        except sqlite3.OperationalError as e:
+            self._connection.close()
+            raise RuntimeError(f"SQLite FTS5 is not available: {e}") from e
+
+        self._connection.execute(f"PRAGMA user_version = {SEARCH_INDEX_VERSION}")
+
+    def add_document(
+        self, pdf_path: str, result: ExtractionResult, fingerprint: Optional[str] = None
+    ) -> bool:
+        """
+        Indexes the lines of a document, replacing a previous version of it.
+
+        Line numbers are 1-based positions in the document's extracted text.
+
+        Args:
+            pdf_path (str): Path of the PDF the lines come from
+            result (ExtractionResult): Extracted lines
+            fingerprint (Optional[str]): Content hash of the PDF (default: computed)
+
+        Returns:
+            bool: True if the document was indexed, False if it was already
+                indexed from the same file with the same lines
+
+        Raises:
+            ValueError: If the document has more than MAX_DOCUMENT_LINES lines
+        """
+        if len(result) > MAX_DOCUMENT_LINES:
+            raise ValueError(
+                f"Too many lines to index in one document: {len(result)} "
+                f"(maximum {MAX_DOCUMENT_LINES})"
+            )
+
+        path = os.path.abspath(pdf_path)
+        # The lines depend on the extraction settings as well as on the file
+        fingerprint = (
+            f"{fingerprint or file_fingerprint(pdf_path)}:"
+            f"{result_fingerprint(result)}"
+        )
+
+        with self._connection:
+            row = self._connection.execute(
+                "SELECT id, fingerprint FROM documents WHERE path = ?", (path,)
+            ).fetchone()
+
+            if row and row[1] == fingerprint:
+                return False
+
+            if row:
+                self._delete(row[0])
+
+            document_id = self._connection.execute(
+                "INSERT INTO documents (path, fingerprint, line_count, indexed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (path, fingerprint, len(result), time.time()),
+            ).lastrowid
+            assert document_id is not None  # Always set after an INSERT
+
+            self._connection.executemany(
+                "INSERT INTO lines (rowid, text, document_id, page, line) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        (document_id << LINE_BITS) + number,
+                        record.text,
+                        document_id,
+                        record.page,
+                        number,
+                    )
+                    for number, record in enumerate(result, start=1)
+                ),
+            )
+
+        return True
+
+    def remove_document(self, pdf_path: str) -> bool:
+        """
+        Removes a document and its lines from the index.
+
+        Args:
+            pdf_path (str): Path of the PDF
+
+        Returns:
+            bool: True if the document was indexed
+        """
+        path = os.path.abspath(pdf_path)
+
+        with self._connection:
+            row = self._connection.execute(
+                "SELECT id FROM documents WHERE path = ?", (path,)
+            ).fetchone()
+            if not row:
+                return False
+            self._delete(row[0])
+
+        return True
+
+    def _delete(self, document_id: int) -> None:
+        """Deletes a document and its lines; must run inside a transaction."""
+        self._connection.execute(
+            "DELETE FROM lines WHERE rowid BETWEEN ? AND ?",
+            (document_id << LINE_BITS, ((document_id + 1) << LINE_BITS) - 1),
+        )
+        self._connection.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+
+    def documents(self) -> List[str]:
+        """
+        Lists the indexed documents.
+
+        Returns:
+            List[str]: Absolute paths of the indexed PDFs
+        """
+        rows = self._connection.execute("SELECT path FROM documents ORDER BY path")
+        return [path for (path,) in rows]
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[SearchHit]:
+        """
+        Finds the lines that contain all words of a query, best matches first.
+
+        Args:
+            query (str): Words to search for; a trailing '*' searches by prefix
+            limit (int): Maximum number of hits
+
+        Returns:
+            List[SearchHit]: Matching lines ranked by BM25
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        rows = self._connection.execute(
+            """
+            SELECT documents.path, lines.page, lines.line, lines.text, lines.rank
+            FROM lines JOIN documents ON documents.id = lines.document_id
+            WHERE lines MATCH ?
+            ORDER BY lines.rank
+            LIMIT ?
+            """,
+            (match, limit),
+        )
+        return [
+            SearchHit(path, int(page), int(line), text, -rank)
+            for path, page, line, text, rank in rows
+        ]
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._connection.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,166 @@
+"""
+Shared-memory transport of page images between the renderer and OCR worker processes.
+
+This module contains the SharedPageRing, a reusable set of shared-memory
+segments owned by the parent process, and attach_page_buffer(), which lets
+a worker process view a page without copying it.
+"""
+
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PageBufferHandle:
+    """Picklable reference to a page image stored in a shared segment."""
+
+    segment_name: str
+    slot: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+class SharedPageRing:
+    """
+    A fixed number of reusable shared-memory slots for page images.
+
+    The parent process owns every segment: it writes each page once with
+    write(), hands the handle to a worker and calls release() when the
+    worker is done, whether it succeeded or crashed. Workers only attach,
+    so a crashed worker cannot leak a segment. close() unlinks everything
+    and also runs at interpreter exit.
+    """
+
+    def __init__(self, slots: int):
+        """
+        Args:
+            slots (int): Number of pages that can be in flight at once
+        """
+        self._segments: List[Optional[shared_memory.SharedMemory]] = [None] * slots
+        self._free_slots: "queue.Queue[int]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        for slot in range(slots):
+            self._free_slots.put(slot)
+
+        atexit.register(self.close)
+
+    def write(self, array: np.ndarray) -> PageBufferHandle:
+        """
+        Copies an image into a free slot, blocking until one is available.
+
+        A slot's segment is created on first use and replaced by a larger
+        one when an image does not fit.
+
+        Args:
+            array (np.ndarray): Image to share
+
+        Returns:
+            PageBufferHandle: Handle to pass to a worker
+        """
+        slot = self._free_slots.get()
+
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("SharedPageRing is closed")
+                segment = self._segments[slot]
+                if segment is None or segment.size < array.nbytes:
+                    if segment is not None:
+                        _destroy_segment(segment)
+                    segment = shared_memory.SharedMemory(
+                        create=True, size=max(array.nbytes, 1)
+                    )
+                    self._segments[slot] = segment
+
+            view: np.ndarray = np.ndarray(
+                array.shape, dtype=array.dtype, buffer=segment.buf
+            )
+            view[...] = array
+            del view  # Don't keep an export of the buffer alive
+        except BaseException:
+            self._free_slots.put(slot)
+            raise
+
+        return PageBufferHandle(segment.name, slot, tuple(array.shape), array.dtype.str)
+
+    def release(self, handle: PageBufferHandle) -> None:
+        """
+        Returns a slot to the ring once its worker has finished.
+
+        Args:
+            handle (PageBufferHandle): Handle returned by write()
+        """
+        self._free_slots.put(handle.slot)
+
+    def close(self) -> None:
+        """Closes and unlinks all segments. Safe to call more than once."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+            for slot, segment in enumerate(self._segments):
+                if segment is not None:
+                    _destroy_segment(segment)
+                    self._segments[slot] = None
+
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "SharedPageRing":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# Segments attached by this (worker) process, by slot
+_attached_segments: Dict[int, shared_memory.SharedMemory] = {}
+
+
+@contextmanager
+def attach_page_buffer(handle: PageBufferHandle) -> Iterator[np.ndarray]:
+    """
+    Gives a worker a zero-copy view of a shared page image.
+
+    Attached segments are cached per slot, so a worker maps each segment
+    once and not once per page. The view must not be used after the block.
+
+    Args:
+        handle (PageBufferHandle): Handle created by SharedPageRing.write()
+
+    Yields:
+        np.ndarray: Image backed by the shared segment
+    """
+    segment = _attached_segments.get(handle.slot)
+
+    if segment is None or segment.name != handle.segment_name:
+        if segment is not None:
+            segment.close()  # The parent replaced this slot's segment
+        segment = shared_memory.SharedMemory(name=handle.segment_name)
+        _attached_segments[handle.slot] = segment
+
+    view: np.ndarray = np.ndarray(
+        handle.shape, dtype=np.dtype(handle.dtype), buffer=segment.buf
+    )
+    try:
+        yield view
+    finally:
+        del view
+
+
+def _destroy_segment(segment: shared_memory.SharedMemory) -> None:
+    """Closes and unlinks a segment owned by this process."""
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
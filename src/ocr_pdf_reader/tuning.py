@@ -0,0 +1,135 @@
+"""
+Per-document preprocessing auto-tuner.
+
+This module contains functions for:
+- Trying candidate preprocessing chains on a few sample pages of a document
+- Scoring each chain by OCR confidence and time
+- Choosing the cheapest chain whose score is within a tolerance of the best
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence
+
+import fitz  # PyMuPDF
+
+from .image_processor import (
+    ImageSource,
+    OCRTimeoutError,
+    load_image_source,
+    ocr_image,
+    sample_image_sources,
+    DEFAULT_OCR_CONFIG,
+    RENDER_RESOLUTION_MULTIPLIER,
+)
+
+
+# Value of `preprocessing` that tunes the chain per document
+AUTO_PREPROCESSING = "auto"
+
+# Chains tried by the tuner, from PREPROCESSING_CHAINS
+TUNING_CANDIDATES = ("none", "downscale", "default", "adaptive", "denoise")
+
+# Confidence points a chain may lose against the best one and still be chosen
+DEFAULT_TUNING_TOLERANCE = 5.0
+
+# Pages sampled per document
+TUNING_SAMPLE_PAGES = 2
+
+
+@dataclass
+class TuningResult:
+    """Chain chosen for a document and the measurements behind the choice."""
+
+    chain: str
+    trials: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    sampled_pages: List[int] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def tune_preprocessing(
+    pdf_document: fitz.Document,
+    sources: Sequence[ImageSource],
+    lang: str = "eng",
+    candidates: Sequence[str] = TUNING_CANDIDATES,
+    tolerance: float = DEFAULT_TUNING_TOLERANCE,
+    sample_pages: int = TUNING_SAMPLE_PAGES,
+    render_scale: float = RENDER_RESOLUTION_MULTIPLIER,
+    fast_decode: bool = True,
+    **ocr_options: Any,
+) -> TuningResult:
+    """
+    Chooses the preprocessing chain of a document from sample pages.
+
+    Every candidate chain is run with OCR on the same sample images. A
+    chain's score is its mean word confidence scaled by the share of words
+    it found compared with the chain that found most, so a chain that drops
+    faint words can't win on the confidence of the few words left. Among
+    the chains scoring within `tolerance` of the best, the fastest wins.
+
+    Args:
+        pdf_document (fitz.Document): Opened PDF document
+        sources (Sequence[ImageSource]): Images of the document
+        lang (str): Language for OCR
+        candidates (Sequence[str]): Chain names tried (default: TUNING_CANDIDATES)
+        tolerance (float): Score points a chain may lose against the best (default: 5)
+        sample_pages (int): Number of pages sampled (default: 2)
+        render_scale (float): Scale used to render pages without embedded images
+        fast_decode (bool): Whether to use the fast decode path
+        **ocr_options: Options passed to ocr_image (config, rotate, timeout)
+
+    Returns:
+        TuningResult: Chosen chain, per-chain confidence, words, seconds and score,
+            and the total time spent tuning
+    """
+    start = time.perf_counter()
+    ocr_options.setdefault("config", DEFAULT_OCR_CONFIG)
+    result = TuningResult(chain=candidates[0])
+
+    images = []
+    for source in sample_image_sources(sources, sample_pages):
+        image = load_image_source(pdf_document, source, render_scale, fast_decode)
+        if image is not None:
+            images.append(image)
+            result.sampled_pages.append(source.page_number + 1)
+
+    if not images:
+        result.seconds = time.perf_counter() - start
+        return result
+
+    for chain in candidates:
+        confidences = []
+        words = 0
+        chain_start = time.perf_counter()
+
+        for image in images:
+            try:
+                ocr_result = ocr_image(image, lang, preprocessing=chain, **ocr_options)
+            except OCRTimeoutError:
+                continue
+            if ocr_result.words:
+                confidences.append(ocr_result.mean_confidence)
+                words += len(ocr_result.words)
+
+        result.trials[chain] = {
+            "confidence": (
+                round(sum(confidences) / len(confidences), 2) if confidences else 0.0
+            ),
+            "words": words,
+            "seconds": round(time.perf_counter() - chain_start, 4),
+        }
+
+    most_words = max(trial["words"] for trial in result.trials.values()) or 1
+    for trial in result.trials.values():
+        trial["score"] = round(trial["confidence"] * trial["words"] / most_words, 2)
+
+    best_score = max(trial["score"] for trial in result.trials.values())
+    eligible = [
+        chain
+        for chain, trial in result.trials.items()
+        if trial["score"] >= best_score - tolerance
+    ]
+    result.chain = min(eligible, key=lambda chain: result.trials[chain]["seconds"])
+    result.seconds = time.perf_counter() - start
+
+    return result
@@ -0,0 +1,303 @@
+"""
+Watch-folder mode for the OCR PDF Reader.
+
+This module contains the DirectoryWatcher, which polls a directory for new
+PDFs, waits until they are fully written, extracts their text with a pool
+of long-lived workers and moves each file aside once it is done.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .core import extract_results_from_pdf
+from .report import RunReport
+from .search_index import SearchIndex
+
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Seconds a file must stay unchanged before it is considered fully written
+DEFAULT_SETTLE_SECONDS = 5.0
+
+STATE_FILENAME = ".ocr-watch-state.json"
+
+
+class DirectoryWatcher:
+    """
+    Processes PDFs dropped into a directory.
+
+    A file is picked up once its size and mtime are the same on two
+    consecutive polls and it has not been modified for settle_seconds.
+    Finished files are moved to processed_dir or failed_dir, and a state
+    file records every file by name, size and mtime so a restart does not
+    repeat work. Progress messages are only emitted through the optional
+    `log` callback.
+    """
+
+    def __init__(
+        self,
+        input_dir: str,
+        output_dir: str,
+        processed_dir: Optional[str] = None,
+        failed_dir: Optional[str] = None,
+        state_path: Optional[str] = None,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        file_workers: int = 1,
+        index_path: Optional[str] = None,
+        log: Optional[Callable[[str], None]] = None,
+        **options: Any,
+    ):
+        """
+        Args:
+            input_dir (str): Directory watched for new PDFs
+            output_dir (str): Directory where extracted text is written
+            processed_dir (Optional[str]): Where processed PDFs are moved
+                (default: input_dir/processed)
+            failed_dir (Optional[str]): Where failed PDFs are moved
+                (default: input_dir/failed)
+            state_path (Optional[str]): State file
+                (default: input_dir/.ocr-watch-state.json)
+            settle_seconds (float): Seconds a file must stay unchanged before processing
+            file_workers (int): Number of PDFs processed at the same time
+            index_path (Optional[str]): Full-text index updated with each processed PDF
+            log (Optional[Callable[[str], None]]): Receives progress and error messages,
+                e.g. print (default: silent)
+            **options: Options passed to extract_results_from_pdf (lang, workers, ...)
+        """
+        self.input_dir = Path(input_dir)
+        self.output_dir = Path(output_dir)
+        self.processed_dir = (
+            Path(processed_dir) if processed_dir else self.input_dir / "processed"
+        )
+        self.failed_dir = Path(failed_dir) if failed_dir else self.input_dir / "failed"
+        self.state_path = (
+            Path(state_path) if state_path else self.input_dir / STATE_FILENAME
+        )
+        self.settle_seconds = settle_seconds
+        self.index_path = index_path
+        self.log = log
+        self.options = options
+
+        for directory in (self.output_dir, self.processed_dir, self.failed_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self.state: Dict[str, Dict[str, Any]] = self._load_state()
+        self._observations: Dict[str, Tuple[int, float]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._state_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        # Workers stay alive for the whole session instead of starting per file
+        self._executor = ThreadPoolExecutor(max_workers=file_workers)
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        if not self.state_path.exists():
+            return {}
+        with open(self.state_path, encoding="utf-8") as f:
+            state: Dict[str, Dict[str, Any]] = json.load(f)
+        return state
+
+    def _save_state(self) -> None:
+        temp_path = self.state_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.state_path)
+
+    def _log(self, message: str) -> None:
+        if self.log is not None:
+            self.log(message)
+
+    @staticmethod
+    def _state_key(path: Path, size: int, mtime: float) -> str:
+        return f"{path.name}:{size}:{mtime:.6f}"
+
+    def poll(self) -> List[Path]:
+        """
+        Scans the input directory once.
+
+        Returns:
+            List[Path]: PDFs that are fully written and not yet processed
+        """
+        ready = []
+        seen = set()
+        now = time.time()
+
+        for path in sorted(self.input_dir.glob("*.pdf")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Removed between listing and stat
+
+            signature = (stat.st_size, stat.st_mtime)
+            seen.add(path.name)
+            previous = self._observations.get(path.name)
+            self._observations[path.name] = signature
+
+            if path.name in self._in_flight:
+                continue
+            if self._state_key(path, *signature) in self.state:
+                continue
+            if previous == signature and now - stat.st_mtime >= self.settle_seconds:
+                ready.append(path)
+
+        # Forget files that disappeared
+        for name in set(self._observations) - seen:
+            del self._observations[name]
+
+        return ready
+
+    def submit_ready(self) -> List[Path]:
+        """
+        Polls the directory and hands ready files to the workers.
+
+        Returns:
+            List[Path]: Files submitted in this call
+        """
+        self._in_flight = {
+            name: future
+            for name, future in self._in_flight.items()
+            if not future.done()
+        }
+        ready = self.poll()
+
+        for path in ready:
+            self._in_flight[path.name] = self._executor.submit(self.process_file, path)
+
+        return ready
+
+    def process_file(self, path: Path) -> bool:
+        """
+        Extracts the text of a PDF, writes it and its run report to the output
+        directory and moves the PDF aside.
+
+        Outputs are named after the PDF; when a PDF of the same name was
+        processed before, a timestamp is added so its outputs are kept. Every
+        outcome is recorded in the state: a PDF that vanished or couldn't be
+        moved is marked failed, and a failure to index the moved PDF is
+        recorded in its entry.
+
+        Args:
+            path (Path): PDF to process
+
+        Returns:
+            bool: True if the file was processed, False if it failed
+        """
+        # Signature seen by poll(), in case the file is gone before it is read
+        key = self._state_key(path, *self._observations.get(path.name, (0, 0.0)))
+        report = RunReport()
+        entry: Dict[str, Any]
+
+        self._log(f"Processing {path.name}...")
+        try:
+            stat = path.stat()
+            key = self._state_key(path, stat.st_size, stat.st_mtime)
+            output_stem = _unused_stem(self.output_dir, path.stem, ".txt")
+            output_file = self.output_dir / f"{output_stem}.txt"
+
+            result = extract_results_from_pdf(str(path), report=report, **self.options)
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                for line in result.texts:
+                    f.write(line + "\n")
+
+            report.save(str(self.output_dir / f"{output_stem}.report.json"))
+
+            moved_to = _move_aside(path, self.processed_dir)
+            entry = {
+                "status": "processed",
+                "output": str(output_file),
+                "lines": len(result),
+                "moved_to": str(moved_to),
+            }
+        except Exception as e:
+            self._log(f"Error processing {path.name}: {e}")
+            entry = {"status": "failed", "error": str(e)}
+            try:
+                entry["moved_to"] = str(_move_aside(path, self.failed_dir))
+            except OSError as move_error:
+                self._log(f"Error moving {path.name} aside: {move_error}")
+                entry["move_error"] = str(move_error)
+
+        entry["finished_at"] = time.time()
+
+        if self.index_path and entry["status"] == "processed":
+            # Indexed under the path the PDF was moved to. The PDF is already
+            # out of the input directory, so the failure must reach the state
+            try:
+                with self._index_lock, SearchIndex(self.index_path) as index:
+                    index.add_document(str(moved_to), result)
+            except Exception as e:
+                self._log(f"Error indexing {path.name}: {e}")
+                entry["index_error"] = str(e)
+
+        with self._state_lock:
+            self.state[key] = entry
+            self._save_state()
+
+        return bool(entry["status"] == "processed")
+
+    def run(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        stop_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Polls the directory until stop_event is set or the process is interrupted.
+
+        Args:
+            poll_interval (float): Seconds between polls
+            stop_event (Optional[threading.Event]): Event that stops the loop
+        """
+        stop_event = stop_event or threading.Event()
+
+        self._log(f"Watching {self.input_dir} (Ctrl+C to stop)...")
+        try:
+            while not stop_event.is_set():
+                self.submit_ready()
+                stop_event.wait(poll_interval)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Waits for files being processed and stops the workers."""
+        self._executor.shutdown(wait=True)
+
+
+def _move_aside(path: Path, directory: Path) -> Path:
+    """
+    Moves a file into a directory without overwriting an existing file.
+
+    Args:
+        path (Path): File to move
+        directory (Path): Destination directory
+
+    Returns:
+        Path: New location of the file
+    """
+    destination = (
+        directory / f"{_unused_stem(directory, path.stem, path.suffix)}{path.suffix}"
+    )
+    shutil.move(str(path), str(destination))
+    return destination
+
+
+def _unused_stem(directory: Path, stem: str, suffix: str) -> str:
+    """
+    Returns a file stem that doesn't clash with an existing file of a directory.
+
+    Args:
+        directory (Path): Directory where the file will be written
+        stem (str): Preferred stem
+        suffix (str): Suffix of the file, used to look for a clash
+
+    Returns:
+        str: The stem, or the stem with a millisecond timestamp if it is taken
+    """
+    if not (directory / f"{stem}{suffix}").exists():
+        return stem
+    return f"{stem}.{int(time.time() * 1000)}"
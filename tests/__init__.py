@@ -1,3 +1,3 @@
 """
 Tests for the OCR PDF Reader.
-""" 
\ No newline at end of file
+"""
@@ -0,0 +1,67 @@
+"""
+Builders shared by the unit tests: PDFs, Tesseract output and extraction results.
+"""
+
+import fitz
+
+from ocr_pdf_reader.results import ExtractionResult
+
+
+def write_pdf(path, page_texts):
+    """Writes a PDF with one 200 x 100 pt page per text and returns its path."""
+    document = fitz.open()
+    for text in page_texts:
+        page = document.new_page(width=200, height=100)
+        page.insert_text((10, 50), text)
+    document.save(path)
+    document.close()
+    return path
+
+
+def make_pdf(path, pages, text="{number} - ITEM"):
+    """Writes a PDF of numbered pages; {number} in text is the 1-based page number."""
+    return write_pdf(
+        path, [text.format(number=number) for number in range(1, pages + 1)]
+    )
+
+
+def tesseract_data(text):
+    """Builds an image_to_data dictionary with one line per line of text."""
+    data = {
+        key: []
+        for key in (
+            "text",
+            "block_num",
+            "par_num",
+            "line_num",
+            "left",
+            "top",
+            "width",
+            "height",
+            "conf",
+        )
+    }
+    for line_num, line in enumerate(text.splitlines()):
+        for word_num, word in enumerate(line.split()):
+            data["text"].append(word)
+            data["block_num"].append(1)
+            data["par_num"].append(1)
+            data["line_num"].append(line_num)
+            data["left"].append(word_num * 50)
+            data["top"].append(line_num * 20)
+            data["width"].append(40)
+            data["height"].append(15)
+            data["conf"].append(90.0)
+    return data
+
+
+def make_result(*lines):
+    """
+    Builds an ExtractionResult from texts, one page each, or (page, text) pairs.
+    """
+    result = ExtractionResult()
+    for page, line in enumerate(lines, start=1):
+        if isinstance(line, tuple):
+            page, line = line
+        result.append(line, page, -1)
+    return result
@@ -0,0 +1,172 @@
+"""
+Unit tests for the CPU-aware choice of OCR concurrency.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import time
+import sys
+import os
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import autoconfig, cli
+from ocr_pdf_reader.autoconfig import (
+    OCR_THREADS_VARIABLE,
+    auto_configure,
+    available_cpus,
+    candidate_configurations,
+    cgroup_cpu_limit,
+    ocr_thread_limit,
+)
+from ocr_pdf_reader.image_processor import OCRResult
+from tests.helpers import make_pdf
+
+
+class TestCPULimits(unittest.TestCase):
+    """Tests for affinity and cgroup quota detection."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, relative_path, content):
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    def test_cgroup_v2_quota(self):
+        """Test cpu.max with a quota and without one."""
+        self._write("cpu.max", "150000 100000\n")
+        self.assertEqual(cgroup_cpu_limit(self.root), 1.5)
+
+        self._write("cpu.max", "max 100000\n")
+        self.assertIsNone(cgroup_cpu_limit(self.root))
+
+        self._write("cpu.max", "150000 0\n")
+        self.assertIsNone(cgroup_cpu_limit(self.root))
+
+    def test_cgroup_v1_quota(self):
+        """Test the CFS quota and period of cgroup v1, -1 meaning unlimited."""
+        self._write("cpu,cpuacct/cpu.cfs_quota_us", "200000\n")
+        self._write("cpu,cpuacct/cpu.cfs_period_us", "100000\n")
+        self.assertEqual(cgroup_cpu_limit(self.root), 2.0)
+
+        self._write("cpu,cpuacct/cpu.cfs_quota_us", "-1\n")
+        self.assertIsNone(cgroup_cpu_limit(self.root))
+
+    def test_quota_of_own_nested_cgroup(self):
+        """Test that the process's own cgroup and its ancestors are read."""
+        self._write("self-cgroup", "0::/kubepods/pod1/container\n")
+        self._write("cgroup.controllers", "cpu memory\n")
+        self._write("kubepods/pod1/cpu.max", "300000 100000\n")
+        self._write("kubepods/pod1/container/cpu.max", "max 100000\n")
+        proc_cgroup = os.path.join(self.root, "self-cgroup")
+        self.assertEqual(cgroup_cpu_limit(self.root, proc_cgroup), 3.0)
+
+        # A smaller quota of an ancestor applies too
+        self._write("kubepods/cpu.max", "150000 100000\n")
+        self.assertEqual(cgroup_cpu_limit(self.root, proc_cgroup), 1.5)
+
+    def test_quota_of_own_nested_cgroup_v1(self):
+        """Test that a cgroup v1 quota is read from the process's cpu cgroup."""
+        self._write(
+            "self-cgroup", "4:memory:/other\n3:cpu,cpuacct:/system.slice/ocr.service\n"
+        )
+        self._write("cpu,cpuacct/system.slice/ocr.service/cpu.cfs_quota_us", "50000\n")
+        self._write(
+            "cpu,cpuacct/system.slice/ocr.service/cpu.cfs_period_us", "100000\n"
+        )
+
+        self.assertEqual(
+            cgroup_cpu_limit(self.root, os.path.join(self.root, "self-cgroup")), 0.5
+        )
+
+    def test_quota_caps_affinity(self):
+        """Test that a fractional quota is rounded up and caps the affinity mask."""
+        self._write("cpu.max", "250000 100000\n")
+
+        with mock.patch.object(
+            os, "sched_getaffinity", return_value=set(range(8)), create=True
+        ):
+            self.assertEqual(available_cpus(self.root), 3)
+            self.assertEqual(available_cpus(os.path.join(self.root, "missing")), 8)
+
+    def test_candidates_never_oversubscribe(self):
+        """Test that workers x threads stays within the CPUs."""
+        self.assertEqual(candidate_configurations(4), [(4, 1), (2, 2), (1, 4)])
+        self.assertEqual(candidate_configurations(1), [(1, 1)])
+
+    def test_thread_limit_is_restored(self):
+        """Test that the OMP_THREAD_LIMIT of a calibration trial doesn't leak."""
+        with mock.patch.dict(os.environ, {OCR_THREADS_VARIABLE: "3"}):
+            with ocr_thread_limit(1):
+                self.assertEqual(os.environ[OCR_THREADS_VARIABLE], "1")
+            self.assertEqual(os.environ[OCR_THREADS_VARIABLE], "3")
+
+
+class TestCalibration(unittest.TestCase):
+    """Tests for calibration and saved configurations."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = make_pdf(os.path.join(self.tmpdir.name, "pages.pdf"), 2)
+        self.config_path = os.path.join(self.tmpdir.name, "concurrency.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_fastest_configuration_is_saved_and_reused(self):
+        """Test that calibration picks the fastest option and later runs reuse it."""
+
+        def fake_ocr_image(image, lang="eng", **options):
+            # More Tesseract threads per process help little on these pages
+            time.sleep(0.02 if os.environ[OCR_THREADS_VARIABLE] == "1" else 0.03)
+            return OCRResult("1 - ITEM")
+
+        no_quota = os.path.join(self.tmpdir.name, "no-cgroup")
+        with (
+            mock.patch.object(autoconfig, "ocr_image", side_effect=fake_ocr_image),
+            mock.patch.object(
+                os, "sched_getaffinity", return_value={0, 1}, create=True
+            ),
+        ):
+            calibrated = auto_configure(
+                self.pdf_path, path=self.config_path, cgroup_root=no_quota
+            )
+            saved = auto_configure(path=self.config_path, cgroup_root=no_quota)
+
+        self.assertEqual((calibrated.workers, calibrated.ocr_threads), (2, 1))
+        self.assertEqual(set(calibrated.trials), {"2x1", "1x2"})
+        self.assertEqual(saved.source, "saved")
+        self.assertEqual((saved.workers, saved.ocr_threads), (2, 1))
+
+    def test_heuristic_without_saved_configuration(self):
+        """Test one single-threaded worker per CPU when nothing was calibrated."""
+        with mock.patch.object(
+            os, "sched_getaffinity", return_value=set(range(6)), create=True
+        ):
+            concurrency = auto_configure(
+                path=self.config_path,
+                cgroup_root=os.path.join(self.tmpdir.name, "none"),
+            )
+
+        self.assertEqual(
+            (concurrency.workers, concurrency.ocr_threads, concurrency.source),
+            (6, 1, "heuristic"),
+        )
+
+    def test_calibration_does_not_override_explicit_workers(self):
+        """Test that --calibrate with --workers N is refused instead of ignoring N."""
+        with self.assertRaises(SystemExit), mock.patch("sys.stderr"):
+            cli.main([self.pdf_path, "--calibrate", "--workers", "4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for the corpus-wide deduplication index.
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader.dedup import BloomFilter, DedupIndex, line_hash, line_hashes
+from tests.helpers import make_result
+
+
+class TestDedupIndex(unittest.TestCase):
+    """Tests for counting, modes and persistence."""
+
+    def test_hash_ignores_spacing(self):
+        """Test that lines differing only in whitespace share a key."""
+        self.assertEqual(
+            line_hash("PARAFUSO  SEXTAVADO "), line_hash("PARAFUSO SEXTAVADO")
+        )
+        self.assertNotEqual(line_hash("PARAFUSO"), line_hash("PORCA"))
+
+    def test_first_mode_drops_lines_seen_before(self):
+        """Test that only first occurrences across documents are kept."""
+        index = DedupIndex()
+        first = index.apply(make_result("BOLT", "NUT", "BOLT"), "first")
+        second = index.apply(make_result("NUT", "WASHER"), "first")
+
+        self.assertEqual(list(first.texts), ["BOLT", "NUT"])
+        self.assertEqual(list(second.texts), ["WASHER"])
+        self.assertEqual(second[0].page, 2)
+        self.assertEqual(index.count("BOLT"), 2)
+        self.assertEqual(len(index), 3)
+
+    def test_count_mode_reports_totals(self):
+        """Test that count mode keeps one copy with the corpus-wide count."""
+        index = DedupIndex()
+        index.apply(make_result("BOLT", "NUT"), "count")
+        result = index.apply(make_result("BOLT", "BOLT", "SCREW"), "count")
+
+        self.assertEqual(
+            [(record.text, record.occurrences) for record in result],
+            [("BOLT", 3), ("SCREW", 1)],
+        )
+
+    def test_unknown_mode_is_rejected(self):
+        """Test that an unknown mode raises ValueError."""
+        with self.assertRaises(ValueError):
+            DedupIndex().apply(make_result("BOLT"), "latest")
+
+    def test_save_and_load_keep_counts_and_bloom(self):
+        """Test that a saved index is restored with its Bloom filter."""
+        index = DedupIndex(bloom_capacity=1000)
+        index.apply(make_result("BOLT", "NUT", "BOLT"), "first")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lines.npz")
+            index.save(path)
+            loaded = DedupIndex.load(path)
+
+        self.assertEqual(loaded.count("BOLT"), 2)
+        self.assertNotIn("WASHER", loaded)
+        self.assertIsNotNone(loaded.bloom)
+        result = loaded.apply(make_result("NUT", "WASHER"), "first")
+        self.assertEqual(list(result.texts), ["WASHER"])
+
+    def test_bloom_is_built_when_loading_an_index_saved_without_one(self):
+        """Test that a requested Bloom filter is filled from the loaded hashes."""
+        index = DedupIndex()
+        index.apply(make_result("BOLT", "NUT"), "first")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lines.npz")
+            index.save(path)
+            loaded = DedupIndex.load(path, bloom_capacity=1000)
+
+        self.assertIsNotNone(loaded.bloom)
+        self.assertIn("BOLT", loaded)
+        result = loaded.apply(make_result("NUT", "WASHER"), "first")
+        self.assertEqual(list(result.texts), ["WASHER"])
+
+    def test_batches_keep_the_index_sorted(self):
+        """Test that merging new and known lines keeps hashes and counts aligned."""
+        index = DedupIndex()
+        index.update([f"ITEM {number}" for number in range(0, 1000, 2)])
+        index.update([f"ITEM {number}" for number in range(1000)])
+
+        self.assertTrue(np.all(index._hashes[1:] > index._hashes[:-1]))
+        self.assertEqual(index.count("ITEM 10"), 2)
+        self.assertEqual(index.count("ITEM 11"), 1)
+        self.assertEqual(len(index), 1000)
+
+    def test_memory_is_twelve_bytes_per_line(self):
+        """Test the predictable memory of the sorted arrays."""
+        index = DedupIndex()
+        index.update([f"ITEM {number}" for number in range(10000)])
+        self.assertEqual(index.memory_bytes(), 12 * 10000)
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Tests for the Bloom filter front end."""
+
+    def test_no_false_negatives_and_few_false_positives(self):
+        """Test that added keys are always found and the error rate holds."""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        added = line_hashes([f"ADDED {number}" for number in range(5000)])
+        others = line_hashes([f"OTHER {number}" for number in range(5000)])
+        bloom.add(added)
+
+        self.assertTrue(bloom.might_contain(added).all())
+        self.assertLess(np.mean(bloom.might_contain(others)), 0.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
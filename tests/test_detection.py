@@ -0,0 +1,163 @@
+"""
+Unit tests for language and orientation detection.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+import fitz
+import numpy as np
+import pytesseract
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core, detection
+from ocr_pdf_reader.detection import classify_language
+from ocr_pdf_reader.image_processor import preprocess_image
+from ocr_pdf_reader.report import RunReport
+from tests.helpers import make_pdf, tesseract_data
+
+
+class TestLanguageClassifier(unittest.TestCase):
+    """Tests for the stopword and letter classifier."""
+
+    def test_classifies_by_stopwords_and_letters(self):
+        """Test that each language wins on its own text."""
+        candidates = ["eng", "por", "spa"]
+
+        self.assertEqual(
+            classify_language("the list of parts and the prices", candidates), "eng"
+        )
+        self.assertEqual(
+            classify_language("lista de peças com preço não incluído", candidates),
+            "por",
+        )
+        self.assertEqual(
+            classify_language("lista de piezas con el año", candidates), "spa"
+        )
+
+    def test_inconclusive_text_returns_none(self):
+        """Test that text without clues keeps all candidates."""
+        self.assertIsNone(
+            classify_language("PARAFUSO SEXTAVADO M8", ["eng", "por", "spa"])
+        )
+
+
+class TestRotation(unittest.TestCase):
+    """Tests for pre-rotated preprocessing."""
+
+    def test_rotation_is_clockwise(self):
+        """Test that rotate=90 turns the image clockwise before preprocessing."""
+        image = np.zeros((2, 3), np.uint8)
+        image[0, 0] = 255
+
+        rotated = preprocess_image(image, "none", rotate=90)
+
+        self.assertEqual(rotated.shape, (3, 2))
+        self.assertEqual(rotated[0, 1], 255)
+
+
+class TestAutoLanguage(unittest.TestCase):
+    """Tests for extraction with lang='auto'."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = make_pdf(os.path.join(self.tmpdir.name, "pages.pdf"), 3)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_detected_language_and_rotation_are_used_for_all_pages(self):
+        """Test that samples try all candidates and pages use the detected model."""
+        calls = []
+
+        def fake_image_to_data(image, lang, **kwargs):
+            calls.append((lang, image.shape))
+            return tesseract_data("1 - peça de reposição não incluída")
+
+        osd = {
+            "rotate": 90,
+            "orientation_conf": 5.0,
+            "script": "Latin",
+            "script_conf": 3.0,
+        }
+        report = RunReport()
+
+        with (
+            mock.patch.object(
+                pytesseract, "image_to_osd", return_value=osd
+            ) as image_to_osd,
+            mock.patch.object(
+                pytesseract, "image_to_data", side_effect=fake_image_to_data
+            ),
+        ):
+            core.extract_text_from_pdf(self.pdf_path, lang="auto", report=report)
+
+        self.assertEqual(image_to_osd.call_count, 2)
+        self.assertEqual([lang for lang, _ in calls], ["eng+por+spa"] * 2 + ["por"] * 3)
+        # Pages are 400x200 when rendered; rotated they are taller than wide
+        self.assertEqual(calls[-1][1], (400, 200))
+        self.assertEqual(
+            (report.detected_language, report.detected_rotation), ("por", 90)
+        )
+
+    def test_candidates_are_limited_to_installed_models(self):
+        """Test that inconclusive samples fall back to the installed candidates only."""
+        calls = []
+
+        def fake_image_to_data(image, lang, **kwargs):
+            calls.append(lang)
+            return tesseract_data("1 - PARAFUSO SEXTAVADO")
+
+        osd = {
+            "rotate": 0,
+            "orientation_conf": 5.0,
+            "script": "Latin",
+            "script_conf": 3.0,
+        }
+        report = RunReport()
+
+        with (
+            mock.patch.object(
+                detection, "_installed_languages", return_value=["eng", "spa"]
+            ),
+            mock.patch.object(pytesseract, "image_to_osd", return_value=osd),
+            mock.patch.object(
+                pytesseract, "image_to_data", side_effect=fake_image_to_data
+            ),
+        ):
+            core.extract_text_from_pdf(self.pdf_path, lang="auto", report=report)
+
+        self.assertEqual(report.detected_language, "eng+spa")
+        self.assertEqual(set(calls), {"eng+spa"})
+
+    def test_script_language_is_kept_when_models_cannot_be_listed(self):
+        """Test that a script-detected model is used when models can't be listed."""
+        osd = {
+            "rotate": 0,
+            "orientation_conf": 5.0,
+            "script": "Cyrillic",
+            "script_conf": 3.0,
+        }
+
+        with (
+            fitz.open(self.pdf_path) as document,
+            mock.patch.object(detection, "_installed_languages", return_value=None),
+            mock.patch.object(pytesseract, "image_to_osd", return_value=osd),
+            mock.patch.object(
+                pytesseract, "image_to_data", return_value=tesseract_data("1 - болт")
+            ),
+        ):
+            result = detection.detect_document_language(
+                document, core.list_image_sources(document)
+            )
+
+        self.assertEqual(result.language, "rus")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit tests for the preset evaluation harness.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader.evaluation import (
+    PRESETS,
+    PresetResult,
+    character_error_rate,
+    character_errors,
+    edit_distance,
+    evaluate_presets,
+    format_comparison_table,
+    line_recall,
+    load_corpus,
+    make_synthetic_corpus,
+)
+from tests.helpers import tesseract_data
+
+
+class TestEvaluation(unittest.TestCase):
+    """Tests for metrics and the synthetic corpus."""
+
+    def test_edit_distance(self):
+        """Test the Levenshtein distance."""
+        self.assertEqual(edit_distance("PARAFUSO", "PARAFUS0"), 1)
+        self.assertEqual(edit_distance("", "ABC"), 3)
+        self.assertEqual(edit_distance("KITTEN", "SITTING"), 3)
+
+    def test_character_error_rate(self):
+        """Test CER over joined lines."""
+        self.assertEqual(character_error_rate(["ABCD"], ["ABCD"]), 0.0)
+        self.assertEqual(character_error_rate(["ABCD"], ["ABCX"]), 0.25)
+
+    def test_character_errors(self):
+        """Test the edit distance and ground-truth length of one document."""
+        self.assertEqual(character_errors(["AB", "CD"], ["AB", "CX"]), (1, 5))
+        self.assertEqual(character_errors([], ["AB"]), (2, 0))
+
+    def test_line_recall_ignores_extra_spaces(self):
+        """Test line recall with whitespace differences."""
+        reference = ["FIRST ITEM", "SECOND ITEM"]
+        self.assertEqual(line_recall(reference, ["FIRST  ITEM"]), 0.5)
+
+    def test_synthetic_corpus_is_loaded(self):
+        """Test that generated PDFs are paired with their ground truth."""
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = make_synthetic_corpus(directory, documents=2, lines_per_document=5)
+            self.assertEqual(len(corpus), 2)
+            self.assertEqual(corpus, load_corpus(directory))
+
+            with open(corpus[0][1], encoding="utf-8") as f:
+                self.assertEqual(len(f.read().splitlines()), 5)
+
+    def test_evaluate_presets_with_perfect_ocr(self):
+        """Test that perfect OCR output gives zero CER and full recall."""
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = make_synthetic_corpus(directory, documents=1, lines_per_document=4)
+            with open(corpus[0][1], encoding="utf-8") as f:
+                truth = f.read().splitlines()
+            ocr_text = " ".join(f"{i + 1} - {line}" for i, line in enumerate(truth))
+
+            with mock.patch(
+                "pytesseract.image_to_data", return_value=tesseract_data(ocr_text)
+            ):
+                results = evaluate_presets(corpus, [PRESETS["fast"]])
+
+        self.assertEqual(results[0].pages, 1)
+        self.assertEqual(results[0].character_error_rate, 0.0)
+        self.assertEqual(results[0].line_recall, 1.0)
+
+    def test_comparison_table(self):
+        """Test that the table has a row per preset."""
+        results = [PresetResult("fast", 10, 2.0, 0.05, 0.9)]
+        table = format_comparison_table(results)
+        self.assertIn("fast", table)
+        self.assertIn("5.00", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
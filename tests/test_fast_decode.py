@@ -0,0 +1,122 @@
+"""
+Unit tests for the fast decode path of embedded images.
+"""
+
+import unittest
+import tempfile
+import io
+import sys
+import os
+
+import fitz
+import numpy as np
+from PIL import Image
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader.image_processor import (
+    list_image_sources,
+    load_image_source,
+    preprocess_image,
+)
+
+
+def _encode(image, fmt, **kwargs):
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, **kwargs)
+    return buffer.getvalue()
+
+
+class TestFastDecode(unittest.TestCase):
+    """Tests for decode_image_source_fast."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.pdf_path = os.path.join(cls.tmpdir.name, "scans.pdf")
+
+        rng = np.random.default_rng(0)
+        rgb = Image.fromarray(rng.integers(0, 255, (80, 120, 3), dtype=np.uint8))
+
+        document = fitz.open()
+        page = document.new_page(width=600, height=600)
+        # 120 px over 120 pt is 72 dpi: decoded at full size
+        page.insert_image(fitz.Rect(0, 0, 120, 80), stream=_encode(rgb, "JPEG"))
+        page.insert_image(
+            fitz.Rect(0, 100, 120, 180), stream=_encode(rgb.convert("CMYK"), "JPEG")
+        )
+        page.insert_image(
+            fitz.Rect(0, 200, 120, 280),
+            stream=_encode(rgb.convert("1"), "TIFF", compression="group4"),
+        )
+        # 1200 px over 72 pt is 1200 dpi: decoded at a quarter of the size
+        large = rgb.resize((1200, 800))
+        page.insert_image(fitz.Rect(200, 0, 272, 48), stream=_encode(large, "JPEG"))
+        document.save(cls.pdf_path)
+        document.close()
+
+        cls.document = fitz.open(cls.pdf_path)
+        cls.sources = list_image_sources(cls.document)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.document.close()
+        cls.tmpdir.cleanup()
+
+    def _decode(self, index):
+        return load_image_source(self.document, self.sources[index], fast_decode=True)
+
+    def test_jpeg_decodes_to_grayscale(self):
+        """Test that a JPEG is decoded to a 2D uint8 array."""
+        gray = self._decode(0)
+        self.assertEqual(gray.dtype, np.uint8)
+        self.assertEqual(gray.shape, (80, 120))
+
+    def test_cmyk_is_converted_instead_of_skipped(self):
+        """Test that a CMYK image is decoded to grayscale."""
+        self.assertIsNone(load_image_source(self.document, self.sources[1]))
+        self.assertEqual(self._decode(1).shape, (80, 120))
+
+    def test_bilevel_scan_bypasses_threshold(self):
+        """Test that a bilevel scan becomes an already binary array."""
+        binary = self._decode(2)
+        self.assertEqual(binary.dtype, bool)
+
+        processed = preprocess_image(binary)
+        self.assertTrue(set(np.unique(processed)) <= {0, 255})
+
+    def test_high_resolution_jpeg_is_reduced(self):
+        """Test that a JPEG above the OCR resolution is decoded at reduced scale."""
+        self.assertEqual(self._decode(3).shape, (200, 300))
+
+    def test_jpeg_is_decoded_as_the_pdf_shows_it(self):
+        """Test that EXIF orientation is ignored and a /Decode array is applied."""
+        # Left half white: a rotated decode would change the shape, an ignored
+        # /Decode [1 0] would keep the white half white
+        pixels = np.zeros((80, 120), dtype=np.uint8)
+        pixels[:, :60] = 255
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotate 90 degrees clockwise when displayed
+        jpeg = _encode(Image.fromarray(pixels), "JPEG", exif=exif.tobytes())
+
+        with fitz.open() as document:
+            page = document.new_page(width=600, height=600)
+            rotated = page.insert_image(fitz.Rect(0, 0, 120, 80), stream=jpeg)
+            inverted = page.insert_image(
+                fitz.Rect(0, 100, 120, 180),
+                stream=_encode(Image.fromarray(pixels), "JPEG"),
+            )
+            document.xref_set_key(inverted, "Decode", "[1 0]")
+            sources = {source.xref: source for source in list_image_sources(document)}
+
+            gray = load_image_source(document, sources[rotated], fast_decode=True)
+            decoded = load_image_source(document, sources[inverted], fast_decode=True)
+
+        self.assertEqual(gray.shape, (80, 120))
+        self.assertGreater(gray[:, :60].mean(), 200)
+        self.assertLess(decoded[:, :60].mean(), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Unit tests for fuzzy merging of near-duplicate lines.
+"""
+
+import unittest
+import sys
+import os
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader.fuzzy import (
+    cluster_similar_lines,
+    lsh_bands,
+    merge_similar_lines,
+    numeric_tokens,
+)
+from ocr_pdf_reader.results import ExtractionResult
+
+
+class TestFuzzyMerging(unittest.TestCase):
+    """Tests for clustering and canonical forms."""
+
+    def test_ocr_variants_are_clustered(self):
+        """Test that character-level OCR slips end up in one cluster."""
+        texts = [
+            "PARAFUSO SEXTAVADO",
+            "PORCA SEXTAVADA",
+            "PARAFUS0 SEXTAVADO",
+            "PARAFUSO SEXTAVAD0",
+            "ARRUELA LISA",
+        ]
+
+        self.assertEqual(cluster_similar_lines(texts), [0, 1, 0, 0, 4])
+
+    def test_different_sizes_are_not_merged(self):
+        """Test that lines differing in numeric tokens stay apart."""
+        texts = ["PARAFUSO SEXTAVADO M8", "PARAFUSO SEXTAVADO M10"]
+
+        self.assertEqual(numeric_tokens(texts[0]), ("M8",))
+        self.assertEqual(cluster_similar_lines(texts, threshold=0.5), [0, 1])
+
+    def test_canonical_form_is_most_frequent_variant(self):
+        """Test that the merged line is the most frequent variant with summed counts."""
+        result = ExtractionResult()
+        for page, text in enumerate(
+            [
+                "PARAFUS0 SEXTAVADO",
+                "PARAFUSO SEXTAVADO",
+                "ARRUELA LISA",
+                "PARAFUSO SEXTAVADO",
+            ],
+            start=1,
+        ):
+            result.append(text, page, -1, confidence=90.0)
+
+        merged = merge_similar_lines(result)
+
+        self.assertEqual(
+            [(r.text, r.page, r.occurrences) for r in merged],
+            [("PARAFUSO SEXTAVADO", 1, 3), ("ARRUELA LISA", 3, 1)],
+        )
+
+    def test_higher_threshold_uses_more_rows_per_band(self):
+        """Test that stricter thresholds produce stricter LSH banding."""
+        low_bands, low_rows = lsh_bands(0.5)
+        high_bands, high_rows = lsh_bands(0.9)
+
+        self.assertEqual(low_bands * low_rows, 64)
+        self.assertGreater(high_rows, low_rows)
+
+    def test_invalid_threshold_is_rejected(self):
+        """Test that thresholds outside (0, 1] raise ValueError."""
+        with self.assertRaises(ValueError):
+            cluster_similar_lines(["A"], threshold=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the memory-aware concurrency governor.
+"""
+
+import unittest
+from unittest import mock
+import threading
+import time
+import tempfile
+import sys
+import os
+
+import fitz
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core
+from ocr_pdf_reader.governor import MemoryGovernor, estimate_memory_bytes
+from ocr_pdf_reader.image_processor import ImageSource, OCRResult, list_image_sources
+from tests.helpers import make_pdf
+
+
+class TestGovernor(unittest.TestCase):
+    """Tests for memory estimation and admission."""
+
+    def test_estimate_grows_with_pixels_and_components(self):
+        """Test that larger and color images get larger estimates."""
+        small = ImageSource(0, 0, 5, 100, 100, 1)
+        large = ImageSource(0, 0, 5, 1000, 1000, 1)
+        color = ImageSource(0, 0, 5, 100, 100, 3)
+
+        self.assertLess(estimate_memory_bytes(small), estimate_memory_bytes(large))
+        self.assertLess(estimate_memory_bytes(small), estimate_memory_bytes(color))
+
+    def test_oversized_item_runs_alone(self):
+        """Test that an item larger than the budget waits for the others."""
+        governor = MemoryGovernor(budget_bytes=100)
+        governor.acquire(40)
+        admitted = threading.Event()
+
+        def acquire_large():
+            governor.acquire(500)
+            admitted.set()
+
+        thread = threading.Thread(target=acquire_large)
+        thread.start()
+        self.assertFalse(admitted.wait(0.1))
+
+        governor.release(40)
+        self.assertTrue(admitted.wait(1))
+        thread.join()
+        self.assertEqual(governor.active_items, 1)
+
+    def test_small_items_share_budget(self):
+        """Test that several small items are admitted at once."""
+        governor = MemoryGovernor(budget_bytes=100)
+        for _ in range(4):
+            governor.acquire(25)
+
+        self.assertEqual(governor.active_items, 4)
+        self.assertEqual(governor.peak_bytes, 100)
+
+    def test_max_items_limits_admission(self):
+        """Test that max_items caps the number of admitted items."""
+        governor = MemoryGovernor(budget_bytes=1000, max_items=1)
+        governor.acquire(1)
+        self.assertFalse(governor._fits(1))
+
+
+class TestImageSources(unittest.TestCase):
+    """Tests for metadata-only listing and concurrent processing."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = make_pdf(
+            os.path.join(self.tmpdir.name, "pages.pdf"), 3, "{number} - ITEM {number}"
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_rendered_pages_use_render_matrix(self):
+        """Test that pages without images are sized by rect times matrix."""
+        with fitz.open(self.pdf_path) as document:
+            sources = list_image_sources(document, resolution_multiplier=2.0)
+
+        self.assertEqual(len(sources), 3)
+        self.assertTrue(all(source.rendered for source in sources))
+        self.assertEqual((sources[0].width, sources[0].height), (400, 200))
+
+    def test_concurrent_output_keeps_document_order(self):
+        """Test that concurrent OCR returns lines in document order."""
+        words = {1: "FIRST", 2: "SECOND", 3: "THIRD"}
+
+        def fake_ocr(image, image_number, *args, **options):
+            # Later images finish first
+            time.sleep(0.05 * (3 - image_number))
+            return OCRResult(f"{image_number} - {words[image_number]} ITEM")
+
+        with mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr):
+            lines = core.extract_text_from_pdf(
+                self.pdf_path, workers=3, memory_budget_mb=64
+            )
+
+        self.assertEqual(lines, ["FIRST ITEM", "SECOND ITEM", "THIRD ITEM"])
+
+
+if __name__ == "__main__":
+    unittest.main()
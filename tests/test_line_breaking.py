@@ -7,7 +7,7 @@ import sys
 import os
 
 # Add src directory to path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from ocr_pdf_reader.text_processor import process_text_lines
 
@@ -30,19 +30,19 @@ very long line that can be broken
 when OCR processes the image
 5 - Fifth and last item
 """
-    
+
     print("ORIGINAL TEXT (simulating OCR):")
     print("=" * 50)
     print(ocr_text)
-    
+
     # Process the text
     processed_lines = process_text_lines(ocr_text)
-    
+
     print("\nPROCESSED TEXT:")
     print("=" * 50)
     for i, line in enumerate(processed_lines, 1):
         print(f"{i}: {line}")
-    
+
     return processed_lines
 
 
@@ -53,7 +53,7 @@ def test_edge_cases():
     print("\n" + "=" * 60)
     print("TESTING SPECIAL CASES")
     print("=" * 60)
-    
+
     # Test 1: Numbers without dash
     text1 = """
 1 First item without dash
@@ -64,7 +64,7 @@ continuation of first line
     print("Input:", repr(text1))
     result1 = process_text_lines(text1)
     print("Result:", result1)
-    
+
     # Test 2: Mixed formatting
     text2 = """
 1. - Item with dot and dash
@@ -78,7 +78,7 @@ and its continuation
     print("Input:", repr(text2))
     result2 = process_text_lines(text2)
     print("Result:", result2)
-    
+
     # Test 3: Blank lines and spaces
     text3 = """
 1 - First item
@@ -100,8 +100,8 @@ if __name__ == "__main__":
     # Run tests
     print("🧪 TESTING BROKEN LINE PROCESSING")
     print("=" * 60)
-    
+
     lines = test_line_breaking()
     test_edge_cases()
-    
-    print(f"\n✅ Test completed! Total processed lines: {len(lines)}") 
\ No newline at end of file
+
+    print(f"\n✅ Test completed! Total processed lines: {len(lines)}")
@@ -0,0 +1,89 @@
+"""
+Unit tests for incremental re-extraction with a page manifest.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+import fitz
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core
+from ocr_pdf_reader.image_processor import OCRResult
+from ocr_pdf_reader.manifest import page_fingerprint
+from ocr_pdf_reader.report import RunReport
+from tests.helpers import write_pdf
+
+
+class TestManifest(unittest.TestCase):
+    """Tests for page fingerprints and manifest reuse."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.tmpdir.name, "doc.pdf")
+        self.manifest_path = os.path.join(self.tmpdir.name, "doc.manifest.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _extract(self, page_texts, ocr_texts):
+        """Extracts page_texts; the fake OCR returns ocr_texts in call order."""
+        write_pdf(self.pdf_path, page_texts)
+        pending = iter(ocr_texts)
+        calls = []
+
+        def fake_ocr(image, image_number, *args, **options):
+            calls.append(image_number)
+            return OCRResult(next(pending))
+
+        report = RunReport()
+        with mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr):
+            lines = core.extract_text_from_pdf(
+                self.pdf_path, report=report, manifest_path=self.manifest_path
+            )
+        return lines, report, calls
+
+    def test_fingerprint_changes_with_content(self):
+        """Test that only the edited page changes fingerprint."""
+        write_pdf(self.pdf_path, ["1 - ALPHA", "2 - BETA"])
+        with fitz.open(self.pdf_path) as document:
+            before = [page_fingerprint(document, n) for n in range(2)]
+
+        write_pdf(self.pdf_path, ["1 - ALPHA", "2 - GAMMA"])
+        with fitz.open(self.pdf_path) as document:
+            after = [page_fingerprint(document, n) for n in range(2)]
+
+        self.assertEqual(before[0], after[0])
+        self.assertNotEqual(before[1], after[1])
+
+    def test_only_changed_pages_are_recomputed(self):
+        """Test that a revised PDF only sends changed pages to OCR."""
+        pages = ["1 - ALPHA", "2 - BETA", "3 - DELTA"]
+        lines, report, calls = self._extract(pages, pages)
+        self.assertEqual(lines, ["ALPHA", "BETA", "DELTA"])
+        self.assertEqual(len(calls), 3)
+
+        lines, report, calls = self._extract(
+            ["1 - ALPHA", "2 - GAMMA", "3 - DELTA"], ["2 - GAMMA"]
+        )
+        self.assertEqual(lines, ["ALPHA", "GAMMA", "DELTA"])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(report.reused_pages, [1, 3])
+        self.assertEqual(report.recomputed_pages, [2])
+
+    def test_appended_page_is_the_only_one_processed(self):
+        """Test that appending a page reuses all existing pages."""
+        self._extract(["1 - ALPHA"], ["1 - ALPHA"])
+
+        lines, report, calls = self._extract(["1 - ALPHA", "2 - OMEGA"], ["2 - OMEGA"])
+        self.assertEqual(lines, ["ALPHA", "OMEGA"])
+        self.assertEqual(report.recomputed_pages, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Unit tests for the extraction options.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core, scheduler
+from ocr_pdf_reader.image_processor import OCRResult, PREPROCESSING_CHAINS
+from ocr_pdf_reader.options import ExtractionOptions, resolve_options
+from ocr_pdf_reader.scheduler import OCRScheduler
+from tests.helpers import make_pdf
+
+
+class TestExtractionOptions(unittest.TestCase):
+    """Tests for validating options once and reusing them."""
+
+    def test_invalid_options_are_rejected(self):
+        """Test that each invalid option raises ValueError when options are built."""
+        for values in (
+            {"dedup_mode": "latest"},
+            {"merge_similar": 1.5},
+            {"stage_threads": {"render": 2}},
+            {"stage_threads": {"decode": 2}},
+            {"preprocessing": "sharpen"},
+        ):
+            with self.subTest(values=values), self.assertRaises(ValueError):
+                ExtractionOptions(**values)
+
+    def test_preprocessing_chain_is_resolved(self):
+        """Test that a chain name is replaced by its steps, and 'auto' is kept."""
+        self.assertEqual(
+            ExtractionOptions(preprocessing="default").preprocessing,
+            PREPROCESSING_CHAINS["default"],
+        )
+        self.assertEqual(ExtractionOptions(preprocessing="auto").preprocessing, "auto")
+
+    def test_prebuilt_options_are_reused_and_overridden(self):
+        """Test that prebuilt options are reused as they are unless overridden."""
+        options = ExtractionOptions(workers=2)
+
+        self.assertIs(resolve_options(options), options)
+        self.assertEqual(resolve_options(options, page_timeout=5).workers, 2)
+        with self.assertRaises(ValueError):
+            resolve_options(options, dedup_mode="latest")
+        with self.assertRaises(TypeError):
+            resolve_options(options, threads=2)
+
+    def test_same_options_drive_both_extraction_paths(self):
+        """Test that one ExtractionOptions serves both extraction paths."""
+        options = ExtractionOptions(merge_similar=0.9, dedup_mode="count")
+
+        def fake_ocr(image, image_number, *args, **ocr_options):
+            return OCRResult("1 - PARAFUSO SEXTAVADO")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = make_pdf(os.path.join(tmpdir, "pages.pdf"), 2)
+            with (
+                mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr),
+                mock.patch.object(
+                    scheduler, "ocr_image_with_budget", side_effect=fake_ocr
+                ),
+            ):
+                direct = core.extract_results_from_pdf(pdf_path, options=options)
+                with OCRScheduler() as pool:
+                    scheduled = pool.submit(pdf_path, options=options).result()
+
+        self.assertEqual(list(direct.texts), ["PARAFUSO SEXTAVADO"])
+        self.assertEqual(list(scheduled.texts), list(direct.texts))
+
+
+if __name__ == "__main__":
+    unittest.main()
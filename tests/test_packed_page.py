@@ -0,0 +1,95 @@
+"""
+Unit tests for bit-packed binary pages.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core
+from ocr_pdf_reader.image_processor import OCRResult
+from ocr_pdf_reader.packed_page import PackedBinaryPage, pack_if_binary
+from tests.helpers import make_pdf
+
+
+def _binary_page(shape=(37, 53), dtype=np.uint8):
+    rng = np.random.default_rng(0)
+    page = rng.random(shape) < 0.2
+    return page if dtype == bool else np.where(page, 0, 255).astype(np.uint8)
+
+
+class TestPackedBinaryPage(unittest.TestCase):
+    """Tests for packing and lazy unpacking."""
+
+    def test_round_trip_keeps_values_and_dtype(self):
+        """Test that 0/255 and bool pages come back unchanged, with odd widths."""
+        for dtype in (np.uint8, bool):
+            page = _binary_page(dtype=dtype)
+
+            unpacked = np.asarray(PackedBinaryPage.pack(page))
+
+            self.assertEqual(unpacked.dtype, page.dtype)
+            np.testing.assert_array_equal(unpacked, page)
+
+    def test_packed_page_is_eight_times_smaller(self):
+        """Test the memory used by a packed page."""
+        packed = PackedBinaryPage.pack(_binary_page((400, 320)))
+
+        self.assertEqual(packed.nbytes * 8, packed.unpacked_nbytes)
+
+    def test_row_band_matches_slice(self):
+        """Test that a band of rows unpacks to the same pixels as the full page."""
+        page = _binary_page()
+        packed = PackedBinaryPage.pack(page)
+
+        np.testing.assert_array_equal(packed.rows(10, 20), page[10:20])
+
+    def test_only_binary_arrays_are_packed(self):
+        """Test that grayscale arrays are refused or passed through."""
+        gray = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+        with self.assertRaises(ValueError):
+            PackedBinaryPage.pack(gray)
+        self.assertIs(pack_if_binary(gray), gray)
+        self.assertIsInstance(pack_if_binary(_binary_page()), PackedBinaryPage)
+        self.assertIsInstance(
+            pack_if_binary(_binary_page(), check_values=False), np.ndarray
+        )
+        self.assertIsInstance(
+            pack_if_binary(_binary_page(dtype=bool), check_values=False),
+            PackedBinaryPage,
+        )
+
+
+class TestPackedPagesInPipeline(unittest.TestCase):
+    """Tests for pages waiting packed between pipeline stages."""
+
+    def test_preprocessed_pages_reach_ocr_packed(self):
+        """Test that the OCR stage gets packed pages equal to the preprocessed image."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = make_pdf(os.path.join(tmpdir, "pages.pdf"), 2)
+
+            received = []
+
+            def fake_ocr(image, image_number, *args, preprocessed=None, **options):
+                received.append(preprocessed)
+                return OCRResult(f"{image_number} - ITEM")
+
+            with mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr):
+                core.extract_text_from_pdf(pdf_path, pipeline=True)
+
+        self.assertEqual(len(received), 2)
+        for packed in received:
+            self.assertIsInstance(packed, PackedBinaryPage)
+            self.assertEqual(set(np.unique(np.asarray(packed))), {0, 255})
+
+
+if __name__ == "__main__":
+    unittest.main()
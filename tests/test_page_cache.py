@@ -0,0 +1,167 @@
+"""
+Unit tests for the cache of preprocessed page images.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+import numpy as np
+import pytesseract
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core, tuning
+from ocr_pdf_reader.image_processor import OCRResult, OCRWord
+from ocr_pdf_reader.page_cache import PageCache, decode_page, encode_page
+from ocr_pdf_reader.report import RunReport
+from tests.helpers import make_pdf, tesseract_data
+
+
+def _binary_page(seed=0, shape=(200, 160)):
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(shape) < 0.1, 0, 255).astype(np.uint8)
+
+
+class TestPageEncoding(unittest.TestCase):
+    """Tests for the compact entry format."""
+
+    def test_binary_pages_are_bit_packed(self):
+        """Test that a 0/255 page round-trips at about a bit per pixel or less."""
+        page = _binary_page()
+
+        data = encode_page(page)
+
+        np.testing.assert_array_equal(np.asarray(decode_page(data)), page)
+        self.assertLess(len(data), page.size / 8 + 64)
+
+    def test_grayscale_pages_round_trip(self):
+        """Test that other images are stored losslessly."""
+        page = np.arange(120, dtype=np.uint8).reshape(10, 12)
+
+        np.testing.assert_array_equal(decode_page(encode_page(page)), page)
+
+
+class TestPageCache(unittest.TestCase):
+    """Tests for storage, eviction and use during extraction."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that reading an entry protects it from eviction."""
+        entry_size = len(encode_page(_binary_page(0)))
+        cache = PageCache(self.cache_dir, max_bytes=int(entry_size * 2.5))
+
+        cache.put("a", _binary_page(0))
+        cache.put("b", _binary_page(1))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", _binary_page(2))
+
+        self.assertEqual(
+            ("a" in cache, "b" in cache, "c" in cache), (True, False, True)
+        )
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(PageCache(self.cache_dir)), 2)
+
+    def test_rerun_with_other_language_skips_decode_and_preprocessing(self):
+        """Test that a second run reads preprocessed pages from the cache."""
+        pdf_path = make_pdf(os.path.join(self.tmpdir.name, "pages.pdf"), 3)
+        cache = PageCache(self.cache_dir)
+        data = tesseract_data("1 - PARAFUSO SEXTAVADO")
+
+        with mock.patch.object(
+            pytesseract, "image_to_data", return_value=data
+        ) as image_to_data:
+            first = core.extract_text_from_pdf(pdf_path, lang="eng", page_cache=cache)
+            first_images = [call.args[0] for call in image_to_data.call_args_list]
+
+            report = RunReport()
+            with (
+                mock.patch.object(core, "load_image_source") as load_image_source,
+                mock.patch.object(core, "preprocess_image") as preprocess_image,
+            ):
+                second = core.extract_text_from_pdf(
+                    pdf_path, lang="por", page_cache=cache, report=report
+                )
+
+            second_images = [call.args[0] for call in image_to_data.call_args_list[3:]]
+
+        load_image_source.assert_not_called()
+        preprocess_image.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual((report.page_cache_hits, report.page_cache_misses), (3, 0))
+        for before, after in zip(first_images, second_images):
+            np.testing.assert_array_equal(before, after)
+
+    def test_cached_and_processed_images_share_numbers(self):
+        """Test that an image missing from the cache keeps its document number."""
+        pdf_path = make_pdf(os.path.join(self.tmpdir.name, "pages.pdf"), 3)
+        cache = PageCache(self.cache_dir)
+        numbers = []
+
+        def fake_ocr(image, image_number, *args, **options):
+            numbers.append(image_number)
+            return OCRResult(f"{image_number} - ITEM")
+
+        with mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr):
+            core.extract_text_from_pdf(pdf_path, page_cache=cache)
+            numbers.clear()
+
+            # The third entry disappears between the lookup and the read
+            read = cache.get
+            reads = []
+
+            def get(key):
+                reads.append(key)
+                return None if len(reads) == 3 else read(key)
+
+            with mock.patch.object(cache, "get", side_effect=get):
+                core.extract_text_from_pdf(pdf_path, page_cache=cache)
+
+        self.assertEqual(sorted(numbers), [1, 2, 3])
+
+    def test_tuning_is_skipped_when_tuned_chain_is_cached(self):
+        """Test that preprocessing='auto' reuses a chain whose images are all cached."""
+        pdf_path = make_pdf(os.path.join(self.tmpdir.name, "pages.pdf"), 3)
+        cache = PageCache(self.cache_dir)
+
+        def fake_tuning_ocr(image, lang="eng", preprocessing="default", **options):
+            confidence = 90.0 if preprocessing == "downscale" else 50.0
+            return OCRResult("WORD", [OCRWord("WORD", 0, 0, 10, 10, confidence)])
+
+        def fake_ocr(image, image_number, *args, **options):
+            return OCRResult(f"{image_number} - ITEM")
+
+        first, second = RunReport(), RunReport()
+        with (
+            mock.patch.object(tuning, "ocr_image", side_effect=fake_tuning_ocr),
+            mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr),
+        ):
+            core.extract_text_from_pdf(
+                pdf_path, preprocessing="auto", page_cache=cache, report=first
+            )
+            with mock.patch.object(core, "tune_preprocessing") as tune_preprocessing:
+                core.extract_text_from_pdf(
+                    pdf_path,
+                    lang="por",
+                    preprocessing="auto",
+                    page_cache=cache,
+                    report=second,
+                )
+
+        tune_preprocessing.assert_not_called()
+        self.assertEqual(first.preprocessing_choice, "downscale")
+        self.assertEqual(second.preprocessing_choice, "downscale")
+        self.assertEqual((second.page_cache_hits, second.page_cache_misses), (3, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Unit tests for the staged producer/consumer pipeline.
+"""
+
+import unittest
+from unittest import mock
+import threading
+import time
+import tempfile
+import sys
+import os
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core
+from ocr_pdf_reader.image_processor import OCRResult
+from ocr_pdf_reader.pipeline import StagedPipeline, parse_stage_threads
+from ocr_pdf_reader.report import RunReport
+from tests.helpers import make_pdf
+
+
+class TestStagedPipeline(unittest.TestCase):
+    """Tests for ordering, backpressure and error handling."""
+
+    def test_results_keep_input_order(self):
+        """Test that outputs come back in input order with several threads."""
+
+        def slow_square(value):
+            time.sleep(0.01 * (5 - value))
+            return value * value
+
+        pipeline = StagedPipeline(
+            [("add", lambda value: value + 1, 1), ("square", slow_square, 3)]
+        )
+
+        self.assertEqual(pipeline.run(range(5)), [1, 4, 9, 16, 25])
+        self.assertEqual([stats.items for stats in pipeline.stats], [5, 5])
+
+    def test_bounded_queues_limit_items_in_flight(self):
+        """Test that a slow stage holds back the producer."""
+        in_flight = []
+        produced = []
+        lock = threading.Lock()
+
+        def produce(value):
+            with lock:
+                produced.append(value)
+                in_flight.append(len(produced) - len(consumed))
+            return value
+
+        consumed = []
+
+        def consume(value):
+            time.sleep(0.01)
+            with lock:
+                consumed.append(value)
+            return value
+
+        pipeline = StagedPipeline(
+            [("produce", produce, 1), ("consume", consume, 1)], queue_size=2
+        )
+        pipeline.run(range(20))
+
+        # Queue of 2, one item in each stage and one waiting to be put
+        self.assertLessEqual(max(in_flight), 5)
+        self.assertGreater(pipeline.stats[1].max_occupancy, 0)
+
+    def test_stage_error_is_raised(self):
+        """Test that an exception in a stage stops the pipeline and is re-raised."""
+
+        def fail_on_three(value):
+            if value == 3:
+                raise ValueError("bad item")
+            return value
+
+        pipeline = StagedPipeline(
+            [("check", fail_on_three, 2), ("copy", lambda v: v, 1)], queue_size=1
+        )
+
+        with self.assertRaises(ValueError):
+            pipeline.run(range(50))
+
+    def test_parse_stage_threads(self):
+        """Test parsing of per-stage thread counts."""
+        self.assertEqual(
+            parse_stage_threads("ocr=4, preprocess=2"), {"ocr": 4, "preprocess": 2}
+        )
+        self.assertEqual(parse_stage_threads(None), {})
+        with self.assertRaises(ValueError):
+            parse_stage_threads("ocr=0")
+        self.assertEqual(parse_stage_threads("decode=1"), {"decode": 1})
+        with self.assertRaises(ValueError):
+            parse_stage_threads("decode=2")
+
+
+class TestPipelineExtraction(unittest.TestCase):
+    """Tests for extract_results_from_pdf with pipeline=True."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = make_pdf(
+            os.path.join(self.tmpdir.name, "pages.pdf"), 4, "{number} - ITEM {number}"
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_pipeline_matches_document_order_and_reports_stages(self):
+        """Test that pipelined extraction keeps order and fills stage statistics."""
+        words = {1: "FIRST", 2: "SECOND", 3: "THIRD", 4: "FOURTH"}
+
+        def fake_ocr(image, image_number, *args, preprocessed=None, **options):
+            self.assertIsNotNone(preprocessed)
+            time.sleep(0.02 * (4 - image_number))
+            return OCRResult(f"{image_number} - {words[image_number]} ITEM")
+
+        report = RunReport()
+        with mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr):
+            lines = core.extract_text_from_pdf(
+                self.pdf_path,
+                pipeline=True,
+                workers=2,
+                stage_threads={"ocr": 3},
+                report=report,
+            )
+
+        self.assertEqual(
+            lines, ["FIRST ITEM", "SECOND ITEM", "THIRD ITEM", "FOURTH ITEM"]
+        )
+        self.assertEqual(list(report.stage_stats), list(core.PIPELINE_STAGES))
+        self.assertEqual(report.stage_stats["ocr"]["threads"], 3)
+        self.assertEqual(report.stage_stats["preprocess"]["threads"], 2)
+        self.assertEqual(report.stage_stats["text"]["items"], 4)
+
+    def test_unknown_stage_is_rejected(self):
+        """Test that thread counts for unknown stages raise ValueError."""
+        with self.assertRaises(ValueError):
+            core.extract_text_from_pdf(
+                self.pdf_path, pipeline=True, stage_threads={"render": 2}
+            )
+
+    def test_decode_stage_keeps_one_thread(self):
+        """Test that decode threads, which would share the PDF document, are refused."""
+        with self.assertRaises(ValueError):
+            core.extract_text_from_pdf(
+                self.pdf_path, pipeline=True, stage_threads={"decode": 2}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Unit tests for the structured result model.
+"""
+
+import importlib.util
+import unittest
+from unittest import mock
+import tempfile
+import json
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader.image_processor import (
+    OCRResult,
+    OCRWord,
+    extract_text_from_image,
+    ocr_image,
+)
+from ocr_pdf_reader.results import ExtractionResult, locate_lines
+from ocr_pdf_reader.text_processor import process_text_lines
+from tests.helpers import tesseract_data
+
+
+def _words(*texts):
+    return [
+        OCRWord(text, i * 100, 10, 80, 20, 80.0 + i) for i, text in enumerate(texts)
+    ]
+
+
+class TestExtractionResult(unittest.TestCase):
+    """Tests for ExtractionResult and its views."""
+
+    def setUp(self):
+        self.result = ExtractionResult()
+        self.result.append("FIRST ITEM", 1, -1, (0, 0, 100, 20), 91.5)
+        self.result.append("SEGUNDO ÍTEM", 2, 0)
+
+    def test_records_keep_metadata(self):
+        """Test that records come back with their metadata."""
+        first, second = list(self.result)
+        self.assertEqual(
+            (first.text, first.page, first.bbox), ("FIRST ITEM", 1, (0, 0, 100, 20))
+        )
+        self.assertAlmostEqual(first.confidence, 91.5)
+        self.assertIsNone(second.bbox)
+        self.assertEqual(self.result[-1].text, "SEGUNDO ÍTEM")
+
+    def test_texts_view_behaves_like_list(self):
+        """Test the list-of-strings view."""
+        texts = self.result.texts
+        self.assertEqual(len(texts), 2)
+        self.assertEqual(texts, ["FIRST ITEM", "SEGUNDO ÍTEM"])
+        self.assertEqual(texts[1:], ["SEGUNDO ÍTEM"])
+        self.assertIn("FIRST ITEM", texts)
+
+    def test_filter(self):
+        """Test that filter drops and rewrites lines."""
+        filtered = self.result.filter(
+            lambda record: record.text.lower() if record.page == 1 else None
+        )
+        self.assertEqual(list(filtered.texts), ["first item"])
+
+    def test_to_jsonl(self):
+        """Test JSONL export."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lines.jsonl")
+            self.result.to_jsonl(path)
+            with open(path, encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+
+        self.assertEqual(rows[0]["bbox"], [0, 0, 100, 20])
+        self.assertEqual(rows[1]["text"], "SEGUNDO ÍTEM")
+
+    def test_to_arrow(self):
+        """Test the Arrow table used for Parquet export."""
+        if importlib.util.find_spec("pyarrow") is None:
+            self.skipTest("pyarrow is not installed")
+
+        table = self.result.to_arrow()
+        self.assertEqual(
+            table.column("text").to_pylist(), ["FIRST ITEM", "SEGUNDO ÍTEM"]
+        )
+
+    def test_to_arrow_requires_pyarrow(self):
+        """Test the error raised without pyarrow."""
+        if importlib.util.find_spec("pyarrow") is not None:
+            self.skipTest("pyarrow is installed")
+
+        with self.assertRaises(ImportError):
+            self.result.to_arrow()
+
+    def test_memory_is_compact(self):
+        """Test that a line costs far less than a list of Python objects."""
+        result = ExtractionResult()
+        for i in range(1000):
+            result.append(f"DESCRIPTION {i}", 1, -1)
+        self.assertLess(result.memory_bytes() / len(result), 64)
+
+
+class TestLocateLines(unittest.TestCase):
+    """Tests for mapping processed lines to OCR words."""
+
+    def test_lines_get_union_box_and_mean_confidence(self):
+        """Test that a line gets the box and confidence of its words."""
+        ocr_result = OCRResult(
+            "1 - FIRST ITEM 2 - SECOND",
+            _words("1", "-", "FIRST", "ITEM", "2", "-", "SECOND"),
+        )
+        located = locate_lines(["FIRST ITEM", "SECOND"], ocr_result)
+
+        self.assertEqual(located[0][0], (200, 10, 380, 30))
+        self.assertAlmostEqual(located[0][1], 82.5)
+        self.assertEqual(located[1][0], (600, 10, 680, 30))
+
+    def test_missing_line_has_no_box(self):
+        """Test that a line not found in the words has no box."""
+        located = locate_lines(
+            ["MISSING"], OCRResult("1 - ITEM", _words("1", "-", "ITEM"))
+        )
+        self.assertEqual(located, [(None, -1.0)])
+
+    def test_ocr_image_keeps_lines_and_words(self):
+        """Test that ocr_image rebuilds the text line by line."""
+        data = {
+            "text": ["1", "-", "ITEM", "", "2", "-", "NEXT"],
+            "block_num": [1] * 7,
+            "par_num": [1] * 7,
+            "line_num": [1, 1, 1, 1, 2, 2, 2],
+            "left": [0] * 7,
+            "top": [0] * 7,
+            "width": [10] * 7,
+            "height": [10] * 7,
+            "conf": [90, 90, 80, -1, 70, 70, 60],
+        }
+        with mock.patch("pytesseract.image_to_data", return_value=data):
+            result = ocr_image(np.full((20, 20), 255, dtype=np.uint8))
+
+        self.assertEqual(result.text, "1 - ITEM\n2 - NEXT")
+        self.assertEqual(len(result.words), 6)
+
+    def test_rebuilt_text_gives_the_same_lines_as_image_to_string(self):
+        """Test that text rebuilt from the words processes like Tesseract's own text."""
+        string_output = (
+            "11.01.39 - PARAFUSO  SEXTAVADO\n12.02 - ARRUELA LISA (ZINCADA)\n"
+            "\n3 - PORCA\nSEXTAVADA\n\n\x0c"
+        )
+        image = np.full((20, 20), 255, dtype=np.uint8)
+
+        with (
+            mock.patch("pytesseract.image_to_string", return_value=string_output),
+            mock.patch(
+                "pytesseract.image_to_data", return_value=tesseract_data(string_output)
+            ),
+        ):
+            string_lines = process_text_lines(extract_text_from_image(image))
+            data_lines = process_text_lines(ocr_image(image).text)
+
+        self.assertEqual(data_lines, string_lines)
+        self.assertEqual(
+            data_lines, ["PARAFUSO SEXTAVADO", "ARRUELA LISA", "PORCA SEXTAVADA"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
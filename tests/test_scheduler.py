@@ -0,0 +1,150 @@
+"""
+Unit tests for the priority and deadline-aware OCR scheduler.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import threading
+import sys
+import os
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import cli, core, scheduler
+from ocr_pdf_reader.image_processor import OCRResult, OCRTimeoutError
+from ocr_pdf_reader.report import RunReport
+from ocr_pdf_reader.scheduler import OCRScheduler, PRIORITY_BULK, PRIORITY_INTERACTIVE
+from tests.helpers import make_pdf
+
+
+class TestOCRScheduler(unittest.TestCase):
+    """Tests for page-boundary preemption and time budgets."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.bulk_pdf = make_pdf(os.path.join(self.tmpdir.name, "bulk.pdf"), 3)
+        self.interactive_pdf = make_pdf(
+            os.path.join(self.tmpdir.name, "interactive.pdf"), 2
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_interactive_pages_preempt_queued_bulk_pages(self):
+        """Test that a later interactive document runs before the rest of a bulk one."""
+        order = []
+        first_page_started = threading.Event()
+        release = threading.Event()
+
+        def fake_ocr(image, image_number, lang, *args, **options):
+            order.append((lang, image_number))
+            first_page_started.set()
+            release.wait(5)
+            return OCRResult(f"{image_number} - ITEM {lang.upper()}")
+
+        with (
+            mock.patch.object(scheduler, "ocr_image_with_budget", side_effect=fake_ocr),
+            OCRScheduler(workers=1) as pool,
+        ):
+            bulk = pool.submit(self.bulk_pdf, lang="eng", priority=PRIORITY_BULK)
+            first_page_started.wait(5)
+            interactive = pool.submit(
+                self.interactive_pdf, lang="por", priority=PRIORITY_INTERACTIVE
+            )
+            release.set()
+
+            self.assertEqual(list(interactive.result().texts), ["ITEM POR", "ITEM POR"])
+            self.assertEqual(len(bulk.result()), 3)
+
+        self.assertEqual(
+            order, [("eng", 1), ("por", 1), ("por", 2), ("eng", 2), ("eng", 3)]
+        )
+
+    def test_budget_returns_finished_pages_marked_partial(self):
+        """Test that pages finished after the deadline are left out, marked partial."""
+        now = [0.0]
+
+        def slow_ocr(image, image_number, *args, **options):
+            # Each image takes 0.2 s of the 0.5 s budget on the test clock
+            now[0] += 0.2
+            return OCRResult(f"{image_number} - PAGE {chr(64 + image_number)}")
+
+        report = RunReport()
+        with mock.patch.object(
+            scheduler, "ocr_image_with_budget", side_effect=slow_ocr
+        ):
+            pool = OCRScheduler(workers=1, clock=lambda: now[0])
+            job = pool.submit(self.bulk_pdf, time_budget=0.5, report=report)
+            pool.close()
+
+        result = job.result()
+
+        self.assertTrue(result.partial)
+        self.assertEqual(list(result.texts), ["PAGE A", "PAGE B"])
+        self.assertEqual(result.missing_pages, [3])
+        self.assertEqual((report.partial, report.missing_pages), (True, [3]))
+        self.assertEqual(report.deadline_skipped_images, [3])
+
+    def test_budget_cut_is_not_reported_as_ocr_timeout(self):
+        """Test that an image cut off by the document's deadline is a deadline skip."""
+        now = [0.0]
+        timeouts = []
+
+        def fake_ocr_image(image, lang, timeout=None, **options):
+            timeouts.append(timeout)
+            if len(timeouts) < 3:
+                now[0] += 0.2
+                return OCRResult("1 - PAGE")
+            # The third image only gets the 0.1 s left in the budget
+            now[0] += timeout
+            raise OCRTimeoutError("slow")
+
+        report = RunReport()
+        with mock.patch.object(core, "ocr_image", side_effect=fake_ocr_image):
+            pool = OCRScheduler(workers=1, clock=lambda: now[0])
+            job = pool.submit(
+                self.bulk_pdf, time_budget=0.5, page_timeout=10, report=report
+            )
+            pool.close()
+        job.result()
+
+        self.assertAlmostEqual(timeouts[-1], 0.1)
+        self.assertEqual(report.timed_out_images, [])
+        self.assertEqual(report.deadline_skipped_images, [3])
+
+    def test_result_within_budget_is_complete(self):
+        """Test that a document finished in time is not marked partial."""
+
+        def fake_ocr(image, image_number, *args, **options):
+            return OCRResult(f"{image_number} - PAGE {chr(64 + image_number)}")
+
+        with (
+            mock.patch.object(scheduler, "ocr_image_with_budget", side_effect=fake_ocr),
+            OCRScheduler(workers=2) as pool,
+        ):
+            result = pool.submit(self.bulk_pdf, time_budget=5).result()
+
+        self.assertFalse(result.partial)
+        self.assertEqual(list(result.texts), ["PAGE A", "PAGE B", "PAGE C"])
+
+    def test_automatic_detection_is_rejected(self):
+        """Test that options needing the whole document up front are refused."""
+        with OCRScheduler() as pool:
+            with self.assertRaises(ValueError):
+                pool.submit(self.bulk_pdf, lang="auto")
+
+    def test_command_line_rejects_unscheduled_options(self):
+        """Test that options the scheduler would drop are refused instead of ignored."""
+        for options in (
+            ["--memory-budget", "512"],
+            ["--auto-languages", "eng+deu"],
+            ["--tuning-tolerance", "2"],
+        ):
+            with self.assertRaises(SystemExit), mock.patch("sys.stderr"):
+                cli.main([self.bulk_pdf, "--time-budget", "5"] + options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for the full-text index of extracted lines.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import io
+import sys
+import os
+from contextlib import redirect_stdout
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import cli, core
+from ocr_pdf_reader import search_index
+from ocr_pdf_reader.search_index import SearchIndex, build_match_query
+from tests.helpers import make_result
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Tests for indexing, incremental updates and queries."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmpdir.name, "lines.db")
+        self.pdf_path = self._file("catalog.pdf", b"%PDF-1.4 first")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _file(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_search_returns_document_page_and_line(self):
+        """Test that hits point at the document, page and line of the text."""
+        with SearchIndex(self.index_path) as index:
+            index.add_document(
+                self.pdf_path,
+                make_result((1, "PARAFUSO SEXTAVADO M8"), (2, "ARRUELA LISA")),
+            )
+            hits = index.search("arruela")
+
+        self.assertEqual(len(hits), 1)
+        self.assertEqual(
+            (hits[0].document, hits[0].page, hits[0].line),
+            (os.path.abspath(self.pdf_path), 2, 2),
+        )
+
+    def test_tokens_are_normalized(self):
+        """Test case- and accent-insensitive matching and prefix search."""
+        with SearchIndex(self.index_path) as index:
+            index.add_document(self.pdf_path, make_result((1, "ÍTEM DE TESTE")))
+
+            self.assertEqual(len(index.search("item")), 1)
+            self.assertEqual(len(index.search("tes*")), 1)
+            self.assertEqual(index.search("item ausente"), [])
+
+    def test_unchanged_document_is_not_reindexed(self):
+        """Test that documents are only replaced when their file changes."""
+        with SearchIndex(self.index_path) as index:
+            self.assertTrue(
+                index.add_document(self.pdf_path, make_result((1, "OLD LINE")))
+            )
+            self.assertFalse(
+                index.add_document(self.pdf_path, make_result((1, "OLD LINE")))
+            )
+
+            self._file("catalog.pdf", b"%PDF-1.4 revised")
+            self.assertTrue(
+                index.add_document(self.pdf_path, make_result((1, "NEW LINE")))
+            )
+
+            self.assertEqual(index.search("old"), [])
+            self.assertEqual(len(index.search("new")), 1)
+            self.assertEqual(len(index.documents()), 1)
+
+    def test_same_file_with_other_lines_is_reindexed(self):
+        """Test that lines extracted with other settings replace the stale ones."""
+        with SearchIndex(self.index_path) as index:
+            self.assertTrue(
+                index.add_document(self.pdf_path, make_result((1, "PARAFUSO")))
+            )
+            self.assertTrue(
+                index.add_document(self.pdf_path, make_result((1, "SCREW")))
+            )
+
+            self.assertEqual(index.search("parafuso"), [])
+            self.assertEqual(len(index.search("screw")), 1)
+
+    def test_index_of_another_version_is_refused(self):
+        """Test that an index written with another schema version is not opened."""
+        SearchIndex(self.index_path).close()
+
+        with mock.patch.object(search_index, "SEARCH_INDEX_VERSION", 2):
+            with self.assertRaises(RuntimeError):
+                SearchIndex(self.index_path)
+
+    def test_line_ids_cannot_overflow(self):
+        """Test that a document with more lines than a rowid range is refused."""
+        with (
+            mock.patch.object(search_index, "MAX_DOCUMENT_LINES", 1),
+            SearchIndex(self.index_path) as index,
+        ):
+            with self.assertRaises(ValueError):
+                index.add_document(
+                    self.pdf_path, make_result((1, "FIRST"), (1, "SECOND"))
+                )
+            self.assertEqual(index.documents(), [])
+
+    def test_query_syntax_is_escaped(self):
+        """Test that punctuation in queries is not read as FTS5 syntax."""
+        self.assertEqual(build_match_query('M8 "x" sext*'), '"M8" """x""" "sext"*')
+
+    def test_extract_and_save_indexes_and_search_command_finds(self):
+        """Test the indexing stage of extract_and_save and the search subcommand."""
+        output_file = os.path.join(self.tmpdir.name, "out.txt")
+
+        with mock.patch.object(
+            core,
+            "extract_results_from_pdf",
+            return_value=make_result((3, "PORCA SEXTAVADA")),
+        ):
+            core.extract_and_save(
+                self.pdf_path, output_file, index_path=self.index_path
+            )
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = cli.main(["search", self.index_path, "porca"])
+
+        self.assertEqual(status, 0)
+        self.assertIn("catalog.pdf:3:1: PORCA SEXTAVADA", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the shared-memory page transport.
+"""
+
+import unittest
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import tempfile
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core
+from ocr_pdf_reader.shared_buffers import SharedPageRing, attach_page_buffer
+from tests.helpers import make_pdf, tesseract_data
+
+
+def _sum_shared_page(handle):
+    with attach_page_buffer(handle) as page:
+        return int(page.sum())
+
+
+class TestSharedPageRing(unittest.TestCase):
+    """Tests for writing, attaching and releasing shared pages."""
+
+    def test_round_trip_without_copy(self):
+        """Test that an attached view shares memory with the segment."""
+        page = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+        with SharedPageRing(slots=1) as ring:
+            handle = ring.write(page)
+            with attach_page_buffer(handle) as view:
+                np.testing.assert_array_equal(view, page)
+                self.assertFalse(view.flags.owndata)
+            ring.release(handle)
+
+    def test_worker_process_reads_page(self):
+        """Test that a worker process reads the page from shared memory."""
+        page = np.ones((100, 50), dtype=np.uint8)
+
+        with (
+            SharedPageRing(slots=2) as ring,
+            ProcessPoolExecutor(max_workers=1) as executor,
+        ):
+            handle = ring.write(page)
+            self.assertEqual(executor.submit(_sum_shared_page, handle).result(), 5000)
+            ring.release(handle)
+
+    def test_slot_grows_for_larger_page(self):
+        """Test that a slot is replaced when a page does not fit."""
+        with SharedPageRing(slots=1) as ring:
+            small = ring.write(np.zeros((2, 2), dtype=np.uint8))
+            ring.release(small)
+            large = ring.write(np.zeros((100, 100), dtype=np.uint8))
+            ring.release(large)
+
+        self.assertNotEqual(small.segment_name, large.segment_name)
+
+    def test_close_unlinks_segments(self):
+        """Test that no segment survives close()."""
+        ring = SharedPageRing(slots=1)
+        handle = ring.write(np.zeros((4, 4), dtype=np.uint8))
+        ring.close()
+        ring.close()
+
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.segment_name)
+
+    def test_process_workers_extract_in_order(self):
+        """Test extraction with worker processes end to end."""
+        with tempfile.TemporaryDirectory() as directory:
+            pdf_path = make_pdf(os.path.join(directory, "pages.pdf"), 3)
+
+            with mock.patch(
+                "pytesseract.image_to_data",
+                return_value=tesseract_data("1 - SAME ITEM"),
+            ):
+                lines = core.extract_text_from_pdf(
+                    pdf_path, workers=2, use_processes=True
+                )
+
+        self.assertEqual(lines, ["SAME ITEM"] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
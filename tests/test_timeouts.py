@@ -0,0 +1,89 @@
+"""
+Unit tests for the per-image OCR time budget.
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+import numpy as np
+from PIL import Image
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core
+from ocr_pdf_reader.image_processor import (
+    OCRResult,
+    extract_text_from_image,
+    simplify_image,
+    OCRTimeoutError,
+)
+from ocr_pdf_reader.report import RunReport
+
+
+def _blank_image(width=200, height=100):
+    return Image.fromarray(np.full((height, width), 255, dtype=np.uint8))
+
+
+class TestTimeouts(unittest.TestCase):
+    """Tests for timeouts and retries."""
+
+    def test_timeout_raises_ocr_timeout_error(self):
+        """Test that an expired Tesseract call is surfaced as OCRTimeoutError."""
+        with mock.patch(
+            "pytesseract.image_to_string",
+            side_effect=RuntimeError("Tesseract process timeout"),
+        ):
+            with self.assertRaises(OCRTimeoutError):
+                extract_text_from_image(_blank_image(), timeout=1)
+
+    def test_other_errors_still_return_empty_text(self):
+        """Test that non-timeout errors keep returning an empty string."""
+        with mock.patch(
+            "pytesseract.image_to_string", side_effect=RuntimeError("boom")
+        ):
+            self.assertEqual(extract_text_from_image(_blank_image(), timeout=1), "")
+
+    def test_simplify_image_downscales(self):
+        """Test that the retry image is smaller than the original."""
+        simplified = simplify_image(_blank_image(200, 100), scale=0.5)
+        self.assertEqual(simplified.size, (100, 50))
+
+    def test_retry_recovers_image(self):
+        """Test that a successful retry is recorded as recovered."""
+        report = RunReport()
+        calls = [OCRTimeoutError("slow"), OCRResult("1 - First item")]
+
+        def fake_ocr(image, lang, timeout=None, **options):
+            result = calls.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with mock.patch.object(core, "ocr_image", side_effect=fake_ocr):
+            result = core.ocr_image_with_budget(
+                _blank_image(), 3, "eng", 1.0, True, report
+            )
+
+        self.assertEqual(result.text, "1 - First item")
+        self.assertEqual(report.recovered_images, [3])
+        self.assertEqual(report.timed_out_images, [])
+
+    def test_timeout_without_retry_is_recorded(self):
+        """Test that a timed-out image is recorded and skipped."""
+        report = RunReport()
+
+        with mock.patch.object(core, "ocr_image", side_effect=OCRTimeoutError("slow")):
+            result = core.ocr_image_with_budget(
+                _blank_image(), 2, "eng", 1.0, False, report
+            )
+
+        self.assertEqual(result.text, "")
+        self.assertEqual(report.timed_out_images, [2])
+        self.assertEqual(report.retried_images, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the preprocessing auto-tuner.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import time
+import sys
+import os
+
+import fitz
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import core, tuning
+from ocr_pdf_reader.image_processor import OCRResult, OCRWord, PREPROCESSING_CHAINS
+from ocr_pdf_reader.report import RunReport
+from tests.helpers import make_pdf
+
+
+# Per chain: (seconds per image, confidence, words found)
+CHAIN_BEHAVIOUR = {
+    "none": (0.001, 60.0, 10),
+    "downscale": (0.005, 88.0, 10),
+    "default": (0.01, 90.0, 10),
+    "adaptive": (0.02, 91.0, 10),
+    "denoise": (0.001, 95.0, 2),
+}
+
+
+def _fake_ocr_image(image, lang="eng", preprocessing="default", **options):
+    seconds, confidence, words = CHAIN_BEHAVIOUR[preprocessing]
+    time.sleep(seconds)
+    return OCRResult(
+        "WORD " * words,
+        [OCRWord("WORD", 0, 0, 10, 10, confidence) for _ in range(words)],
+    )
+
+
+class TestPreprocessingTuner(unittest.TestCase):
+    """Tests for chain selection and its use in extraction."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = make_pdf(os.path.join(self.tmpdir.name, "pages.pdf"), 3)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _tune(self, **options):
+        with (
+            fitz.open(self.pdf_path) as document,
+            mock.patch.object(tuning, "ocr_image", side_effect=_fake_ocr_image),
+        ):
+            sources = core.list_image_sources(document)
+            return tuning.tune_preprocessing(document, sources, **options)
+
+    def test_cheapest_chain_within_tolerance_wins(self):
+        """Test that a faster chain close to the best confidence is chosen."""
+        result = self._tune(tolerance=5.0)
+
+        self.assertEqual(result.chain, "downscale")
+        self.assertEqual(result.sampled_pages, [1, 2])
+        self.assertEqual(set(result.trials), set(tuning.TUNING_CANDIDATES))
+
+    def test_chain_that_loses_words_is_penalized(self):
+        """Test that high confidence on few words doesn't win."""
+        result = self._tune(tolerance=0.5)
+
+        self.assertLess(
+            result.trials["denoise"]["score"], result.trials["adaptive"]["score"]
+        )
+        self.assertEqual(result.chain, "adaptive")
+
+    def test_auto_preprocessing_uses_chosen_chain_and_reports_it(self):
+        """Test that extraction with preprocessing='auto' runs the tuned chain."""
+        used_chains = []
+
+        def fake_ocr(image, image_number, *args, preprocessing=None, **options):
+            used_chains.append(preprocessing)
+            return OCRResult(f"{image_number} - ITEM")
+
+        report = RunReport()
+        with (
+            mock.patch.object(tuning, "ocr_image", side_effect=_fake_ocr_image),
+            mock.patch.object(core, "ocr_image_with_budget", side_effect=fake_ocr),
+        ):
+            core.extract_text_from_pdf(
+                self.pdf_path, preprocessing="auto", report=report
+            )
+
+        self.assertEqual(report.preprocessing_choice, "downscale")
+        self.assertEqual(used_chains, [PREPROCESSING_CHAINS["downscale"]] * 3)
+        self.assertIn("seconds", report.preprocessing_trials["default"])
+        self.assertGreater(report.tuning_seconds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+Unit tests for the watch-folder mode.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import shutil
+import sys
+import os
+from pathlib import Path
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ocr_pdf_reader import watcher
+from ocr_pdf_reader.watcher import DirectoryWatcher
+from tests.helpers import make_result
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+    """Tests for polling, processing and state."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.inbox = self.root / "inbox"
+        self.inbox.mkdir()
+        self.output = self.root / "output"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _watcher(self):
+        return DirectoryWatcher(str(self.inbox), str(self.output), settle_seconds=0)
+
+    def _drop(self, name, content=b"%PDF-1.4 test"):
+        path = self.inbox / name
+        path.write_bytes(content)
+        return path
+
+    def test_file_is_ready_after_two_stable_polls(self):
+        """Test that a file is only picked up once its size is stable."""
+        directory_watcher = self._watcher()
+        self._drop("doc.pdf")
+
+        self.assertEqual(directory_watcher.poll(), [])
+        self.assertEqual([path.name for path in directory_watcher.poll()], ["doc.pdf"])
+        directory_watcher.close()
+
+    def test_growing_file_is_not_ready(self):
+        """Test that a file still being written is skipped."""
+        directory_watcher = self._watcher()
+        path = self._drop("doc.pdf")
+        directory_watcher.poll()
+
+        with open(path, "ab") as f:
+            f.write(b" more data")
+
+        self.assertEqual(directory_watcher.poll(), [])
+        directory_watcher.close()
+
+    def test_processed_file_is_moved_and_recorded(self):
+        """Test output, move and state of a processed file."""
+        directory_watcher = self._watcher()
+        path = self._drop("doc.pdf")
+
+        with mock.patch.object(
+            watcher, "extract_results_from_pdf", return_value=make_result("FIRST ITEM")
+        ):
+            self.assertTrue(directory_watcher.process_file(path))
+        directory_watcher.close()
+
+        self.assertEqual(
+            (self.output / "doc.txt").read_text(encoding="utf-8"), "FIRST ITEM\n"
+        )
+        self.assertTrue((self.inbox / "processed" / "doc.pdf").exists())
+        self.assertEqual(
+            list(directory_watcher.state.values())[0]["status"], "processed"
+        )
+
+    def test_outputs_of_same_named_pdfs_are_kept(self):
+        """Test that a second PDF with the same name keeps the first outputs."""
+        directory_watcher = self._watcher()
+
+        for text in ("FIRST ITEM", "SECOND ITEM"):
+            path = self._drop("doc.pdf")
+            with mock.patch.object(
+                watcher, "extract_results_from_pdf", return_value=make_result(text)
+            ):
+                self.assertTrue(directory_watcher.process_file(path))
+        directory_watcher.close()
+
+        texts = sorted(
+            path.read_text(encoding="utf-8") for path in self.output.glob("*.txt")
+        )
+        self.assertEqual(texts, ["FIRST ITEM\n", "SECOND ITEM\n"])
+        self.assertEqual(len(list(self.output.glob("*.report.json"))), 2)
+        self.assertEqual(len(list((self.inbox / "processed").glob("*.pdf"))), 2)
+
+    def test_index_failure_is_recorded_in_state(self):
+        """Test that an indexing error after the move still saves the state."""
+        directory_watcher = DirectoryWatcher(
+            str(self.inbox),
+            str(self.output),
+            settle_seconds=0,
+            index_path=str(self.root / "index.db"),
+        )
+        path = self._drop("doc.pdf")
+
+        with (
+            mock.patch.object(
+                watcher,
+                "extract_results_from_pdf",
+                return_value=make_result("FIRST ITEM"),
+            ),
+            mock.patch.object(
+                watcher.SearchIndex,
+                "add_document",
+                side_effect=RuntimeError("disk full"),
+            ),
+        ):
+            self.assertTrue(directory_watcher.process_file(path))
+        directory_watcher.close()
+
+        entry = list(directory_watcher._load_state().values())[0]
+        self.assertEqual(entry["status"], "processed")
+        self.assertEqual(entry["index_error"], "disk full")
+
+    def test_failed_file_is_moved_to_failed_dir(self):
+        """Test that an extraction error moves the file to the failed directory."""
+        directory_watcher = self._watcher()
+        path = self._drop("broken.pdf")
+
+        with mock.patch.object(
+            watcher, "extract_results_from_pdf", side_effect=RuntimeError("bad")
+        ):
+            self.assertFalse(directory_watcher.process_file(path))
+        directory_watcher.close()
+
+        self.assertTrue((self.inbox / "failed" / "broken.pdf").exists())
+
+    def test_vanished_or_unmovable_file_is_recorded_as_failed(self):
+        """Test that a missing file or a failed move still records a failed entry."""
+        directory_watcher = self._watcher()
+        vanished = self._drop("vanished.pdf")
+        directory_watcher.poll()
+        vanished.unlink()
+        self.assertFalse(directory_watcher.process_file(vanished))
+
+        path = self._drop("stuck.pdf")
+        with (
+            mock.patch.object(
+                watcher,
+                "extract_results_from_pdf",
+                return_value=make_result("FIRST ITEM"),
+            ),
+            mock.patch.object(watcher.shutil, "move", side_effect=OSError("read-only")),
+        ):
+            self.assertFalse(directory_watcher.process_file(path))
+        directory_watcher.close()
+
+        entries = {
+            key.split(":")[0]: entry
+            for key, entry in directory_watcher._load_state().items()
+        }
+        self.assertEqual(entries["vanished.pdf"]["status"], "failed")
+        self.assertEqual(entries["stuck.pdf"]["status"], "failed")
+        self.assertEqual(entries["stuck.pdf"]["move_error"], "read-only")
+
+    def test_state_prevents_repeated_work_after_restart(self):
+        """Test that a restarted watcher skips files already in the state file."""
+        directory_watcher = self._watcher()
+        path = self._drop("doc.pdf")
+        backup = self.root / "doc.pdf"
+        shutil.copy2(path, backup)
+
+        with mock.patch.object(
+            watcher, "extract_results_from_pdf", return_value=make_result()
+        ):
+            directory_watcher.process_file(path)
+        directory_watcher.close()
+
+        # The same file dropped again after a restart
+        shutil.copy2(backup, self.inbox / "doc.pdf")
+        restarted = self._watcher()
+        restarted.poll()
+        self.assertEqual(restarted.poll(), [])
+        restarted.close()
+
+
+if __name__ == "__main__":
+    unittest.main()